@@ -0,0 +1,258 @@
+"""
+Serialization cost of read responses, from ORM objects to response bytes.
+
+Compares the former path (`Base.to_dict()`, `model_validate` on the dict,
+`model_dump()` then `json.dumps` by `JSONResponse`) against the current one
+(`loaded()` / `validate_all()` then `ModelResponse`), on detached objects so
+no database is needed:
+
+- a 100-user page with user info, roles and groups,
+- a 50-activity request pattern with its assignees.
+
+Run from the repository root, with the environment of the API:
+
+    python -m benchmarks.serialization [--rounds 15] [--number 300]
+"""
+
+import argparse
+import json
+import timeit
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import object_mapper
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.database.configuration import Base
+from src.database.models.access_control.enums import IdTypeEnum, RoleEnum
+from src.database.models.access_control.group import Group
+from src.database.models.access_control.role import UserRoles
+from src.database.models.access_control.user import User, UserInfo
+from src.database.models.workflow.activity import Activity, ActivityAssignees
+from src.database.models.workflow.enums import AssigneeEnum
+from src.database.models.workflow.request_pattern import RequestPattern
+from src.database.serialization import loaded, type_adapter, validate_all
+from src.service_gateway.api.v1.schemas.access_control.user_schemas import UserRead
+from src.service_gateway.api.v1.schemas.general.general_schemas import (
+    APIResponse,
+    PaginatedData,
+    Pagination,
+)
+from src.service_gateway.api.v1.schemas.workflow.activity_schemas import ActivityRead
+from src.service_gateway.api.v1.schemas.workflow.request_pattern_schemas import (
+    RequestPatternRead,
+)
+from src.utils.responses import ModelResponse
+
+NOW = datetime(2026, 10, 17, 9, 30)
+
+
+def to_dict(instance: Base, _processed: Optional[Set[int]] = None) -> Dict[str, Any]:
+    """`Base.to_dict()` as it was, with `exclude_unloaded`."""
+    if _processed is None:
+        _processed = set()
+
+    instance_id = id(instance)
+    if instance_id in _processed:
+        return {"$recursive": f"{instance.__class__.__name__}#{instance_id}"}
+
+    _processed.add(instance_id)
+
+    mapper = object_mapper(instance)
+    result = {col.name: getattr(instance, col.name) for col in mapper.columns}
+
+    for rel in mapper.relationships:
+        if rel.key in instance.__dict__:
+            value = getattr(instance, rel.key)
+
+            if value is None:
+                result[rel.key] = None
+            elif rel.uselist:
+                result[rel.key] = [to_dict(item, _processed) for item in value]
+            else:
+                result[rel.key] = to_dict(value, _processed)
+
+    return result
+
+
+def loaded_values(instance: Base, **values: Any) -> Base:
+    """Sets `values` as if loaded from the database, without any event."""
+    for key, value in values.items():
+        set_committed_value(instance, key, value)
+
+    return instance
+
+
+def users_page(size: int = 100) -> List[User]:
+    groups = [
+        loaded_values(
+            Group(name=f"Group {index}", parent_id=None), group_id=uuid.uuid4()
+        )
+        for index in range(5)
+    ]
+    users = []
+
+    for index in range(size):
+        user_id = uuid.uuid4()
+        user_info = loaded_values(
+            UserInfo(
+                user_id=user_id,
+                first_name=f"First {index}",
+                last_name=f"Last {index}",
+                id_type=IdTypeEnum.ID_CARD,
+                id_number=f"{index:010d}",
+                birth_date=datetime(1990, 1, 1),
+            ),
+            updated_at=NOW,
+        )
+        roles = [
+            UserRoles(user_id=user_id, role=RoleEnum.REQUESTER),
+        ]
+        users.append(
+            loaded_values(
+                User(email=f"user{index}@example.com", hashed_password="x"),
+                user_id=user_id,
+                is_active=True,
+                is_verified=True,
+                created_at=NOW,
+                user_info=user_info,
+                roles=roles,
+                groups=groups[: index % 3 + 1],
+            )
+        )
+
+    return users
+
+
+def request_pattern(length: int = 50) -> tuple:
+    activities = []
+
+    for index in range(length):
+        assignee = ActivityAssignees(
+            activity_id=index + 1,
+            assignee_type=AssigneeEnum.USER if index % 2 else AssigneeEnum.GROUP,
+            user_id=uuid.uuid4() if index % 2 else None,
+            group_id=None if index % 2 else uuid.uuid4(),
+        )
+        activities.append(
+            loaded_values(
+                Activity(
+                    label=f"Step {index}",
+                    description="",
+                    estimated_time=timedelta(hours=1),
+                    form_pattern_id=None,
+                    next_activity_id=index + 2 if index + 1 < length else None,
+                    request_pattern_id=None,
+                ),
+                activity_id=index + 1,
+                assignee=assignee,
+            )
+        )
+
+    pattern = loaded_values(
+        RequestPattern(
+            label="Purchase",
+            description="",
+            supervisor_id=None,
+            activity_id=1,
+            published_at=None,
+        ),
+        request_pattern_id=uuid.uuid4(),
+        is_active=True,
+        created_at=NOW,
+    )
+
+    return pattern, activities
+
+
+def users_before(users: List[User]) -> bytes:
+    items = [UserRead.model_validate(to_dict(user)) for user in users]
+    content = APIResponse[PaginatedData[UserRead]](
+        msg="Users retrieved successfully",
+        data=PaginatedData(items=items, pagination=Pagination(page=1, size=len(items))),
+        ok=True,
+    )
+    return JSONResponse(content=content.model_dump()).body
+
+
+def users_after(users: List[User]) -> bytes:
+    items = validate_all(UserRead, users)
+    content = APIResponse[PaginatedData[UserRead]](
+        msg="Users retrieved successfully",
+        data=PaginatedData(items=items, pagination=Pagination(page=1, size=len(items))),
+        ok=True,
+    )
+    return ModelResponse(content=content).body
+
+
+def request_pattern_before(
+    pattern: RequestPattern, activities: List[Activity]
+) -> bytes:
+    request_pattern_dict = to_dict(pattern)
+    request_pattern_dict["activities"] = [
+        ActivityRead.model_validate(dict(**to_dict(activity), activity_order=order))
+        for order, activity in enumerate(activities, start=1)
+    ]
+    content = APIResponse[RequestPatternRead](
+        msg="Request pattern retrieved successfully",
+        data=RequestPatternRead.model_validate(request_pattern_dict),
+        ok=True,
+    )
+    return JSONResponse(content=content.model_dump()).body
+
+
+def request_pattern_after(pattern: RequestPattern, activities: List[Activity]) -> bytes:
+    activities_read = type_adapter(List[ActivityRead]).validate_python(
+        [
+            loaded(activity, activity_order=order)
+            for order, activity in enumerate(activities, start=1)
+        ],
+        from_attributes=True,
+    )
+    content = APIResponse[RequestPatternRead](
+        msg="Request pattern retrieved successfully",
+        data=RequestPatternRead.model_validate(
+            loaded(pattern, activities=activities_read)
+        ),
+        ok=True,
+    )
+    return ModelResponse(content=content).body
+
+
+def best_ms(function: Callable[[], bytes], rounds: int, number: int) -> float:
+    return min(timeit.repeat(function, repeat=rounds, number=number)) / number * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--number", type=int, default=300)
+    args = parser.parse_args()
+
+    users = users_page()
+    pattern, activities = request_pattern()
+
+    cases = {
+        "100-user page": (
+            lambda: users_before(users),
+            lambda: users_after(users),
+        ),
+        "50-activity request pattern": (
+            lambda: request_pattern_before(pattern, activities),
+            lambda: request_pattern_after(pattern, activities),
+        ),
+    }
+
+    for name, (before, after) in cases.items():
+        assert json.loads(before()) == json.loads(after()), name
+
+        before_ms = best_ms(before, args.rounds, args.number)
+        after_ms = best_ms(after, args.rounds, args.number)
+
+        print(f"{name}: {before_ms:.2f} ms before, {after_ms:.2f} ms after")
+
+
+if __name__ == "__main__":
+    main()
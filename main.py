@@ -1,9 +1,30 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from decouple import config
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.responses import Response
 
 from src.service_gateway.api.v1.app import api_v1
+from src.service_gateway.api.v1.functions.email_dispatcher import (
+    EMAIL_DISPATCHER_ENABLED,
+    email_dispatcher,
+)
+from src.service_gateway.api.v1.functions.refresh_token_purge import (
+    refresh_token_purge,
+)
+from src.service_gateway.api.v1.functions.secure_code_partitions import (
+    secure_code_partitions,
+)
+from src.service_gateway.security.authentication import signing_keys
+from src.service_gateway.security.password_hasher import password_hasher
+from src.service_gateway.security.policy_engine import policy_engine
+from src.service_gateway.security.revocation import revoked_sessions
+from src.utils.etags import is_not_modified, not_modified_response
+from src.utils.template_loader import precompile_templates
+
+JWKS_MAX_AGE = config("JWKS_MAX_AGE", default=3600, cast=int)
 
 tags_metadata = [
     {
@@ -15,7 +36,34 @@ tags_metadata = [
     },
 ]
 
-app = FastAPI(openapi_tags=tags_metadata)
+
+# Mounted apps do not receive lifespan events, so process-wide resources used by
+# the API versions are managed here.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    precompile_templates()
+
+    if EMAIL_DISPATCHER_ENABLED:
+        email_dispatcher.start()
+
+    # Loads the policies right away and keeps them in sync afterwards.
+    policy_engine.start()
+    revoked_sessions.start()
+    # Creates the upcoming secure code partitions right away.
+    secure_code_partitions.start()
+    refresh_token_purge.start()
+
+    yield
+
+    await refresh_token_purge.stop()
+    await secure_code_partitions.stop()
+    await revoked_sessions.stop()
+    await policy_engine.stop()
+    await email_dispatcher.stop()
+    password_hasher.shutdown()
+
+
+app = FastAPI(openapi_tags=tags_metadata, lifespan=lifespan)
 app.title = "SigmaChain API"
 app.version = "0.0.3"
 
@@ -25,6 +73,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 # Mounting app versions
@@ -42,3 +91,21 @@ async def index():
         content={"message": "Welcome to SigmaChain API"},
         status_code=200,
     )
+
+
+@app.get("/.well-known/jwks.json", tags=["Index"])
+async def jwks(request: Request):
+    """
+    Public keys of the access tokens, so other services can verify them
+    locally. A key is published before it signs and kept after it stops, so
+    caching this for `JWKS_MAX_AGE` is safe.
+    """
+    headers = {
+        "ETag": signing_keys.jwks_etag,
+        "Cache-Control": f"public, max-age={JWKS_MAX_AGE}",
+    }
+
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
+    return JSONResponse(content=signing_keys.jwks, status_code=200, headers=headers)
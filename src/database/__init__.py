@@ -1,8 +1,12 @@
 # Load all the models in the database package to ensure they are registered in SQLAlchemy.
 from src.database.models.access_control.group import (  # type: ignore # noqa
     Group,
+    GroupClosure,
     UserGroups,
 )
+from src.database.models.access_control.refresh_token import (  # type: ignore # noqa
+    RefreshToken,
+)
 from src.database.models.access_control.role import (  # type: ignore # noqa
     Policy,
     UserRoles,
@@ -12,6 +16,7 @@ from src.database.models.access_control.user import (  # type: ignore # noqa
     User,
     UserInfo,
 )
+from src.database.models.messaging.email_outbox import EmailOutbox  # type: ignore # noqa
 from src.database.models.workflow.activity import (  # type: ignore # noqa
     Activity,
     ActivityAssignees,
@@ -23,4 +28,5 @@ from src.database.models.workflow.form_pattern import FormPattern  # type: ignor
 from src.database.models.workflow.request_pattern import (  # type: ignore # noqa
     RequestGroups,
     RequestPattern,
+    RequestPatternSnapshot,
 )
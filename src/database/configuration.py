@@ -1,11 +1,12 @@
-from typing import Any, AsyncGenerator, Dict, Optional, Set
+from typing import AsyncGenerator
 
 from decouple import UndefinedValueError, config
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass, object_mapper
+from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass
 
 # Ensure all models are imported
 import src.database.models  # noqa
+from src.database.pool_telemetry import InstrumentedAsyncAdaptedQueuePool
 
 try:
     user = config("DB_USER")
@@ -16,6 +17,19 @@ try:
 except UndefinedValueError as e:
     raise RuntimeError(f"Missing database configuration: {e}")
 
+# Pool sizing is per worker process: keep `workers * (pool_size + max_overflow)`
+# below the connection limit of the Postgres server.
+POOL_SIZE = config("DB_POOL_SIZE", default=5, cast=int)
+MAX_OVERFLOW = config("DB_MAX_OVERFLOW", default=10, cast=int)
+POOL_TIMEOUT = config("DB_POOL_TIMEOUT", default=30, cast=float)
+POOL_RECYCLE = config("DB_POOL_RECYCLE", default=1800, cast=int)
+POOL_PRE_PING = config("DB_POOL_PRE_PING", default=True, cast=bool)
+
+# asyncpg connection settings
+STATEMENT_CACHE_SIZE = config("DB_STATEMENT_CACHE_SIZE", default=100, cast=int)
+APPLICATION_NAME = str(config("DB_APPLICATION_NAME", default="sigmachain-server"))
+JIT = config("DB_JIT", default=False, cast=bool)
+
 async_engine = create_async_engine(
     "{engine}://{user}:{password}@{host}:{port}/{database}".format(
         engine="postgresql+asyncpg",
@@ -26,6 +40,19 @@ async_engine = create_async_engine(
         database=database,
     ),
     future=True,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=POOL_TIMEOUT,
+    pool_recycle=POOL_RECYCLE,
+    pool_pre_ping=POOL_PRE_PING,
+    connect_args={
+        "statement_cache_size": STATEMENT_CACHE_SIZE,
+        "server_settings": {
+            "application_name": APPLICATION_NAME,
+            "jit": "on" if JIT else "off",
+        },
+    },
 )
 
 async_session_factory = async_sessionmaker(
@@ -37,39 +64,7 @@ async_session_factory = async_sessionmaker(
 
 
 class Base(DeclarativeBase, MappedAsDataclass):
-    """Base class for all models, with recursive safe to_dict()."""
-
-    def to_dict(
-        self, exclude_unloaded: bool = True, _processed: Optional[Set[int]] = None
-    ) -> Dict[str, Any]:
-        if _processed is None:
-            _processed = set()
-
-        instance_id = id(self)
-        if instance_id in _processed:
-            return {"$recursive": f"{self.__class__.__name__}#{instance_id}"}
-
-        _processed.add(instance_id)
-
-        mapper = object_mapper(self)
-        result = {col.name: getattr(self, col.name) for col in mapper.columns}
-
-        for rel in mapper.relationships:
-            if rel.key in self.__dict__ or not exclude_unloaded:
-                value = getattr(self, rel.key)
-
-                if value is None:
-                    result[rel.key] = None
-                elif rel.uselist:
-                    result[rel.key] = [
-                        item.to_dict(exclude_unloaded, _processed) for item in value
-                    ]
-                else:
-                    result[rel.key] = (
-                        value.to_dict(exclude_unloaded, _processed) if value else None
-                    )
-
-        return result
+    """Base class for all models."""
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -3,10 +3,11 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import UUID, ForeignKey, String
+from sqlalchemy import UUID, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.configuration import Base
+from src.database.search import trigram_index
 
 if TYPE_CHECKING:
     from src.database.models.access_control.user import User
@@ -14,7 +15,11 @@ if TYPE_CHECKING:
 
 class UserGroups(Base):
     __tablename__ = "user_groups"
-    __table_args__ = {"schema": "access_control"}
+    __table_args__ = (
+        # Members of a group, the primary key only serves the groups of a user.
+        Index("ix_access_control_user_groups_group_id_user_id", "group_id", "user_id"),
+        {"schema": "access_control"},
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -45,7 +50,10 @@ class UserGroups(Base):
 
 class Group(Base):
     __tablename__ = "group"
-    __table_args__ = {"schema": "access_control"}
+    __table_args__ = (
+        trigram_index("ix_access_control_group_name_trgm", "name"),
+        {"schema": "access_control"},
+    )
 
     group_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -68,3 +76,36 @@ class Group(Base):
         overlaps="user",
         init=False,
     )
+
+
+class GroupClosure(Base):
+    """
+    Every (ancestor, descendant) pair of the group hierarchy, a group being its
+    own ancestor at depth 0. Subtrees, ancestor chains and depths are read with
+    a single indexed lookup instead of a recursive query. Kept in sync by
+    `GroupService` whenever a group is created or moved.
+    """
+
+    __tablename__ = "group_closure"
+    __table_args__ = (
+        Index(
+            "ix_access_control_group_closure_descendant_id_depth",
+            "descendant_id",
+            "depth",
+        ),
+        {"schema": "access_control"},
+    )
+
+    ancestor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("access_control.group.group_id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    descendant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("access_control.group.group_id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import UUID, DateTime, ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.database.configuration import Base
+
+
+class RefreshToken(Base):
+    """
+    Refresh tokens, stored as their SHA-256 digest. Every refresh rotates the
+    token within its session: presenting a rotated token again revokes the
+    whole session, as it means the token leaked.
+    """
+
+    __tablename__ = "refresh_token"
+    __table_args__ = (
+        Index("ix_access_control_refresh_token_session_id", "session_id"),
+        Index("ix_access_control_refresh_token_user_id", "user_id"),
+        Index("ix_access_control_refresh_token_expires_at", "expires_at"),
+        Index(
+            "ix_access_control_refresh_token_revoked_at",
+            "revoked_at",
+            postgresql_where=text("revoked_at IS NOT NULL"),
+        ),
+        {"schema": "access_control"},
+    )
+
+    refresh_token_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        init=False,
+    )
+    session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("access_control.user.user_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False,
+        init=False,
+    )
+    # Set when the token is exchanged for a new one.
+    used_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, default=None
+    )
+    # Set on every token of the session when the session is revoked.
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, default=None
+    )
@@ -1,15 +1,37 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import UUID, Boolean, DateTime, ForeignKey, String
+from sqlalchemy import UUID, Boolean, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database.configuration import Base
 
 
 class SecureCode(Base):
+    """
+    One-time codes, range-partitioned by `expires_at` into daily partitions
+    that `SecureCodePartitions` creates ahead of time and drops once expired.
+    Only unused codes are indexed, used and superseded ones are never looked up
+    again.
+    """
+
     __tablename__ = "secure_code"
-    __table_args__ = {"schema": "access_control"}
+    __table_args__ = (
+        Index(
+            "ix_access_control_secure_code_secure_code_id_unused",
+            "secure_code_id",
+            postgresql_where=text("NOT has_been_used"),
+        ),
+        Index(
+            "ix_access_control_secure_code_user_id_unused",
+            "user_id",
+            postgresql_where=text("NOT has_been_used"),
+        ),
+        {
+            "schema": "access_control",
+            "postgresql_partition_by": "RANGE (expires_at)",
+        },
+    )
 
     secure_code_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -27,8 +49,10 @@ class SecureCode(Base):
         String(6),
         nullable=False,
     )
+    # Part of the primary key, as the partition key must be.
     expires_at: Mapped[datetime] = mapped_column(
         DateTime,
+        primary_key=True,
         nullable=False,
     )
     has_been_used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
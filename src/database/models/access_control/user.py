@@ -4,12 +4,13 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import UUID, Boolean, DateTime, ForeignKey, String
+from sqlalchemy import UUID, Boolean, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from src.database.configuration import Base
 from src.database.models.access_control.enums import IdTypeEnum, IdTypeEnumSQLA
+from src.database.search import trigram_index
 
 if TYPE_CHECKING:
     from src.database.models.access_control.group import Group
@@ -18,7 +19,10 @@ if TYPE_CHECKING:
 
 class User(Base):
     __tablename__ = "user"
-    __table_args__ = {"schema": "access_control"}
+    __table_args__ = (
+        Index("ix_access_control_user_created_at_user_id", "created_at", "user_id"),
+        {"schema": "access_control"},
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -64,7 +68,11 @@ class User(Base):
 
 class UserInfo(Base):
     __tablename__ = "user_info"
-    __table_args__ = {"schema": "access_control"}
+    __table_args__ = (
+        trigram_index("ix_access_control_user_info_first_name_trgm", "first_name"),
+        trigram_index("ix_access_control_user_info_last_name_trgm", "last_name"),
+        {"schema": "access_control"},
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("access_control.user.user_id", ondelete="CASCADE"),
@@ -0,0 +1,76 @@
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import UUID, DateTime, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.database.configuration import Base
+from src.database.models.messaging.enums import EmailStatusEnum, EmailStatusEnumSQLA
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index(
+            "ix_messaging_email_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index(
+            "ix_messaging_email_outbox_finished",
+            "created_at",
+            postgresql_where=text("status <> 'pending'"),
+        ),
+        {"schema": "messaging"},
+    )
+
+    email_outbox_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        init=False,
+    )
+    to_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    subject: Mapped[str] = mapped_column(String, nullable=False)
+    template: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Cleared once the email is sent or given up on, it may hold secrets.
+    context: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    # Also the end of the lease of a claimed email, see `lease_id`.
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # The email is given up on rather than delivered after it.
+    expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        default=None,
+        nullable=True,
+    )
+    status: Mapped[EmailStatusEnum] = mapped_column(
+        EmailStatusEnumSQLA,
+        default=EmailStatusEnum.PENDING,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Set while a dispatcher is sending the email.
+    lease_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        default=None,
+        nullable=True,
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(
+        String,
+        default=None,
+        nullable=True,
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        default=None,
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False,
+        init=False,
+    )
@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+from sqlalchemy import Enum
+
+
+class EmailStatusEnum(StrEnum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+EmailStatusEnumSQLA = Enum(
+    EmailStatusEnum,
+    name="email_status_enum",
+    schema="messaging",
+    values_callable=lambda x: [e.value for e in x],
+)
@@ -2,7 +2,7 @@ import uuid
 from datetime import timedelta
 from typing import List, Optional
 
-from sqlalchemy import UUID, ForeignKey, Integer, Interval, String
+from sqlalchemy import UUID, ForeignKey, Index, Integer, Interval, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.configuration import Base
@@ -14,7 +14,14 @@ from src.database.models.workflow.form_pattern import FormPattern
 
 class Activity(Base):
     __tablename__ = "activity"
-    __table_args__ = {"schema": "workflow"}
+    __table_args__ = (
+        Index(
+            "ix_workflow_activity_request_pattern_id_position",
+            "request_pattern_id",
+            "position",
+        ),
+        {"schema": "workflow"},
+    )
 
     activity_id: Mapped[int] = mapped_column(
         Integer,
@@ -48,6 +55,23 @@ class Activity(Base):
         default=None,
         nullable=True,
     )
+    # Owner and position of the activity in its chain, kept alongside the
+    # `next_activity_id` links so a chain is read with a single index range scan.
+    request_pattern_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey(
+            "workflow.request_pattern.request_pattern_id",
+            name="fk_activity_request_pattern_id",
+            use_alter=True,
+        ),
+        default=None,
+        nullable=True,
+    )
+    position: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        default=None,
+        nullable=True,
+    )
 
     assignee: Mapped["ActivityAssignees"] = relationship(
         "ActivityAssignees",
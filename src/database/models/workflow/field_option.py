@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database.configuration import Base
@@ -8,7 +8,14 @@ from src.database.configuration import Base
 
 class FieldOption(Base):
     __tablename__ = "field_option"
-    __table_args__ = {"schema": "workflow"}
+    __table_args__ = (
+        UniqueConstraint(
+            "form_field_id",
+            "option_order",
+            name="uq_workflow_field_option_form_field_id_option_order",
+        ),
+        {"schema": "workflow"},
+    )
 
     field_option_id: Mapped[int] = mapped_column(
         Integer,
@@ -28,6 +35,4 @@ class FieldOption(Base):
     option_order: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
-        unique=True,
-        index=True,
     )
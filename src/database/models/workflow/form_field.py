@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.configuration import Base
@@ -12,7 +12,14 @@ from src.database.models.workflow.field_option import FieldOption
 
 class FormField(Base):
     __tablename__ = "form_field"
-    __table_args__ = {"schema": "workflow"}
+    __table_args__ = (
+        Index(
+            "ix_workflow_form_field_form_pattern_id_position",
+            "form_pattern_id",
+            "position",
+        ),
+        {"schema": "workflow"},
+    )
 
     form_field_id: Mapped[int] = mapped_column(
         Integer,
@@ -44,6 +51,23 @@ class FormField(Base):
         nullable=True,
         default=None,
     )
+    # Owner and position of the field in its chain, kept alongside the
+    # `next_field_id` links so a chain is read with a single index range scan.
+    form_pattern_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey(
+            "workflow.form_pattern.form_pattern_id",
+            name="fk_form_field_form_pattern_id",
+            use_alter=True,
+        ),
+        nullable=True,
+        default=None,
+    )
+    position: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        default=None,
+    )
 
     options: Mapped[list[FieldOption]] = relationship(
         "FieldOption",
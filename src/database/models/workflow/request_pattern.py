@@ -1,19 +1,24 @@
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import UUID, Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from src.database.configuration import Base
 from src.database.models.access_control.group import Group
 from src.database.models.access_control.user import User
+from src.database.search import trigram_index
 
 
 class RequestPattern(Base):
     __tablename__ = "request_pattern"
-    __table_args__ = {"schema": "workflow"}
+    __table_args__ = (
+        trigram_index("ix_workflow_request_pattern_label_trgm", "label"),
+        {"schema": "workflow"},
+    )
 
     request_pattern_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -100,3 +105,29 @@ class RequestGroups(Base):
         uselist=False,
         init=False,
     )
+
+
+class RequestPatternSnapshot(Base):
+    """
+    Frozen copy of a published request pattern, written once on publish, with
+    everything its read endpoints return already serialized.
+    """
+
+    __tablename__ = "request_pattern_snapshot"
+    __table_args__ = {"schema": "workflow"}
+
+    request_pattern_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("workflow.request_pattern.request_pattern_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Version of the document layout, snapshots written with another version are
+    # ignored and the pattern is read from its tables.
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    document: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False,
+        init=False,
+    )
@@ -0,0 +1,56 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection
+
+from src.utils.metrics import Histogram
+
+
+class PoolTelemetry:
+    """Process-wide counters for connection checkouts from the engine pool."""
+
+    def __init__(self) -> None:
+        self.wait_time_ms = Histogram()
+        self.checkouts = 0
+        self.timeouts = 0
+
+
+pool_telemetry = PoolTelemetry()
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` that records how long every checkout waits."""
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_telemetry.timeouts += 1
+            raise
+        finally:
+            pool_telemetry.wait_time_ms.observe((time.perf_counter() - start) * 1000)
+
+        pool_telemetry.checkouts += 1
+
+        return connection
+
+
+def get_pool_stats(pool: Pool) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {
+        "checkouts": pool_telemetry.checkouts,
+        "timeouts": pool_telemetry.timeouts,
+        "wait_time_ms": pool_telemetry.wait_time_ms.snapshot(),
+    }
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            pool_size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+
+    return stats
@@ -0,0 +1,32 @@
+from typing import Any
+
+from decouple import config
+from sqlalchemy import ColumnElement, Index, func
+
+# pg_trgm needs at least three characters to produce a trigram, shorter terms
+# can't use the GIN indexes and fall back to a sequential scan.
+SEARCH_MIN_TERM_LENGTH = config("SEARCH_MIN_TERM_LENGTH", default=3, cast=int)
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """GIN index serving `ILIKE '%term%'` and `similarity()` on `column`."""
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
+def contains(column: Any, term: str) -> ColumnElement[bool]:
+    return column.ilike(f"%{term}%")
+
+
+def similarity(*columns: Any, term: str) -> ColumnElement[float]:
+    """Best pg_trgm similarity between `term` and any of `columns`."""
+    scores = [func.similarity(column, term) for column in columns]
+
+    if len(scores) == 1:
+        return scores[0]
+
+    return func.greatest(*scores)
@@ -0,0 +1,67 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Type, TypeVar
+
+from pydantic import TypeAdapter
+
+from src.database.configuration import Base
+
+T = TypeVar("T")
+
+
+class LoadedAttributes:
+    """
+    Read-only view of an ORM instance to validate schemas `from_attributes`.
+
+    Only what is already loaded is visible: unloaded attributes raise
+    `AttributeError`, so pydantic falls back to the field default instead of
+    triggering a lazy load, which can't run under asyncio. `overrides` take
+    precedence over the instance attributes.
+    """
+
+    __slots__ = ("_instance", "_overrides")
+
+    def __init__(self, instance: Base, overrides: Dict[str, Any]) -> None:
+        self._instance = instance
+        self._overrides = overrides
+
+    def __getattr__(self, name: str) -> Any:
+        # pydantic probes for dunders on every `isinstance` check against a model.
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        if name in self._overrides:
+            return self._overrides[name]
+
+        instance = self._instance
+
+        try:
+            value = instance.__dict__[name]
+        except KeyError:
+            if name in instance.__mapper__.attrs:
+                raise AttributeError(name) from None
+
+            value = getattr(instance, name)
+
+        if isinstance(value, Base):
+            return LoadedAttributes(value, {})
+
+        if isinstance(value, list) and value and isinstance(value[0], Base):
+            return [LoadedAttributes(item, {}) for item in value]
+
+        return value
+
+
+def loaded(instance: Base, **overrides: Any) -> LoadedAttributes:
+    return LoadedAttributes(instance, overrides)
+
+
+@lru_cache(maxsize=None)
+def type_adapter(type_: Type[T]) -> TypeAdapter[T]:
+    return TypeAdapter(type_)
+
+
+def validate_all(type_: Type[T], instances: Iterable[Base]) -> List[T]:
+    """Validates every instance as `type_` in a single pass."""
+    return type_adapter(List[type_]).validate_python(  # type: ignore[valid-type]
+        [loaded(instance) for instance in instances], from_attributes=True
+    )
@@ -0,0 +1,55 @@
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import (
+    ColumnElement,
+    ScalarSelect,
+    Select,
+    Text,
+    cast,
+    func,
+    literal,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+
+class ResourceVersion(NamedTuple):
+    """Fingerprint of every row the representation of a resource is built from."""
+
+    digest: str
+    # The resource can't change anymore (e.g. a published pattern).
+    immutable: bool = False
+
+
+def row_version(model: Any) -> ColumnElement[str]:
+    """
+    `<table>:<primary key>:<xmin>` of the rows of `model`. Postgres stamps every
+    new version of a row with a new `xmin`, so the token changes on every write
+    to the row, whatever statement made it.
+    """
+    table = model.__table__
+    xmin = literal_column(f'"{table.schema}"."{table.name}".xmin')
+
+    return func.concat_ws(
+        ":", literal(table.name, Text), *table.primary_key.columns, cast(xmin, Text)
+    )
+
+
+def versions_digest(*selects: Select[Any]) -> ScalarSelect[Optional[str]]:
+    """
+    md5 of the `row_version` tokens returned by `selects`, an empty string when
+    none returns a row. Rows added or removed change the digest as well.
+    """
+    versions = (union_all(*selects) if len(selects) > 1 else selects[0]).subquery(
+        "versions"
+    )
+    token = versions.c[0]
+
+    return select(
+        func.coalesce(
+            func.md5(func.string_agg(token, aggregate_order_by(literal(","), token))),
+            "",
+        )
+    ).scalar_subquery()
@@ -5,6 +5,9 @@ from src.service_gateway.api.v1.middlewares.exception_handler import (
     custom_exception_handler,
 )
 from src.service_gateway.api.v1.middlewares.jwt_middleware import JWTMiddleware
+from src.service_gateway.api.v1.middlewares.rate_limit_middleware import (
+    RateLimitMiddleware,
+)
 from src.service_gateway.api.v1.routers.main_router import api_v1_router
 from src.service_gateway.api.v1.schemas.general.general_schemas import APIErrorResponse
 
@@ -26,7 +29,8 @@ async def custom_http_exception_handler(request: Request, exc: HTTPException):
 
 api_v1.add_exception_handler(Exception, custom_exception_handler)
 
-# Adding Middlewares
+# Adding Middlewares (the last one added runs first)
+api_v1.add_middleware(RateLimitMiddleware)
 api_v1.add_middleware(JWTMiddleware)
 
 
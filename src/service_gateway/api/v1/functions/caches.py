@@ -0,0 +1,40 @@
+from decouple import config
+
+from src.utils.cache import Cache, get_cache_backend
+
+CACHE_GROUPS_TREE_TTL = config("CACHE_GROUPS_TREE_TTL", default=60, cast=float)
+CACHE_GROUPS_TREE_STALE_TTL = config(
+    "CACHE_GROUPS_TREE_STALE_TTL", default=600, cast=float
+)
+CACHE_USER_ROLES_TTL = config("CACHE_USER_ROLES_TTL", default=30, cast=float)
+CACHE_USER_ROLES_STALE_TTL = config(
+    "CACHE_USER_ROLES_STALE_TTL", default=30, cast=float
+)
+
+cache_backend = get_cache_backend()
+
+# Whole group tree, as returned by `GroupService.get_groups` without filters.
+groups_tree_cache = Cache(
+    cache_backend,
+    namespace="groups-tree",
+    ttl=CACHE_GROUPS_TREE_TTL,
+    stale_ttl=CACHE_GROUPS_TREE_STALE_TTL,
+)
+
+# Roles by user id. They are only written on signup, for an id nothing can
+# have cached yet: whatever changes the roles of an existing user has to
+# invalidate its entry once committed.
+user_roles_cache = Cache(
+    cache_backend,
+    namespace="user-roles",
+    ttl=CACHE_USER_ROLES_TTL,
+    stale_ttl=CACHE_USER_ROLES_STALE_TTL,
+)
+
+
+def groups_tree_key(include_users: bool) -> str:
+    return "users" if include_users else "groups"
+
+
+async def invalidate_groups_tree() -> None:
+    await groups_tree_cache.invalidate(groups_tree_key(True), groups_tree_key(False))
@@ -0,0 +1,279 @@
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from decouple import config
+from sqlalchemy import delete, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.future import select
+
+from src.database.configuration import async_session_factory
+from src.database.models.messaging.email_outbox import EmailOutbox
+from src.database.models.messaging.enums import EmailStatusEnum
+from src.utils.email_sender import EmailMessage, EmailTransport, get_email_transport
+from src.utils.metrics import Histogram
+from src.utils.periodic_task import PeriodicTask
+from src.utils.template_loader import render_template_async
+
+logger = logging.getLogger(__name__)
+
+EMAIL_DISPATCHER_ENABLED = config("EMAIL_DISPATCHER_ENABLED", default=True, cast=bool)
+EMAIL_OUTBOX_BATCH_SIZE = config("EMAIL_OUTBOX_BATCH_SIZE", default=50, cast=int)
+EMAIL_OUTBOX_POLL_INTERVAL = config(
+    "EMAIL_OUTBOX_POLL_INTERVAL", default=2.0, cast=float
+)
+EMAIL_OUTBOX_MAX_ATTEMPTS = config("EMAIL_OUTBOX_MAX_ATTEMPTS", default=5, cast=int)
+EMAIL_OUTBOX_RETRY_BASE_DELAY = config(
+    "EMAIL_OUTBOX_RETRY_BASE_DELAY", default=5.0, cast=float
+)
+EMAIL_OUTBOX_RETRY_MAX_DELAY = config(
+    "EMAIL_OUTBOX_RETRY_MAX_DELAY", default=600.0, cast=float
+)
+# Seconds a claimed email is left to its dispatcher, longer than a send takes.
+EMAIL_OUTBOX_LEASE_DURATION = config(
+    "EMAIL_OUTBOX_LEASE_DURATION", default=60.0, cast=float
+)
+EMAIL_OUTBOX_RETENTION_DAYS = config("EMAIL_OUTBOX_RETENTION_DAYS", default=7, cast=int)
+EMAIL_OUTBOX_PURGE_INTERVAL = config(
+    "EMAIL_OUTBOX_PURGE_INTERVAL", default=3600.0, cast=float
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class EmailDispatcher(PeriodicTask):
+    """
+    Background task that drains `messaging.email_outbox` in batches.
+
+    Rows are leased with `FOR UPDATE SKIP LOCKED`, so several workers can run a
+    dispatcher against the same table without sending an email twice. Failed
+    deliveries are retried with exponential backoff up to `max_attempts`, or
+    until the email expires. Finished rows are purged after `retention`.
+    """
+
+    failure_message = "Failed to dispatch the email outbox batch"
+
+    def __init__(
+        self,
+        transport: EmailTransport,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = EMAIL_OUTBOX_BATCH_SIZE,
+        poll_interval: float = EMAIL_OUTBOX_POLL_INTERVAL,
+        max_attempts: int = EMAIL_OUTBOX_MAX_ATTEMPTS,
+        retry_base_delay: float = EMAIL_OUTBOX_RETRY_BASE_DELAY,
+        retry_max_delay: float = EMAIL_OUTBOX_RETRY_MAX_DELAY,
+        lease_duration: float = EMAIL_OUTBOX_LEASE_DURATION,
+        retention_days: int = EMAIL_OUTBOX_RETENTION_DAYS,
+        purge_interval: float = EMAIL_OUTBOX_PURGE_INTERVAL,
+    ) -> None:
+        super().__init__(poll_interval)
+
+        self.transport = transport
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.lease_duration = timedelta(seconds=lease_duration)
+        self.retention = timedelta(days=retention_days)
+        self.purge_interval = purge_interval
+
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.batch_time_ms = Histogram()
+
+        self._purge_at = 0.0
+
+    ## Friendly methods
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        delay = self.retry_base_delay * 2 ** (attempts - 1)
+        return timedelta(seconds=min(delay, self.retry_max_delay))
+
+    def _finish(self, email: EmailOutbox, status: EmailStatusEnum) -> None:
+        # The context may hold a secure code, it is not kept past delivery.
+        email.status = status
+        email.context = {}
+        email.lease_id = None
+
+    def _give_up(self, email: EmailOutbox, error: str) -> None:
+        email.last_error = error
+        self._finish(email, EmailStatusEnum.FAILED)
+        self.failed += 1
+
+    def _register_failure(self, email: EmailOutbox, error: str, now: datetime) -> None:
+        next_attempt_at = now + self._retry_delay(email.attempts)
+
+        if email.attempts >= self.max_attempts:
+            self._give_up(email, error)
+        elif email.expires_at is not None and next_attempt_at >= email.expires_at:
+            self._give_up(email, f"Expired before delivery, last error: {error}")
+        else:
+            email.last_error = error
+            email.lease_id = None
+            email.next_attempt_at = next_attempt_at
+            self.retried += 1
+
+    async def _claim_batch(self, lease_id: UUID) -> List[EmailOutbox]:
+        """
+        Leases the due emails to `lease_id` in a short transaction, other
+        dispatchers skip them until the lease ends. Expired emails are given up
+        on instead. Returns every email of the batch, detached.
+        """
+        # Not expired on commit, the emails are read after it.
+        async with self.session_factory(expire_on_commit=False) as db:
+            now = _utcnow()
+
+            result = await db.execute(
+                select(EmailOutbox)
+                .where(
+                    EmailOutbox.status == EmailStatusEnum.PENDING,
+                    EmailOutbox.next_attempt_at <= now,
+                )
+                .order_by(EmailOutbox.next_attempt_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            emails = result.scalars().all()
+
+            for email in emails:
+                if email.expires_at is not None and email.expires_at <= now:
+                    self._give_up(email, "Expired before delivery")
+                else:
+                    email.lease_id = lease_id
+                    email.next_attempt_at = now + self.lease_duration
+
+            await db.commit()
+
+            return list(emails)
+
+    async def _record_results(
+        self, lease_id: UUID, errors: Dict[UUID, Optional[str]]
+    ) -> None:
+        """
+        Records the outcome of the emails still leased to `lease_id`, those
+        cancelled or leased again in the meantime are left alone.
+        """
+        async with self.session_factory() as db:
+            now = _utcnow()
+
+            result = await db.execute(
+                select(EmailOutbox)
+                .where(
+                    EmailOutbox.email_outbox_id.in_(errors),
+                    EmailOutbox.lease_id == lease_id,
+                )
+                .with_for_update()
+            )
+
+            for email in result.scalars():
+                error = errors[email.email_outbox_id]
+                email.attempts += 1
+
+                if error is None:
+                    email.sent_at = now
+                    self._finish(email, EmailStatusEnum.SENT)
+                    self.sent += 1
+                else:
+                    self._register_failure(email, error, now)
+
+            await db.commit()
+
+    async def _run_once(self) -> bool:
+        if time.monotonic() >= self._purge_at:
+            self._purge_at = time.monotonic() + self.purge_interval
+
+            try:
+                await self.purge()
+            except Exception:
+                logger.exception("Failed to purge the email outbox")
+
+        # A full batch means there may be more pending emails, keep draining.
+        return await self.dispatch_batch() >= self.batch_size
+
+    ## Public methods
+
+    async def dispatch_batch(self) -> int:
+        """
+        Sends a batch of due emails. No transaction is held while the transport
+        sends, the emails are leased instead: if the dispatcher dies before
+        recording the outcome, they are sent again once the lease ends.
+        """
+        lease_id = uuid4()
+        emails = await self._claim_batch(lease_id)
+        leased = [email for email in emails if email.lease_id == lease_id]
+
+        if not leased:
+            return len(emails)
+
+        started_at = time.perf_counter()
+
+        errors: Dict[UUID, Optional[str]] = {}
+        deliverable: List[EmailOutbox] = []
+        messages: List[EmailMessage] = []
+
+        for email in leased:
+            try:
+                html = await render_template_async(email.template, **email.context)
+            except Exception as e:
+                errors[email.email_outbox_id] = f"Template error: {e}"
+                continue
+
+            deliverable.append(email)
+            messages.append(
+                EmailMessage(to=email.to_email, subject=email.subject, html=html)
+            )
+
+        if messages:
+            for email, error in zip(deliverable, await self.transport.send(messages)):
+                errors[email.email_outbox_id] = error
+
+        await self._record_results(lease_id, errors)
+
+        self.batch_time_ms.observe((time.perf_counter() - started_at) * 1000)
+
+        return len(emails)
+
+    async def purge(self) -> int:
+        """Deletes the emails sent or given up on more than `retention` ago."""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                delete(EmailOutbox).where(
+                    EmailOutbox.status != EmailStatusEnum.PENDING,
+                    EmailOutbox.created_at < _utcnow() - self.retention,
+                )
+            )
+            await db.commit()
+
+        return result.rowcount
+
+    def notify(self) -> None:
+        """Wakes the dispatcher up before the next poll, e.g. after an enqueue."""
+        self.wake_up()
+
+    async def stats(self, db: AsyncSession) -> Dict[str, Any]:
+        result = await db.execute(
+            select(func.count())
+            .select_from(EmailOutbox)
+            .where(EmailOutbox.status == EmailStatusEnum.PENDING)
+        )
+
+        return {
+            "running": self.is_running,
+            "pending": result.scalar_one(),
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "batch_time_ms": self.batch_time_ms.snapshot(),
+        }
+
+
+email_dispatcher = EmailDispatcher(
+    transport=get_email_transport(),
+    session_factory=async_session_factory,
+)
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+from decouple import config
+from sqlalchemy import delete, or_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.configuration import async_session_factory
+from src.database.models.access_control.refresh_token import RefreshToken
+from src.utils.periodic_task import PeriodicTask
+
+REFRESH_TOKEN_RETENTION_DAYS = config(
+    "REFRESH_TOKEN_RETENTION_DAYS", default=7, cast=int
+)
+REFRESH_TOKEN_PURGE_INTERVAL = config(
+    "REFRESH_TOKEN_PURGE_INTERVAL", default=3600.0, cast=float
+)
+
+
+class RefreshTokenPurge(PeriodicTask):
+    """
+    Background task that deletes the refresh tokens nothing can use anymore:
+    those expired or revoked more than `retention_days` ago.
+
+    A used token is kept until it expires, as presenting it again is how a
+    leaked token is detected, and a revoked one for longer than the access
+    tokens of its session so `RevokedSessions` still finds it on its sync.
+    """
+
+    failure_message = "Failed to purge the refresh tokens"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        retention_days: int = REFRESH_TOKEN_RETENTION_DAYS,
+        interval: float = REFRESH_TOKEN_PURGE_INTERVAL,
+    ) -> None:
+        super().__init__(interval)
+
+        self.session_factory = session_factory
+        self.retention_days = retention_days
+
+    ## Friendly methods
+
+    async def _run_once(self) -> None:
+        await self.purge()
+
+    ## Public methods
+
+    async def purge(self) -> int:
+        """Deletes the tokens past their retention, returns how many."""
+        purge_before = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            days=self.retention_days
+        )
+
+        async with self.session_factory() as db:
+            result = await db.execute(
+                delete(RefreshToken).where(
+                    or_(
+                        RefreshToken.expires_at < purge_before,
+                        RefreshToken.revoked_at < purge_before,
+                    )
+                )
+            )
+            await db.commit()
+
+        return result.rowcount
+
+
+refresh_token_purge = RefreshTokenPurge(session_factory=async_session_factory)
@@ -0,0 +1,229 @@
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional, Union
+
+from decouple import config
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from src.database.configuration import async_session_factory
+from src.utils.periodic_task import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+SECURE_CODE_PARTITIONS_AHEAD = config(
+    "SECURE_CODE_PARTITIONS_AHEAD", default=7, cast=int
+)
+SECURE_CODE_RETENTION_DAYS = config("SECURE_CODE_RETENTION_DAYS", default=1, cast=int)
+SECURE_CODE_MAINTENANCE_INTERVAL = config(
+    "SECURE_CODE_MAINTENANCE_INTERVAL", default=3600.0, cast=float
+)
+SECURE_CODE_MIN_DAYS_AHEAD = config("SECURE_CODE_MIN_DAYS_AHEAD", default=2, cast=int)
+
+SCHEMA = "access_control"
+TABLE = "secure_code"
+PARTITION_PREFIX = f"{TABLE}_p"
+# Only one worker maintains the partitions at a time.
+MAINTENANCE_LOCK = "access_control.secure_code.partitions"
+
+
+def partition_name(day: date) -> str:
+    return f"{PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def partition_day(name: str) -> Optional[date]:
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+
+    try:
+        return datetime.strptime(name[len(PARTITION_PREFIX) :], "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+class SecureCodePartitions(PeriodicTask):
+    """
+    Background task that keeps the daily partitions of
+    `access_control.secure_code`: creates them `days_ahead` days in advance and
+    drops whole partitions once their codes expired more than `retention_days`
+    ago, so expired codes never need a DELETE nor a vacuum.
+
+    There is no default partition, as it would forbid detaching partitions
+    concurrently: codes expiring past the last partition cannot be stored, so
+    an error is logged once fewer than `min_days_ahead` days are covered.
+    """
+
+    failure_message = "Failed to check the secure code partitions"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        days_ahead: int = SECURE_CODE_PARTITIONS_AHEAD,
+        retention_days: int = SECURE_CODE_RETENTION_DAYS,
+        interval: float = SECURE_CODE_MAINTENANCE_INTERVAL,
+        min_days_ahead: int = SECURE_CODE_MIN_DAYS_AHEAD,
+    ) -> None:
+        super().__init__(interval)
+
+        self.session_factory = session_factory
+        self.days_ahead = days_ahead
+        self.retention_days = retention_days
+        self.min_days_ahead = min_days_ahead
+
+    ## Friendly methods
+
+    async def _get_partitions(
+        self, db: Union[AsyncSession, AsyncConnection]
+    ) -> Dict[str, Optional[bool]]:
+        """
+        Partition tables by name, with whether they are being detached, `None`
+        once detached but not dropped yet.
+        """
+        result = await db.execute(
+            text("""
+                SELECT child.relname, pg_inherits.inhdetachpending
+                FROM pg_class AS child
+                JOIN pg_namespace ON pg_namespace.oid = child.relnamespace
+                LEFT JOIN pg_inherits ON pg_inherits.inhrelid = child.oid
+                LEFT JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+                WHERE pg_namespace.nspname = :schema
+                    AND child.relkind = 'r'
+                    AND (parent.relname IS NULL OR parent.relname = :table)
+                """),
+            {"schema": SCHEMA, "table": TABLE},
+        )
+
+        return {
+            name: detach_pending
+            for name, detach_pending in result.all()
+            if partition_day(name) is not None
+        }
+
+    async def _check_coverage(self) -> None:
+        today = datetime.now(timezone.utc).date()
+        last_day = await self.covered_until(today)
+
+        if last_day is None:
+            logger.error(
+                "No secure code partition for %s, codes cannot be stored", today
+            )
+        elif (last_day - today).days < self.min_days_ahead:
+            logger.error(
+                "Secure code partitions only reach %s, codes expiring later "
+                "cannot be stored",
+                last_day,
+            )
+
+    async def _maintain(self, conn: AsyncConnection, today: date) -> None:
+        partitions = await self._get_partitions(conn)
+
+        for offset in range(self.days_ahead + 1):
+            day = today + timedelta(days=offset)
+            name = partition_name(day)
+
+            if name in partitions:
+                continue
+
+            # Identifiers and bounds come from dates, not from input.
+            await conn.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {SCHEMA}.{name} "
+                    f"PARTITION OF {SCHEMA}.{TABLE} "
+                    f"FOR VALUES FROM ('{day.isoformat()}') "
+                    f"TO ('{(day + timedelta(days=1)).isoformat()}')"
+                )
+            )
+
+        # The partition of a day holds codes expiring before the next one.
+        drop_before = today - timedelta(days=self.retention_days)
+
+        for name, detach_pending in partitions.items():
+            day = partition_day(name)
+
+            if day is None or day >= drop_before:
+                continue
+
+            # Detaching concurrently only waits for the queries using the
+            # partition instead of locking the whole table, an interrupted
+            # detach is left pending and finalized on the next run.
+            if detach_pending is not None:
+                mode = "FINALIZE" if detach_pending else "CONCURRENTLY"
+
+                await conn.execute(
+                    text(
+                        f"ALTER TABLE {SCHEMA}.{TABLE} "
+                        f"DETACH PARTITION {SCHEMA}.{name} {mode}"
+                    )
+                )
+
+            await conn.execute(text(f"DROP TABLE IF EXISTS {SCHEMA}.{name}"))
+
+    async def _run_once(self) -> None:
+        try:
+            await self.maintain()
+        except Exception:
+            logger.exception("Failed to maintain the secure code partitions")
+
+        # Checked by every worker, whoever maintained the partitions.
+        await self._check_coverage()
+
+    ## Public methods
+
+    async def maintain(self, today: Optional[date] = None) -> bool:
+        """
+        Creates the missing partitions and drops the expired ones. Returns
+        `False` when another worker is already doing it.
+        """
+        today = today or datetime.now(timezone.utc).date()
+
+        async with self.session_factory() as db:
+            # DETACH PARTITION CONCURRENTLY cannot run in a transaction block,
+            # so every statement commits on its own and the lock is held by
+            # the connection instead.
+            conn = await db.connection(
+                execution_options={"isolation_level": "AUTOCOMMIT"}
+            )
+            result = await conn.execute(
+                text("SELECT pg_try_advisory_lock(hashtext(:lock))"),
+                {"lock": MAINTENANCE_LOCK},
+            )
+
+            if not result.scalar_one():
+                return False
+
+            try:
+                await self._maintain(conn, today)
+            finally:
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(hashtext(:lock))"),
+                    {"lock": MAINTENANCE_LOCK},
+                )
+
+        return True
+
+    async def covered_until(self, today: Optional[date] = None) -> Optional[date]:
+        """
+        Last day of the partitions following each other from `today`, `None`
+        when there is none for `today`.
+        """
+        today = today or datetime.now(timezone.utc).date()
+
+        async with self.session_factory() as db:
+            partitions = await self._get_partitions(db)
+
+        attached = {
+            partition_day(name)
+            for name, detach_pending in partitions.items()
+            if detach_pending is False
+        }
+        last_day = None
+        day = today
+
+        while day in attached:
+            last_day = day
+            day += timedelta(days=1)
+
+        return last_day
+
+
+secure_code_partitions = SecureCodePartitions(session_factory=async_session_factory)
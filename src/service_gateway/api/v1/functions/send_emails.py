@@ -1,10 +1,12 @@
-from pathlib import Path
+from datetime import datetime, timezone
 from uuid import UUID
 
 from decouple import config
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.utils.email_sender import send_html_email
-from src.utils.template_loader import load_html_template
+from src.database.models.messaging.email_outbox import EmailOutbox
+from src.database.models.messaging.enums import EmailStatusEnum
 
 VALIDATION_CODE_URL: str = (
     str(
@@ -16,22 +18,46 @@ VALIDATION_CODE_URL: str = (
     + "/{code_id}"
 )
 
+SECURE_CODE_TEMPLATE = "secure_code_email.html"
 
-def send_secure_code_email(email: str, code: str, code_id: UUID) -> bool:
-    template_path = Path("templates/secure_code_email.html")
 
-    html = load_html_template(
-        str(template_path),
-        secure_code=code,
-        link=VALIDATION_CODE_URL.format(code_id=str(code_id)),
-    )
-
-    email_sent = send_html_email(
-        to=email,
+def enqueue_secure_code_email(
+    db: AsyncSession, email: str, code: str, code_id: UUID, expires_at: datetime
+) -> EmailOutbox:
+    """
+    Adds the secure code email to the outbox of the current transaction, it is
+    delivered by the `EmailDispatcher` once the transaction commits, unless the
+    code expires first.
+    """
+    email_outbox = EmailOutbox(
+        to_email=email,
         subject="Secure code for SigmaChain",
-        html=html,
+        template=SECURE_CODE_TEMPLATE,
+        context={
+            "secure_code": code,
+            "link": VALIDATION_CODE_URL.format(code_id=str(code_id)),
+        },
+        next_attempt_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        expires_at=expires_at,
     )
+    db.add(email_outbox)
+
+    return email_outbox
+
 
-    return email_sent
-    return email_sent
-    return email_sent
+async def cancel_secure_code_emails(db: AsyncSession, email: str) -> None:
+    """Gives up on the undelivered secure code emails to `email`, e.g. superseded."""
+    await db.execute(
+        update(EmailOutbox)
+        .where(
+            EmailOutbox.to_email == email,
+            EmailOutbox.template == SECURE_CODE_TEMPLATE,
+            EmailOutbox.status == EmailStatusEnum.PENDING,
+        )
+        .values(
+            status=EmailStatusEnum.FAILED,
+            last_error="Superseded by a newer secure code",
+            context={},
+            lease_id=None,
+        )
+    )
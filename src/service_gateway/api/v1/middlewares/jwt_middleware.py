@@ -1,13 +1,15 @@
-from uuid import UUID
+from typing import Optional
 
-from fastapi import Request
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.service_gateway.api.v1.routers.auth_router import auth_router_open
 from src.service_gateway.api.v1.schemas.general.general_schemas import APIErrorResponse
 from src.service_gateway.security.authentication import decode_access_token
+from src.service_gateway.security.principal import Principal, principal_from_payload
+from src.service_gateway.security.revocation import revoked_sessions
+from src.service_gateway.security.token_cache import VerifiedTokenCache
 
 API_ROOT = "/api/v1"
 PUBLIC_ROUTES = [
@@ -23,45 +25,81 @@ auth_open_routes = [
     if isinstance(route, APIRoute)
 ]
 
-api_public_routes = [f"{API_ROOT}{route}" for route in PUBLIC_ROUTES]
-api_public_routes.extend(auth_open_routes)
+api_public_routes = {f"{API_ROOT}{route}" for route in PUBLIC_ROUTES}
+api_public_routes.update(auth_open_routes)
 
+verified_token_cache: VerifiedTokenCache[Principal] = VerifiedTokenCache()
 
-class JWTMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in api_public_routes:
-            return await call_next(request)
 
-        authorization: str = str(request.headers.get("Authorization"))
-        if not authorization or not authorization.startswith("Bearer "):
-            return JSONResponse(
-                status_code=401,
-                content=APIErrorResponse(
-                    detail="Token missing or invalid."
-                ).model_dump(),
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+def _get_bearer_token(scope: Scope) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            return token if scheme == "Bearer" and token else None
 
-        token = authorization.split(" ")[1]
+    return None
 
-        decode_result = decode_access_token(token)
 
-        if not decode_result.data:
-            return JSONResponse(
-                status_code=401,
-                content=APIErrorResponse(detail=decode_result.msg).model_dump(),
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+class JWTMiddleware:
+    """
+    Pure ASGI authentication layer: verifies the bearer token once per request,
+    reusing `verified_token_cache` for tokens seen before, rejects tokens of
+    revoked sessions and stores the resulting `Principal` in the request state.
+    """
 
-        payload = decode_result.data
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        try:
-            setattr(request.state, "user_id", UUID(payload["sub"]))
-        except ValueError:
-            return JSONResponse(
-                status_code=401,
-                content=APIErrorResponse(detail="Invalid token.").model_dump(),
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in api_public_routes:
+            await self.app(scope, receive, send)
+            return
 
-        return await call_next(request)
+        token = _get_bearer_token(scope)
+
+        if token is None:
+            await self._unauthorized(scope, receive, send, "Token missing or invalid.")
+            return
+
+        principal = verified_token_cache.get(token)
+
+        if principal is None:
+            decode_result = decode_access_token(token)
+
+            if not decode_result.data:
+                await self._unauthorized(scope, receive, send, decode_result.msg)
+                return
+
+            principal = principal_from_payload(decode_result.data)
+
+            if principal is None:
+                await self._unauthorized(scope, receive, send, "Invalid token.")
+                return
+
+            expires_at = decode_result.data.get("exp")
+
+            if expires_at is not None:
+                verified_token_cache.set(token, principal, expires_at=float(expires_at))
+
+        # Checked on cached tokens as well, a session can be revoked at any time.
+        if (
+            principal.session_id is not None
+            and principal.session_id in revoked_sessions
+        ):
+            await self._unauthorized(scope, receive, send, "Token revoked.")
+            return
+
+        scope.setdefault("state", {})["principal"] = principal
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _unauthorized(
+        scope: Scope, receive: Receive, send: Send, detail: str
+    ) -> None:
+        response = JSONResponse(
+            status_code=401,
+            content=APIErrorResponse(detail=detail).model_dump(),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,69 @@
+from typing import Dict
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.service_gateway.api.v1.schemas.general.general_schemas import APIErrorResponse
+from src.service_gateway.security.rate_limiter import (
+    REFRESH_LIMIT,
+    SECURE_CODE_VALIDATE_LIMIT,
+    SIGNIN_LIMIT,
+    SIGNUP_LIMIT,
+    WRITES_LIMIT,
+    client_ip,
+    rate_limiter,
+)
+from src.utils.http_exceptions import TooManyRequestsError
+from src.utils.rate_limit import RateLimit
+
+API_ROOT = "/api/v1"
+# Limited per client IP.
+ROUTE_LIMITS: Dict[str, RateLimit] = {
+    f"{API_ROOT}/auth/signup": SIGNUP_LIMIT,
+    f"{API_ROOT}/auth/signin": SIGNIN_LIMIT,
+    f"{API_ROOT}/auth/secure-code/validate": SECURE_CODE_VALIDATE_LIMIT,
+    f"{API_ROOT}/auth/refresh": REFRESH_LIMIT,
+}
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI rate limiting, applied before the request body is even read:
+    the routes of `ROUTE_LIMITS` by client IP and the other writes by the
+    authenticated user. Has to run inside `JWTMiddleware` to see the user.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        limit = ROUTE_LIMITS.get(path)
+        retry_after = 0.0
+
+        if limit is not None:
+            retry_after = await rate_limiter.retry_after(path, client_ip(scope), limit)
+        elif scope["method"] in WRITE_METHODS:
+            principal = scope.get("state", {}).get("principal")
+
+            if principal is not None:
+                retry_after = await rate_limiter.retry_after(
+                    "writes", str(principal.user_id), WRITES_LIMIT
+                )
+
+        if retry_after > 0:
+            error = TooManyRequestsError(retry_after)
+            response = JSONResponse(
+                status_code=error.status_code,
+                content=APIErrorResponse(detail=error.detail).model_dump(),
+                headers=error.headers,
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
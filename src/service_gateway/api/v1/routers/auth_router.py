@@ -1,13 +1,12 @@
+from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
-from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.configuration import get_db
-from src.service_gateway.api.v1.functions.send_emails import send_secure_code_email
 from src.service_gateway.api.v1.schemas.access_control.auth_schemas import (
+    RefreshTokenInput,
     SecureCodeRead,
     SecureCodeValidate,
     SigninInput,
@@ -20,18 +19,51 @@ from src.service_gateway.api.v1.schemas.access_control.user_schemas import (
     UserRead,
 )
 from src.service_gateway.api.v1.schemas.general.general_schemas import APIResponse
+from src.service_gateway.api.v1.services.refresh_token_service import (
+    RefreshTokenService,
+)
 from src.service_gateway.api.v1.services.user_service import UserService
 from src.service_gateway.security.authentication import (
+    EXPIRATION_TIME_IN_MINUTES,
     create_access_token,
     validate_password,
     validate_password_match,
 )
-from src.utils.http_exceptions import BadRequestError, InternalServerError
-
-security = HTTPBearer()
+from src.service_gateway.security.principal import Principal, get_principal
+from src.service_gateway.security.rate_limiter import (
+    SECURE_CODE_ATTEMPTS_LIMIT,
+    SIGNIN_EMAIL_LIMIT,
+    SIGNUP_EMAIL_LIMIT,
+    email_key,
+    rate_limiter,
+)
+from src.utils.etags import cache_headers, is_not_modified, not_modified_response
+from src.utils.http_exceptions import BadRequestError
+from src.utils.responses import ModelResponse
 
 auth_router_open = APIRouter(prefix="/auth", tags=["Auth"])
-auth_router = APIRouter(prefix="/auth", tags=["Auth"], dependencies=[Depends(security)])
+auth_router = APIRouter(
+    prefix="/auth", tags=["Auth"], dependencies=[Depends(get_principal)]
+)
+
+
+def _token_read(
+    user_id: UUID, roles: List[str], session_id: UUID, refresh_token: str
+) -> TokenRead:
+    token = create_access_token(
+        data={
+            "sub": str(user_id),
+            "roles": roles,
+            "sid": str(session_id),
+        }
+    )
+
+    return TokenRead(
+        access_token=token,
+        token_type="bearer",
+        refresh_token=refresh_token,
+        expires_in=EXPIRATION_TIME_IN_MINUTES * 60,
+    )
 
 
 @auth_router_open.post(
@@ -39,7 +71,9 @@ auth_router = APIRouter(prefix="/auth", tags=["Auth"], dependencies=[Depends(sec
     response_model=APIResponse[SecureCodeRead],
     status_code=201,
 )
-async def signup(user_signup: SignupInput, db: AsyncSession = Depends(get_db)):
+async def signup(
+    request: Request, user_signup: SignupInput, db: AsyncSession = Depends(get_db)
+):
     pw_validity = validate_password(user_signup.password.get_secret_value())
 
     if not pw_validity.ok:
@@ -52,27 +86,25 @@ async def signup(user_signup: SignupInput, db: AsyncSession = Depends(get_db)):
     if not pw_validity.ok:
         raise BadRequestError(pw_validity.msg)
 
+    # Every signup sends an email.
+    await rate_limiter.enforce(
+        "signup:email", email_key(request.scope, user_signup.email), SIGNUP_EMAIL_LIMIT
+    )
+
     user_service = UserService(db)
 
     user_id = await user_service.create_user(user_signup)
 
-    secure_code_response, code = await user_service.create_secure_code(user_id)
-
-    email_sent = send_secure_code_email(
-        email=user_signup.email,
-        code=code,
-        code_id=secure_code_response.secure_code_id,
+    secure_code_response = await user_service.create_secure_code(
+        user_id, email=user_signup.email
     )
 
-    if not email_sent:
-        raise InternalServerError("Error sending Email")
-
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[SecureCodeRead](
             msg="User signed up successfully",
             data=secure_code_response,
             ok=True,
-        ).model_dump(),
+        ),
     )
 
 
@@ -82,30 +114,29 @@ async def signup(user_signup: SignupInput, db: AsyncSession = Depends(get_db)):
     status_code=200,
 )
 async def signin(
+    request: Request,
     input: SigninInput,
     db: AsyncSession = Depends(get_db),
 ):
+    # Checked before the password hash, the costly part.
+    await rate_limiter.enforce(
+        "signin:email", email_key(request.scope, input.email), SIGNIN_EMAIL_LIMIT
+    )
+
     user_service = UserService(db)
 
     user_id, user_email = await user_service.verify_user_password(input)
 
-    secure_code_response, code = await user_service.create_secure_code(user_id)
-
-    email_sent = send_secure_code_email(
-        email=user_email,
-        code=code,
-        code_id=secure_code_response.secure_code_id,
+    secure_code_response = await user_service.create_secure_code(
+        user_id, email=user_email
     )
 
-    if not email_sent:
-        raise InternalServerError("Error sending Email")
-
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[SecureCodeRead](
             msg="Secure code created successfully",
             data=secure_code_response,
             ok=True,
-        ).model_dump(),
+        ),
     )
 
 
@@ -118,28 +149,51 @@ async def validate_secure_code(
     data: SecureCodeValidate,
     db: AsyncSession = Depends(get_db),
 ):
+    # Bounds the guesses of a 6 digits code, whatever IPs they come from.
+    await rate_limiter.enforce(
+        "secure-code:attempts", str(data.secure_code_id), SECURE_CODE_ATTEMPTS_LIMIT
+    )
+
     user_service = UserService(db)
 
     user_id, roles = await user_service.verify_secure_code(data)
 
-    token = create_access_token(
-        data={
-            "sub": str(user_id),
-            "roles": roles,
-        }
+    session_id, refresh_token = await RefreshTokenService(db).create_session(user_id)
+
+    token_schema = _token_read(user_id, roles, session_id, refresh_token)
+
+    return ModelResponse(
+        content=APIResponse[TokenRead](
+            msg="User signed in successfully",
+            data=token_schema,
+            ok=True,
+        ),
     )
 
-    token_schema = TokenRead(
-        access_token=token,
-        token_type="bearer",
+
+@auth_router_open.post(
+    "/refresh",
+    response_model=APIResponse[TokenRead],
+    status_code=200,
+)
+async def refresh(
+    data: RefreshTokenInput,
+    db: AsyncSession = Depends(get_db),
+):
+    session = await RefreshTokenService(db).rotate_refresh_token(
+        data.refresh_token.get_secret_value()
     )
 
-    return JSONResponse(
+    token_schema = _token_read(
+        session.user_id, session.roles, session.session_id, session.refresh_token
+    )
+
+    return ModelResponse(
         content=APIResponse[TokenRead](
-            msg="User signed in successfully",
+            msg="Token refreshed successfully",
             data=token_schema,
             ok=True,
-        ).model_dump(),
+        ),
     )
 
 
@@ -147,19 +201,44 @@ async def validate_secure_code(
 async def me(
     request: Request,
     query: UserQuery = Depends(),
+    principal: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
 ):
     user_service = UserService(db)
 
-    user_id: UUID = request.state.user_id
-    user_data = await user_service.get_user_data_by_id(user_id, query)
+    headers = cache_headers(
+        await user_service.get_user_version(principal.user_id, query), query
+    )
+
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
+    user_data = await user_service.get_user_data_by_id(principal.user_id, query)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[UserRead](
             msg="User signed in successfully",
             data=user_data,
             ok=True,
-        ).model_dump(),
+        ),
+        headers=headers,
+    )
+
+
+@auth_router.post("/logout", response_model=APIResponse[None], status_code=200)
+async def logout(
+    principal: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_db),
+):
+    if principal.session_id is not None:
+        await RefreshTokenService(db).revoke_session(principal.session_id)
+
+    return ModelResponse(
+        content=APIResponse[None](
+            msg="User signed out successfully",
+            data=None,
+            ok=True,
+        ),
     )
 
 
@@ -170,18 +249,19 @@ async def me(
 )
 async def update_user_info(
     data: UserInfoUpdate,
-    request: Request,
+    principal: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
 ):
     user_service = UserService(db)
 
-    user_id: UUID = request.state.user_id
-    user_data = await user_service.update_user_info_data_by_user_id(user_id, data)
+    user_data = await user_service.update_user_info_data_by_user_id(
+        principal.user_id, data
+    )
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[UserRead](
             msg="User info updated successfully",
             data=user_data,
             ok=True,
-        ).model_dump(),
+        ),
     )
@@ -1,6 +1,4 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
-from fastapi.security import HTTPBearer
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.configuration import get_db
@@ -10,13 +8,14 @@ from src.service_gateway.api.v1.schemas.workflow.form_pattern_schemas import (
     FormPatternUpdate,
 )
 from src.service_gateway.api.v1.services.form_pattern_service import FormPatternService
-
-security = HTTPBearer()
+from src.service_gateway.security.principal import get_principal
+from src.utils.etags import cache_headers, is_not_modified, not_modified_response
+from src.utils.responses import ModelResponse
 
 form_pattern_router = APIRouter(
     prefix="/form-patterns",
     tags=["Form Patterns"],
-    dependencies=[Depends(security)],
+    dependencies=[Depends(get_principal)],
 )
 
 
@@ -27,17 +26,27 @@ form_pattern_router = APIRouter(
 )
 async def get_form_pattern(
     form_pattern_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     form_pattern_service = FormPatternService(db)
+
+    headers = cache_headers(
+        await form_pattern_service.get_form_pattern_version(form_pattern_id)
+    )
+
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
     form_pattern = await form_pattern_service.get_form_pattern(form_pattern_id)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[FormPatternRead](
             msg="Form pattern retrieved successfully",
             data=form_pattern,
             ok=True,
-        ).model_dump()
+        ),
+        headers=headers,
     )
 
 
@@ -56,10 +65,10 @@ async def update_form_pattern(
         form_pattern_id, form_pattern_update
     )
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[FormPatternRead](
             msg="Form pattern updated successfully",
             data=updated_form_pattern,
             ok=True,
-        ).model_dump()
+        )
     )
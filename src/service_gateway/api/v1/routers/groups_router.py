@@ -1,9 +1,7 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
-from fastapi.security import HTTPBearer
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.configuration import get_db
@@ -14,14 +12,20 @@ from src.service_gateway.api.v1.schemas.access_control.group_schemas import (
     GroupQuery,
     GroupRead,
     GroupUpdate,
+    GroupUsersFilters,
+)
+from src.service_gateway.api.v1.schemas.access_control.user_schemas import UserRead
+from src.service_gateway.api.v1.schemas.general.general_schemas import (
+    APIResponse,
+    PaginatedData,
 )
-from src.service_gateway.api.v1.schemas.general.general_schemas import APIResponse
 from src.service_gateway.api.v1.services.group_service import GroupService
-
-security = HTTPBearer()
+from src.service_gateway.security.principal import get_principal
+from src.utils.etags import cache_headers, is_not_modified, not_modified_response
+from src.utils.responses import ModelResponse
 
 groups_router = APIRouter(
-    prefix="/groups", tags=["Groups"], dependencies=[Depends(security)]
+    prefix="/groups", tags=["Groups"], dependencies=[Depends(get_principal)]
 )
 
 
@@ -31,18 +35,26 @@ groups_router = APIRouter(
     status_code=200,
 )
 async def get_groups(
+    request: Request,
     filters: GroupFilters = Depends(),
     db: AsyncSession = Depends(get_db),
 ):
     group_service = GroupService(db)
+
+    headers = cache_headers(await group_service.get_groups_version(filters), filters)
+
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
     groups = await group_service.get_groups(filters)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[List[GroupRead]](
             data=groups,
             msg="Groups retrieved successfully",
             ok=True,
-        ).model_dump()
+        ),
+        headers=headers,
     )
 
 
@@ -59,12 +71,34 @@ async def get_group(
     group_service = GroupService(db)
     group = await group_service.get_group(group_id, query)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[GroupRead](
             data=group,
             msg="Group retrieved successfully",
             ok=True,
-        ).model_dump()
+        )
+    )
+
+
+@groups_router.get(
+    "/{group_id}/users",
+    response_model=APIResponse[PaginatedData[UserRead]],
+    status_code=200,
+)
+async def get_group_users(
+    group_id: UUID,
+    filters: GroupUsersFilters = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    group_service = GroupService(db)
+    users_paginated = await group_service.get_group_users(group_id, filters)
+
+    return ModelResponse(
+        content=APIResponse[PaginatedData[UserRead]](
+            data=users_paginated,
+            msg="Group users retrieved successfully",
+            ok=True,
+        )
     )
 
 
@@ -77,12 +111,12 @@ async def create_group(input: GroupInput, db: AsyncSession = Depends(get_db)):
     group_service = GroupService(db)
     new_group = await group_service.create_group(input)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[GroupRead](
             data=new_group,
             msg="Group created successfully",
             ok=True,
-        ).model_dump()
+        )
     )
 
 
@@ -97,12 +131,12 @@ async def update_group(
     group_service = GroupService(db)
     updated_group = await group_service.update_group(group_id, input)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[GroupRead](
             data=updated_group,
             msg="Group updated successfully",
             ok=True,
-        ).model_dump()
+        )
     )
 
 
@@ -117,10 +151,10 @@ async def assign_user_to_group(
     group_service = GroupService(db)
     updated_group = await group_service.assign_user_to_group(input)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[GroupRead](
             data=updated_group,
             msg="User assigned to group successfully",
             ok=True,
-        ).model_dump()
+        )
     )
@@ -4,6 +4,7 @@ from fastapi.responses import JSONResponse
 from src.service_gateway.api.v1.routers.auth_router import auth_router, auth_router_open
 from src.service_gateway.api.v1.routers.form_pattern_router import form_pattern_router
 from src.service_gateway.api.v1.routers.groups_router import groups_router
+from src.service_gateway.api.v1.routers.metrics_router import metrics_router
 from src.service_gateway.api.v1.routers.request_pattern_router import (
     request_pattern_router,
 )
@@ -17,6 +18,7 @@ api_v1_router.include_router(groups_router)
 api_v1_router.include_router(users_router)
 api_v1_router.include_router(request_pattern_router)
 api_v1_router.include_router(form_pattern_router)
+api_v1_router.include_router(metrics_router)
 
 
 @api_v1_router.get("/", tags=["Index"], include_in_schema=False)
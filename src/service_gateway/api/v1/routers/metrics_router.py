@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.configuration import async_engine, get_db
+from src.database.pool_telemetry import get_pool_stats
+from src.service_gateway.api.v1.functions.email_dispatcher import email_dispatcher
+from src.service_gateway.api.v1.schemas.general.general_schemas import APIResponse
+from src.service_gateway.api.v1.schemas.general.metrics_schemas import (
+    DBPoolStatsRead,
+    EmailOutboxStatsRead,
+    PasswordHasherStatsRead,
+)
+from src.service_gateway.security.password_hasher import password_hasher
+from src.service_gateway.security.principal import get_principal
+from src.utils.responses import ModelResponse
+
+metrics_router = APIRouter(
+    prefix="/metrics", tags=["Metrics"], dependencies=[Depends(get_principal)]
+)
+
+
+@metrics_router.get(
+    "/db-pool",
+    response_model=APIResponse[DBPoolStatsRead],
+    status_code=200,
+)
+async def get_db_pool_stats():
+    pool_stats = DBPoolStatsRead.model_validate(get_pool_stats(async_engine.pool))
+
+    return ModelResponse(
+        content=APIResponse[DBPoolStatsRead](
+            msg="Database pool statistics retrieved successfully",
+            data=pool_stats,
+            ok=True,
+        )
+    )
+
+
+@metrics_router.get(
+    "/password-hasher",
+    response_model=APIResponse[PasswordHasherStatsRead],
+    status_code=200,
+)
+async def get_password_hasher_stats():
+    password_hasher_stats = PasswordHasherStatsRead.model_validate(
+        password_hasher.stats()
+    )
+
+    return ModelResponse(
+        content=APIResponse[PasswordHasherStatsRead](
+            msg="Password hasher statistics retrieved successfully",
+            data=password_hasher_stats,
+            ok=True,
+        )
+    )
+
+
+@metrics_router.get(
+    "/email-outbox",
+    response_model=APIResponse[EmailOutboxStatsRead],
+    status_code=200,
+)
+async def get_email_outbox_stats(db: AsyncSession = Depends(get_db)):
+    email_outbox_stats = EmailOutboxStatsRead.model_validate(
+        await email_dispatcher.stats(db)
+    )
+
+    return ModelResponse(
+        content=APIResponse[EmailOutboxStatsRead](
+            msg="Email outbox statistics retrieved successfully",
+            data=email_outbox_stats,
+            ok=True,
+        )
+    )
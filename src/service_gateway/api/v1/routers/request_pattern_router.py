@@ -1,9 +1,7 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
-from fastapi.security import HTTPBearer
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.configuration import get_db
@@ -26,13 +24,14 @@ from src.service_gateway.api.v1.schemas.workflow.request_pattern_schemas import
 from src.service_gateway.api.v1.services.request_pattern_service import (
     RequestPatternService,
 )
-
-security = HTTPBearer()
+from src.service_gateway.security.principal import get_principal
+from src.utils.etags import cache_headers, is_not_modified, not_modified_response
+from src.utils.responses import ModelResponse, RawDataResponse
 
 request_pattern_router = APIRouter(
     prefix="/request-patterns",
     tags=["Request Patterns"],
-    dependencies=[Depends(security)],
+    dependencies=[Depends(get_principal)],
 )
 
 
@@ -42,18 +41,28 @@ request_pattern_router = APIRouter(
     status_code=200,
 )
 async def get_request_patterns(
+    request: Request,
     filters: RequestPatternFilters = Depends(),
     db: AsyncSession = Depends(get_db),
 ):
     request_pattern_service = RequestPatternService(db)
+
+    headers = cache_headers(
+        await request_pattern_service.get_request_patterns_version(filters), filters
+    )
+
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
     request_patterns = await request_pattern_service.get_request_patterns(filters)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[List[RequestPatternRead]](
             msg="Request patterns retrieved successfully",
             data=request_patterns,
             ok=True,
-        ).model_dump()
+        ),
+        headers=headers,
     )
 
 
@@ -64,20 +73,46 @@ async def get_request_patterns(
 )
 async def get_request_pattern(
     request_pattern_id: UUID,
+    request: Request,
     query: RequestPatternQuery = Depends(),
     db: AsyncSession = Depends(get_db),
 ):
     request_pattern_service = RequestPatternService(db)
+
+    headers = cache_headers(
+        await request_pattern_service.get_request_pattern_version(
+            request_pattern_id, query
+        ),
+        query,
+    )
+
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
+    published_request_pattern = (
+        await request_pattern_service.get_published_request_pattern_json(
+            request_pattern_id, query
+        )
+    )
+
+    if published_request_pattern is not None:
+        return RawDataResponse(
+            msg="Request pattern retrieved successfully",
+            data=published_request_pattern,
+            headers=headers,
+        )
+
     request_pattern = await request_pattern_service.get_request_pattern(
         request_pattern_id, query
     )
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[RequestPatternRead](
             msg="Request pattern retrieved successfully",
             data=request_pattern,
             ok=True,
-        ).model_dump()
+        ),
+        headers=headers,
     )
 
 
@@ -93,12 +128,12 @@ async def create_request_pattern(
     request_pattern_service = RequestPatternService(db)
     request_pattern = await request_pattern_service.create_request_pattern(input)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[RequestPatternRead](
             msg="Request pattern created successfully",
             data=request_pattern,
             ok=True,
-        ).model_dump()
+        )
     )
 
 
@@ -117,12 +152,12 @@ async def update_request_pattern(
         request_pattern_id, update
     )
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[RequestPatternRead](
             msg="Request pattern updated successfully",
             data=request_pattern,
             ok=True,
-        ).model_dump()
+        )
     )
 
 
@@ -142,12 +177,12 @@ async def create_form_pattern_for_activity(
         request_pattern_id, activity_id, input
     )
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[FormPatternRead](
             msg="Form pattern created successfully",
             data=form_pattern,
             ok=True,
-        ).model_dump()
+        )
     )
 
 
@@ -167,12 +202,12 @@ async def get_request_pattern_activity_fields(
         request_pattern_id, activity_id
     )
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[List[ActivityFieldsRead]](
             msg="Activity fields retrieved successfully",
             data=activity_fields,
             ok=True,
-        ).model_dump()
+        )
     )
 
 
@@ -192,12 +227,12 @@ async def put_request_pattern_activity_fields(
         request_pattern_id, activity_id, input
     )
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[None](
             msg="Activity fields updated successfully",
             data=None,
             ok=True,
-        ).model_dump()
+        )
     )
 
 
@@ -213,10 +248,10 @@ async def publish_request_pattern(
     request_pattern_service = RequestPatternService(db)
     await request_pattern_service.publish_request_pattern(request_pattern_id)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[None](
             msg="Request pattern published successfully",
             data=None,
             ok=True,
-        ).model_dump()
+        )
     )
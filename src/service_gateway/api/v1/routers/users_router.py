@@ -1,8 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
-from fastapi.security import HTTPBearer
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.configuration import get_db
@@ -16,11 +14,12 @@ from src.service_gateway.api.v1.schemas.general.general_schemas import (
     PaginatedData,
 )
 from src.service_gateway.api.v1.services.user_service import UserService
-
-security = HTTPBearer()
+from src.service_gateway.security.principal import get_principal
+from src.utils.etags import cache_headers, is_not_modified, not_modified_response
+from src.utils.responses import ModelResponse
 
 users_router = APIRouter(
-    prefix="/users", tags=["Users"], dependencies=[Depends(security)]
+    prefix="/users", tags=["Users"], dependencies=[Depends(get_principal)]
 )
 
 
@@ -36,12 +35,12 @@ async def get_users(
     user_service = UserService(db)
     users_paginated = await user_service.get_users(filters)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[PaginatedData[UserRead]](
             msg="Users retrieved successfully",
             data=users_paginated,
             ok=True,
-        ).model_dump()
+        )
     )
 
 
@@ -52,16 +51,24 @@ async def get_users(
 )
 async def get_user(
     user_id: UUID,
+    request: Request,
     query: UserQuery = Depends(),
     db: AsyncSession = Depends(get_db),
 ):
     user_service = UserService(db)
+
+    headers = cache_headers(await user_service.get_user_version(user_id, query), query)
+
+    if is_not_modified(request, headers):
+        return not_modified_response(headers)
+
     user_squema = await user_service.get_user_data_by_id(user_id, query)
 
-    return JSONResponse(
+    return ModelResponse(
         content=APIResponse[UserRead](
             msg="User retrieved successfully",
             data=user_squema,
             ok=True,
-        ).model_dump()
+        ),
+        headers=headers,
     )
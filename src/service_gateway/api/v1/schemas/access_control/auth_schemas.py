@@ -20,6 +20,12 @@ class SigninInput(BaseModel):
 class TokenRead(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: str
+    expires_in: int = Field(description="Seconds until the access token expires")
+
+
+class RefreshTokenInput(BaseModel):
+    refresh_token: SecretStr = Field(repr=False)
 
 
 class SecureCodeRead(BaseModel):
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
+from src.database.search import SEARCH_MIN_TERM_LENGTH
 from src.service_gateway.api.v1.schemas.access_control.user_schemas import UserRead
 from src.utils.serializers import serialize_uuid
 
@@ -67,7 +68,17 @@ class GroupQuery(BaseModel):
 
 class GroupFilters(BaseModel):
     include_users: bool = False
-    name: Optional[str] = None
+    name: Optional[str] = Field(default=None, min_length=SEARCH_MIN_TERM_LENGTH)
+
+
+class GroupUsersFilters(BaseModel):
+    include_user_info: bool = False
+    include_descendants: bool = Field(
+        default=False,
+        description="Also list the members of every descendant group",
+    )
+    page_size: int = Field(default=10, ge=1, le=100)
+    cursor: Optional[str] = None
 
 
 # Manage user(s) on group
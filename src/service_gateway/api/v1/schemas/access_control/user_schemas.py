@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Annotated, Any, List, Optional
+from typing import TYPE_CHECKING, Annotated, Any, List, Literal, Optional
 from uuid import UUID
 
 from pydantic import (
@@ -11,10 +11,11 @@ from pydantic import (
     Field,
     constr,
     field_serializer,
-    model_validator,
+    field_validator,
 )
 
 from src.database.models.access_control.enums import IdTypeEnum, RoleEnum
+from src.database.search import SEARCH_MIN_TERM_LENGTH
 from src.utils.serializers import serialize_datetime, serialize_uuid
 
 if TYPE_CHECKING:
@@ -65,19 +66,16 @@ class UserRead(BaseModel):
     def serialize_created_at(self, dt: datetime, _info):
         return serialize_datetime(dt)
 
-    @model_validator(mode="before")
+    @field_validator("roles", mode="before")
     @classmethod
-    def extract_roles(cls, data: Any):
-        if data is None:
-            return data
+    def extract_roles(cls, roles: Any):
+        if not isinstance(roles, list):
+            return roles
 
-        if not isinstance(data, dict):
-            return data
-
-        if "roles" in data and isinstance(data["roles"], list):
-            data["roles"] = [item["role"] for item in data["roles"]]
-
-        return data
+        return [
+            item["role"] if isinstance(item, dict) else getattr(item, "role", item)
+            for item in roles
+        ]
 
 
 # Query schemas
@@ -94,6 +92,16 @@ class UserQuery(BaseModel):
 class UserFilters(UserQuery):
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=10, ge=1, le=100)
+    pagination: Literal["offset", "keyset"] = Field(
+        default="offset",
+        description="Keyset pagination is implied when a `cursor` is given",
+    )
+    cursor: Optional[str] = None
+    count: Literal["exact", "estimated", "none"] = "exact"
     only_active: bool = True
     only_verified: Optional[bool] = None
-    name: Optional[str] = None
+    name: Optional[str] = Field(
+        default=None,
+        min_length=SEARCH_MIN_TERM_LENGTH,
+        description="Offset pages are ranked by similarity to the name",
+    )
@@ -1,4 +1,4 @@
-from typing import Generic, List, TypeVar
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -12,15 +12,26 @@ class APIResponse(BaseModel, Generic[T]):
 
 
 class APIErrorResponse(BaseModel):
-    detail: str | List[str]
+    detail: str | List[str] | List[Dict[str, Any]]
     ok: bool = False
 
 
 class Pagination(BaseModel):
-    page: int
+    page: Optional[int] = Field(
+        default=None,
+        description="Current page, only for offset pagination",
+    )
     size: int
-    total: int
-    pages: int
+    total: Optional[int] = Field(
+        default=None,
+        description="Total items matching the filters, `null` when not counted",
+    )
+    total_is_estimate: bool = False
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor of the next page, only for keyset pagination",
+    )
 
 
 class PaginatedData(BaseModel, Generic[T]):
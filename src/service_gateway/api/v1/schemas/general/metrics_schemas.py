@@ -0,0 +1,45 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class HistogramBucketRead(BaseModel):
+    le: Optional[float] = Field(
+        description="Upper bound of the bucket, `null` stands for +Inf",
+    )
+    count: int
+
+
+class HistogramRead(BaseModel):
+    buckets: List[HistogramBucketRead]
+    count: int
+    sum: float
+
+
+class DBPoolStatsRead(BaseModel):
+    pool_size: int = 0
+    checked_in: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+    checkouts: int
+    timeouts: int
+    wait_time_ms: HistogramRead
+
+
+class PasswordHasherStatsRead(BaseModel):
+    executor: str
+    workers: int
+    max_concurrency: int
+    waiting: int
+    in_flight: int
+    queue_time_ms: HistogramRead
+    run_time_ms: HistogramRead
+
+
+class EmailOutboxStatsRead(BaseModel):
+    running: bool
+    pending: int
+    sent: int
+    retried: int
+    failed: int
+    batch_time_ms: HistogramRead
@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
+from src.database.search import SEARCH_MIN_TERM_LENGTH
 from src.service_gateway.api.v1.schemas.access_control.group_schemas import (
     GroupSimpleRead,
 )
@@ -12,6 +13,9 @@ from src.service_gateway.api.v1.schemas.workflow.activity_schemas import (
     ActivityRead,
     ActivityUpdate,
 )
+from src.service_gateway.api.v1.schemas.workflow.form_pattern_schemas import (
+    FormPatternRead,
+)
 from src.utils.serializers import serialize_datetime, serialize_uuid
 
 
@@ -64,9 +68,37 @@ class RequestPatternQuery(BaseModel):
 
 
 class RequestPatternFilters(BaseModel):
-    label: Optional[str] = None
+    label: Optional[str] = Field(default=None, min_length=SEARCH_MIN_TERM_LENGTH)
     supervisor_id: Optional[UUID] = None
     is_published: Optional[bool] = None
     is_active: Optional[bool] = None
     include_groups: bool = False
     include_activities: bool = False
+
+
+# Publish schemas
+
+
+class PublishViolation(BaseModel):
+    """A rule the request pattern breaks, located as precisely as possible."""
+
+    activity_id: Optional[int] = None
+    form_pattern_id: Optional[int] = None
+    form_field_id: Optional[int] = None
+    msg: str
+
+
+# Snapshot schemas
+
+# Bump whenever the layout of `RequestPatternSnapshotDocument` or of any schema
+# it embeds changes, older snapshots are then ignored.
+REQUEST_PATTERN_SNAPSHOT_VERSION = 1
+
+
+class RequestPatternSnapshotDocument(BaseModel):
+    # Without groups, their names can still change after publishing.
+    request_pattern: RequestPatternRead
+    # By form pattern id
+    form_patterns: Dict[int, FormPatternRead]
+    # Ids of the fields displayed, by activity id
+    fields_display: Dict[int, List[int]]
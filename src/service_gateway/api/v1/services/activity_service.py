@@ -1,12 +1,23 @@
-from typing import Dict, List, Literal, Optional
+from datetime import timedelta
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
+from uuid import UUID
 
-from sqlalchemy import literal_column
+from sqlalchemy import Integer, cast, column, delete, insert, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import joinedload
 
-from src.database.models.workflow.activity import Activity
-from src.service_gateway.api.v1.schemas.workflow.activity_schemas import ActivityRead
+from src.database.models.workflow.activity import Activity, ActivityAssignees
+from src.database.serialization import loaded, type_adapter
+from src.service_gateway.api.v1.schemas.workflow.activity_asignees_schemas import (
+    ActivityAsigneesInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.activity_schemas import (
+    ActivityInput,
+    ActivityRead,
+    ActivityUpdate,
+)
 
 
 class ActivitiesChain:
@@ -20,15 +31,13 @@ class ActivitiesChain:
         self.activities[count] = activity
 
     def _to_activities_read(self) -> List[ActivityRead]:
-        return [
-            ActivityRead.model_validate(
-                dict(
-                    **activity.to_dict(),
-                    activity_order=key,
-                )
-            )
-            for key, activity in self.activities.items()
-        ]
+        return type_adapter(List[ActivityRead]).validate_python(
+            [
+                loaded(activity, activity_order=key)
+                for key, activity in self.activities.items()
+            ],
+            from_attributes=True,
+        )
 
     def _get_activity_by_order(self, order: int) -> Optional[Activity]:
         return self.activities.get(order)
@@ -64,31 +73,12 @@ class ActivityService:
     ## Friendly methods
     async def _get_activity_from_activity_chain(
         self,
-        first_activity_id: int,
+        request_pattern_id: UUID,
         target_activity_id: int,
     ) -> Optional[Activity]:
-        if first_activity_id is None:
-            return None
-
-        activity_cte = (
-            select(Activity)
-            .where(Activity.activity_id == first_activity_id)
-            .cte(name="activity_chain", recursive=True)
-        )
-
-        cte_alias = aliased(activity_cte, name="cte_alias")
-
-        activity_cte = activity_cte.union_all(
-            select(Activity).join(
-                cte_alias, Activity.activity_id == cte_alias.c.next_activity_id
-            )
-        )
-
-        stmt = (
-            select(Activity)
-            .join(activity_cte, Activity.activity_id == activity_cte.c.activity_id)
-            .where(activity_cte.c.activity_id == target_activity_id)
-            .limit(1)
+        stmt = select(Activity).where(
+            Activity.request_pattern_id == request_pattern_id,
+            Activity.activity_id == target_activity_id,
         )
 
         result = await self.db.execute(stmt)
@@ -97,41 +87,166 @@ class ActivityService:
 
     async def _get_activities_chain(
         self,
-        first_activity_id: int,
+        request_pattern_id: UUID,
     ) -> ActivitiesChain:
-        activity_cte = (
-            select(Activity)
-            .add_columns(literal_column("1").label("order"))
-            .where(Activity.activity_id == first_activity_id)
-            .cte(name="activity_chain", recursive=True)
-        )
+        activities_chains = await self._get_activities_chains([request_pattern_id])
+
+        return activities_chains.get(request_pattern_id, ActivitiesChain())
 
-        cte_alias = aliased(activity_cte, name="cte_alias")
+    async def _get_activities_chains(
+        self,
+        request_pattern_ids: Sequence[UUID],
+    ) -> Dict[UUID, ActivitiesChain]:
+        """
+        Reads the chains of every request pattern in `request_pattern_ids` with a
+        range scan on `(request_pattern_id, position)` and returns an
+        `ActivitiesChain` per request pattern.
+        """
+        request_pattern_ids = list(dict.fromkeys(request_pattern_ids))
+
+        if not request_pattern_ids:
+            return {}
+
+        # Assignees and their user/group are joined into the same statement, so
+        # all chains cost a single round trip regardless of their length.
+        # `populate_existing` keeps the refresh semantics for activities that
+        # are already present in the session (e.g. right after an update).
+        assignee_loader = joinedload(Activity.assignee)
 
-        activity_cte = activity_cte.union_all(
+        stmt = (
             select(Activity)
-            .add_columns((cte_alias.c.order + 1).label("order"))
-            .join(cte_alias, Activity.activity_id == cte_alias.c.next_activity_id)
+            .where(Activity.request_pattern_id.in_(request_pattern_ids))
+            .options(
+                assignee_loader.joinedload(ActivityAssignees.user),
+                assignee_loader.joinedload(ActivityAssignees.group),
+            )
+            .order_by(Activity.request_pattern_id, Activity.position)
+            .execution_options(populate_existing=True)
         )
 
-        stmt = (
-            select(Activity, activity_cte.c.order)
-            .join(activity_cte, Activity.activity_id == activity_cte.c.activity_id)
-            .order_by(activity_cte.c.order)
+        result = await self.db.scalars(stmt)
+
+        activities_chains: Dict[UUID, ActivitiesChain] = {}
+
+        for activity in result.all():
+            activities_chains.setdefault(
+                activity.request_pattern_id, ActivitiesChain()
+            )._add_activity(activity)
+
+        return activities_chains
+
+    async def _insert_activities(
+        self,
+        activities: Sequence[Union[ActivityInput, ActivityUpdate]],
+    ) -> List[Activity]:
+        """
+        Inserts `activities`, unlinked, with a single `INSERT ... RETURNING` and
+        returns the new rows in the same order.
+        """
+        if not activities:
+            return []
+
+        result = await self.db.scalars(
+            insert(Activity).returning(Activity, sort_by_parameter_order=True),
+            [
+                {
+                    "label": activity.label,
+                    "description": activity.description,
+                    "estimated_time": activity.estimated_time or timedelta(seconds=0),
+                }
+                for activity in activities
+            ],
         )
 
-        result = await self.db.execute(stmt)
+        return list(result.all())
 
-        activities_chain = ActivitiesChain()
+    async def _upsert_assignees(
+        self,
+        assignees: Dict[int, ActivityAsigneesInput],
+    ) -> None:
+        """Writes the assignee of every activity id in `assignees` in one statement."""
+        if not assignees:
+            return
+
+        stmt = pg_insert(ActivityAssignees).values(
+            [
+                {
+                    "activity_id": activity_id,
+                    "assignee_type": assignee.assignee_type,
+                    "user_id": assignee.user_id,
+                    "group_id": assignee.group_id,
+                }
+                for activity_id, assignee in assignees.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ActivityAssignees.activity_id],
+            set_={
+                "assignee_type": stmt.excluded.assignee_type,
+                "user_id": stmt.excluded.user_id,
+                "group_id": stmt.excluded.group_id,
+            },
+        )
 
-        for activity, order in result.all():
-            await self.db.refresh(activity, attribute_names=["assignee"])
+        await self.db.execute(stmt)
 
-            if activity.assignee:
-                await self.db.refresh(
-                    activity.assignee, attribute_names=["user", "group"]
-                )
+    async def _link_activities(
+        self,
+        request_pattern_id: UUID,
+        activities: Sequence[Activity],
+    ) -> None:
+        """
+        Makes `activities`, in order, the chain of `request_pattern_id`: sets the
+        `next_activity_id`, `request_pattern_id` and `position` of every activity
+        whose values change with a single `UPDATE ... FROM (VALUES ...)`.
+
+        Activities already in the session keep their previous values, reload the
+        chain with `_get_activities_chain` to read the new links.
+        """
+        rows: List[Tuple[int, Optional[int], UUID, int]] = []
+
+        for position, activity in enumerate(activities):
+            next_activity_id = (
+                activities[position + 1].activity_id
+                if position + 1 < len(activities)
+                else None
+            )
+            row = (activity.activity_id, next_activity_id, request_pattern_id, position)
+
+            if (
+                activity.next_activity_id,
+                activity.request_pattern_id,
+                activity.position,
+            ) != row[1:]:
+                rows.append(row)
+
+        if not rows:
+            return
+
+        new_links = values(
+            column("activity_id", Integer),
+            column("next_activity_id", Integer),
+            column("request_pattern_id", Activity.request_pattern_id.type),
+            column("position", Integer),
+            name="new_links",
+        ).data(rows)
+
+        await self.db.execute(
+            update(Activity)
+            .where(Activity.activity_id == new_links.c.activity_id)
+            .values(
+                # NULL is rendered untyped, a chain of one would make it text.
+                next_activity_id=cast(new_links.c.next_activity_id, Integer),
+                request_pattern_id=new_links.c.request_pattern_id,
+                position=new_links.c.position,
+            )
+            .execution_options(synchronize_session=False)
+        )
 
-            activities_chain._add_activity(activity)
+    async def _delete_activities(self, activity_ids: Sequence[int]) -> None:
+        if not activity_ids:
+            return
 
-        return activities_chain
+        await self.db.execute(
+            delete(Activity).where(Activity.activity_id.in_(activity_ids))
+        )
@@ -1,7 +1,7 @@
 from collections import Counter
-from typing import Dict, List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
 
-from sqlalchemy import literal_column
+from sqlalchemy import Integer, cast, column, delete, func, insert, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -10,6 +10,11 @@ from src.database.models.workflow.enums import InputTypeEnum
 from src.database.models.workflow.field_option import FieldOption
 from src.database.models.workflow.form_field import FormField
 from src.database.models.workflow.form_pattern import FormPattern
+from src.database.serialization import loaded, type_adapter
+from src.database.versions import ResourceVersion, row_version, versions_digest
+from src.service_gateway.api.v1.schemas.workflow.field_option_schemas import (
+    FieldOptionInput,
+)
 from src.service_gateway.api.v1.schemas.workflow.form_field_schemas import (
     FormFieldInput,
     FormFieldRead,
@@ -21,6 +26,8 @@ from src.service_gateway.api.v1.schemas.workflow.form_pattern_schemas import (
 )
 from src.utils.http_exceptions import BadRequestError
 
+CHOICE_INPUT_TYPES = (InputTypeEnum.SINGLE_CHOICE, InputTypeEnum.MULTIPLE_CHOICE)
+
 
 class FieldsChain:
     """Class to represent a chain of form fields"""
@@ -35,15 +42,13 @@ class FieldsChain:
         self.form_fields[count] = form_field
 
     def _to_fields_read(self) -> List[FormFieldRead]:
-        return [
-            FormFieldRead.model_validate(
-                dict(
-                    **field.to_dict(),
-                    form_field_order=key,
-                )
-            )
-            for key, field in self.form_fields.items()
-        ]
+        return type_adapter(List[FormFieldRead]).validate_python(
+            [
+                loaded(field, form_field_order=key)
+                for key, field in self.form_fields.items()
+            ],
+            from_attributes=True,
+        )
 
     def _get_field_by_order(self, order: int) -> Optional[FormField]:
         return self.form_fields.get(order)
@@ -85,92 +90,204 @@ class FormPatternService:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def _get_form_patterns_by_ids(
+        self, form_pattern_ids: Sequence[int]
+    ) -> Dict[int, FormPattern]:
+        if not form_pattern_ids:
+            return {}
+
+        result = await self.db.scalars(
+            select(FormPattern).where(
+                FormPattern.form_pattern_id.in_(set(form_pattern_ids))
+            )
+        )
+
+        return {
+            form_pattern.form_pattern_id: form_pattern for form_pattern in result.all()
+        }
+
     async def _get_form_fields_chain(
         self,
-        first_field_id: int,
+        form_pattern_id: int,
     ) -> FieldsChain:
-        form_fields_cte = (
-            select(FormField)
-            .add_columns(literal_column("0").label("order"))
-            .where(FormField.form_field_id == first_field_id)
-            .cte(name="form_fields_chain", recursive=True)
-        )
+        fields_chains = await self._get_form_fields_chains([form_pattern_id])
 
-        cte_alias = form_fields_cte.alias("form_fields_chain_alias")
+        return fields_chains.get(form_pattern_id, FieldsChain())
 
-        form_fields_cte = form_fields_cte.union_all(
-            select(FormField)
-            .add_columns((cte_alias.c.order + 1).label("order"))
-            .join(cte_alias, FormField.form_field_id == cte_alias.c.next_field_id)
-        )
+    async def _get_form_fields_chains(
+        self,
+        form_pattern_ids: Sequence[int],
+    ) -> Dict[int, FieldsChain]:
+        """
+        Reads the field chains of every form pattern in `form_pattern_ids`, with
+        their options, in two round trips regardless of how many there are.
+        """
+        if not form_pattern_ids:
+            return {}
 
         stmt = (
-            select(FormField, form_fields_cte.c.order)
-            .join(
-                form_fields_cte,
-                FormField.form_field_id == form_fields_cte.c.form_field_id,
-            )
-            .order_by(form_fields_cte.c.order)
+            select(FormField)
+            .where(FormField.form_pattern_id.in_(set(form_pattern_ids)))
+            .order_by(FormField.form_pattern_id, FormField.position)
+            .execution_options(populate_existing=True)
         ).options(selectinload(FormField.options))
 
-        result = await self.db.execute(stmt)
+        result = await self.db.scalars(stmt)
 
-        fields_chain = FieldsChain()
+        fields_chains: Dict[int, FieldsChain] = {}
 
-        for form_field, order in result.all():
-            fields_chain._add_field(form_field)
+        for form_field in result.all():
+            fields_chains.setdefault(
+                form_field.form_pattern_id, FieldsChain()
+            )._add_field(form_field)
 
-        return fields_chain
-
-    async def _create_form_field(self, field_input: FormFieldInput) -> FormField:
-        new_form_field = FormField(
-            input_type=field_input.input_type,
-            title=field_input.title,
-            description=field_input.description,
-            is_mandatory=field_input.is_mandatory,
-        )
-
-        self.db.add(new_form_field)
-        await self.db.flush()
-        await self.db.refresh(new_form_field)
+        return fields_chains
 
+    def _get_field_options(
+        self,
+        input_type: InputTypeEnum,
+        options_input: Optional[List[FieldOptionInput]],
+    ) -> List[FieldOptionInput]:
+        """
+        Validates and sorts the options of a field. Only choice fields keep
+        their options, for any other input type the result is empty.
+        """
         options = (
-            sorted(field_input.options, key=lambda x: x.option_order)
-            if field_input.options
-            else []
+            sorted(options_input, key=lambda x: x.option_order) if options_input else []
         )
 
         if len(options) != len(set(option.option_order for option in options)):
             raise BadRequestError("Form field options must have unique orders.")
 
-        if new_form_field.input_type in [
-            InputTypeEnum.SINGLE_CHOICE,
-            InputTypeEnum.MULTIPLE_CHOICE,
-        ]:
-            for i, option_input in enumerate(options):
-                if i != option_input.option_order:
-                    raise BadRequestError(
-                        f"Form field options must have continuous orders starting from 0."
-                        f"Expected order {i}, but got {option_input.option_order}."
-                    )
+        if input_type not in CHOICE_INPUT_TYPES:
+            return []
 
-                field_option = FieldOption(
-                    form_field_id=new_form_field.form_field_id,
-                    title=option_input.title,
-                    option_order=option_input.option_order,
+        for i, option_input in enumerate(options):
+            if i != option_input.option_order:
+                raise BadRequestError(
+                    f"Form field options must have continuous orders starting from 0."
+                    f"Expected order {i}, but got {option_input.option_order}."
                 )
-                self.db.add(field_option)
 
-        return new_form_field
+        return options
+
+    async def _insert_form_fields(
+        self,
+        fields: Sequence[FormFieldInput],
+    ) -> List[FormField]:
+        """
+        Inserts `fields`, unlinked, with a single `INSERT ... RETURNING` and
+        returns the new rows in the same order.
+        """
+        if not fields:
+            return []
+
+        result = await self.db.scalars(
+            insert(FormField).returning(FormField, sort_by_parameter_order=True),
+            [
+                {
+                    "input_type": field.input_type,
+                    "title": field.title,
+                    "description": field.description,
+                    "is_mandatory": bool(field.is_mandatory),
+                }
+                for field in fields
+            ],
+        )
+
+        return list(result.all())
+
+    async def _insert_field_options(
+        self,
+        options: Dict[int, List[FieldOptionInput]],
+    ) -> None:
+        """Inserts the options of every form field id in `options` in one statement."""
+        rows = [
+            {
+                "form_field_id": form_field_id,
+                "title": option.title,
+                "option_order": option.option_order,
+            }
+            for form_field_id, field_options in options.items()
+            for option in field_options
+        ]
+
+        if not rows:
+            return
+
+        await self.db.execute(insert(FieldOption), rows)
+
+    async def _delete_field_options(self, form_field_ids: Sequence[int]) -> None:
+        if not form_field_ids:
+            return
+
+        await self.db.execute(
+            delete(FieldOption).where(FieldOption.form_field_id.in_(form_field_ids))
+        )
+
+    async def _link_form_fields(
+        self,
+        form_pattern_id: int,
+        form_fields: Sequence[FormField],
+    ) -> None:
+        """
+        Makes `form_fields`, in order, the chain of `form_pattern_id`: sets the
+        `next_field_id`, `form_pattern_id` and `position` of every form field
+        whose values change with a single `UPDATE ... FROM (VALUES ...)`.
+        """
+        rows: List[Tuple[int, Optional[int], int, int]] = []
+
+        for position, form_field in enumerate(form_fields):
+            next_field_id = (
+                form_fields[position + 1].form_field_id
+                if position + 1 < len(form_fields)
+                else None
+            )
+            row = (form_field.form_field_id, next_field_id, form_pattern_id, position)
+
+            if (
+                form_field.next_field_id,
+                form_field.form_pattern_id,
+                form_field.position,
+            ) != row[1:]:
+                rows.append(row)
+
+        if not rows:
+            return
+
+        new_links = values(
+            column("form_field_id", Integer),
+            column("next_field_id", Integer),
+            column("form_pattern_id", Integer),
+            column("position", Integer),
+            name="new_links",
+        ).data(rows)
+
+        await self.db.execute(
+            update(FormField)
+            .where(FormField.form_field_id == new_links.c.form_field_id)
+            .values(
+                # NULL is rendered untyped, a chain of one would make it text.
+                next_field_id=cast(new_links.c.next_field_id, Integer),
+                form_pattern_id=new_links.c.form_pattern_id,
+                position=new_links.c.position,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _delete_form_fields(self, form_field_ids: Sequence[int]) -> None:
+        if not form_field_ids:
+            return
+
+        await self.db.execute(
+            delete(FormField).where(FormField.form_field_id.in_(form_field_ids))
+        )
 
     async def _create_form_pattern_without_commit(
         self, input: FormPatternInput
     ) -> FormPattern:
         fields_input = sorted(input.fields, key=lambda x: x.form_field_order)
 
-        first_field_id: int = 0
-        last_field: Optional[FormField] = None
-
         if len(fields_input) < 2:
             raise BadRequestError(
                 "Form pattern must have at least 2 fields (one section and one field)."
@@ -194,37 +311,82 @@ class FormPatternService:
             if i == 1 and field_input.input_type == InputTypeEnum.SECTION:
                 raise BadRequestError("The second field must not be a section field.")
 
-            new_form_field = await self._create_form_field(field_input)
+        fields_options = [
+            self._get_field_options(field_input.input_type, field_input.options)
+            for field_input in fields_input
+        ]
 
-            if last_field:
-                last_field.next_field_id = new_form_field.form_field_id
+        # Fields, options and links are written with one statement each,
+        # whatever the size of the form.
+        new_fields = await self._insert_form_fields(fields_input)
 
-            if i == 0:
-                first_field_id = new_form_field.form_field_id
+        await self._insert_field_options(
+            {
+                field.form_field_id: options
+                for field, options in zip(new_fields, fields_options)
+                if options
+            }
+        )
 
-            last_field = new_form_field
+        form_pattern = FormPattern(form_field_id=new_fields[0].form_field_id)
 
-            await self.db.flush()
-            await self.db.refresh(new_form_field)
+        # The fields point back to their form pattern, so the chain is linked
+        # once the form pattern row exists.
+        self.db.add(form_pattern)
+        await self.db.flush()
 
-        form_pattern = FormPattern(form_field_id=first_field_id)
+        await self._link_form_fields(form_pattern.form_pattern_id, new_fields)
 
         return form_pattern
 
     ## Public methods
 
+    async def get_form_pattern_version(
+        self, form_pattern_id: int
+    ) -> Optional[ResourceVersion]:
+        """
+        Fingerprint of the rows `get_form_pattern` reads, computed without loading
+        them. Published form patterns are immutable.
+        """
+        stmt = select(
+            FormPattern.published_at,
+            func.concat_ws(
+                ",",
+                row_version(FormPattern),
+                versions_digest(
+                    select(row_version(FormField)).where(
+                        FormField.form_pattern_id == form_pattern_id
+                    ),
+                    select(row_version(FieldOption))
+                    .join(
+                        FormField,
+                        FormField.form_field_id == FieldOption.form_field_id,
+                    )
+                    .where(FormField.form_pattern_id == form_pattern_id),
+                ),
+            ),
+        ).where(FormPattern.form_pattern_id == form_pattern_id)
+
+        result = await self.db.execute(stmt)
+        row = result.first()
+
+        if row is None:
+            return None
+
+        published_at, digest = row
+
+        return ResourceVersion(digest=digest, immutable=published_at is not None)
+
     async def get_form_pattern(self, form_pattern_id: int) -> FormPatternRead:
         form_pattern = await self._get_form_pattern_by_id(form_pattern_id)
 
         if not form_pattern:
             raise BadRequestError(f"Form pattern with ID {form_pattern_id} not found.")
 
-        fields_chain = await self._get_form_fields_chain(form_pattern.form_field_id)
+        fields_chain = await self._get_form_fields_chain(form_pattern.form_pattern_id)
         fields_read = fields_chain._to_fields_read()
 
-        return FormPatternRead.model_validate(
-            {**form_pattern.to_dict(), "fields": fields_read}
-        )
+        return FormPatternRead.model_validate(loaded(form_pattern, fields=fields_read))
 
     async def update_form_pattern(
         self, form_pattern_id: int, update: FormPatternUpdate
@@ -254,7 +416,7 @@ class FormPatternService:
 
             # 1. Get the actual fields chain
             actual_fields_chain = await self._get_form_fields_chain(
-                form_pattern.form_field_id
+                form_pattern.form_pattern_id
             )
 
             # 2. Validate the fields to update
@@ -281,19 +443,11 @@ class FormPatternService:
                     "Fields to delete do not match the existing fields in the form pattern."
                 )
 
-            # 3. Delete fields that are marked for deletion
-            for field_id in update.fields_to_delete:
-                field_to_delete = actual_fields_chain._get_field_by_id(field_id)
-                if not field_to_delete:
-                    raise BadRequestError(f"Field with ID {field_id} not found.")
-
-                await self.db.delete(field_to_delete)
-
-            await self.db.flush()
-
-            # 4. Create new field chain, with updated fields and new fields
-            first_field_id: int = 0
-            last_field: Optional[FormField] = None
+            # 3. Validate the new chain before writing anything
+            existing_fields: Dict[int, FormField] = {}
+            new_fields_input: Dict[int, FormFieldInput] = {}
+            # Validated options by field order, for the fields they are written to
+            fields_options: Dict[int, List[FieldOptionInput]] = {}
 
             for i, field_update_data in enumerate(fields_update):
                 if i != field_update_data.form_field_order:
@@ -302,22 +456,7 @@ class FormPatternService:
                         f"Expected order {i}, but got {field_update_data.form_field_order}."
                     )
 
-                if i == 0 and (
-                    field_update_data.input_type is not None
-                    and field_update_data.input_type != InputTypeEnum.SECTION
-                ):
-                    raise BadRequestError("The first field must be a section field.")
-
-                if i == 1 and (
-                    field_update_data.input_type is not None
-                    and field_update_data.input_type == InputTypeEnum.SECTION
-                ):
-                    raise BadRequestError(
-                        "The second field must not be a section field."
-                    )
-
                 if field_update_data.form_field_id:
-                    # A. Update existing field
                     field_to_update = actual_fields_chain._get_field_by_id(
                         field_update_data.form_field_id
                     )
@@ -327,88 +466,126 @@ class FormPatternService:
                             f"Field with ID {field_update_data.form_field_id} not found."
                         )
 
-                    if field_update_data.title is not None:
-                        field_to_update.title = field_update_data.title
+                    existing_fields[i] = field_to_update
+                    input_type = (
+                        field_update_data.input_type or field_to_update.input_type
+                    )
+
+                    if (
+                        field_update_data.options is not None
+                        and input_type in CHOICE_INPUT_TYPES
+                    ):
+                        fields_options[i] = self._get_field_options(
+                            input_type, field_update_data.options
+                        )
+                else:
+                    if (
+                        field_update_data.input_type is None
+                        or field_update_data.title is None
+                    ):
+                        raise BadRequestError(
+                            "New form fields must have an input type and a title."
+                        )
+
+                    new_fields_input[i] = FormFieldInput.model_validate(
+                        field_update_data.model_dump()
+                    )
+                    input_type = field_update_data.input_type
+                    fields_options[i] = self._get_field_options(
+                        input_type, field_update_data.options
+                    )
 
-                    if field_update_data.description is not None:
-                        field_to_update.description = field_update_data.description
+                if i == 0 and input_type != InputTypeEnum.SECTION:
+                    raise BadRequestError("The first field must be a section field.")
 
-                    if field_update_data.is_mandatory is not None:
-                        field_to_update.is_mandatory = field_update_data.is_mandatory
+                if i == 1 and input_type == InputTypeEnum.SECTION:
+                    raise BadRequestError(
+                        "The second field must not be a section field."
+                    )
 
-                    if field_update_data.input_type is not None:
-                        if field_to_update.input_type in [
-                            InputTypeEnum.SINGLE_CHOICE,
-                            InputTypeEnum.MULTIPLE_CHOICE,
-                        ] and field_update_data not in [
-                            InputTypeEnum.SINGLE_CHOICE,
-                            InputTypeEnum.MULTIPLE_CHOICE,
-                        ]:
-                            for option in field_to_update.options:
-                                await self.db.delete(option)
+            # 4. Update existing fields, the session only writes the rows whose
+            # values actually changed, and collect their option rewrites
+            options_to_clear: List[int] = []
+            options_to_insert: Dict[int, List[FieldOptionInput]] = {}
 
-                        field_to_update.input_type = field_update_data.input_type
+            for i, field_to_update in existing_fields.items():
+                field_update_data = fields_update[i]
 
-                    if (
-                        field_update_data.options is not None
-                        and field_to_update.input_type
-                        in [
-                            InputTypeEnum.SINGLE_CHOICE,
-                            InputTypeEnum.MULTIPLE_CHOICE,
-                        ]
-                    ):
-                        for option in field_to_update.options:
-                            await self.db.delete(option)
-
-                        for i, option_input in enumerate(field_to_update.options):
-                            if i != option_input.option_order:
-                                raise BadRequestError(
-                                    f"Form field options must have continuous orders starting from 0."
-                                    f"Expected order {i}, but got {option_input.option_order}."
-                                )
-
-                            field_option = FieldOption(
-                                form_field_id=field_to_update.form_field_id,
-                                title=option_input.title,
-                                option_order=option_input.option_order,
-                            )
-                            self.db.add(field_option)
-
-                        field_to_update.next_field_id = None
-                        field_to_order = field_to_update
+                if field_update_data.title is not None:
+                    field_to_update.title = field_update_data.title
 
-                else:
-                    # B. Create new field
-                    field_to_order = await self._create_form_field(
-                        FormFieldInput.model_validate(field_update_data)
+                if field_update_data.description is not None:
+                    field_to_update.description = field_update_data.description
+
+                if field_update_data.is_mandatory is not None:
+                    field_to_update.is_mandatory = field_update_data.is_mandatory
+
+                current_options = [
+                    (option.title, option.option_order)
+                    for option in sorted(
+                        field_to_update.options, key=lambda x: x.option_order
                     )
+                ]
+
+                if field_update_data.input_type is not None:
+                    if field_update_data.input_type not in CHOICE_INPUT_TYPES:
+                        if current_options:
+                            options_to_clear.append(field_to_update.form_field_id)
+
+                    field_to_update.input_type = field_update_data.input_type
 
-                if last_field:
-                    last_field.next_field_id = field_to_order.form_field_id
+                if i in fields_options:
+                    options = fields_options[i]
 
-                if i == 0:
-                    first_field_id = field_to_order.form_field_id
+                    if [
+                        (option.title, option.option_order) for option in options
+                    ] != current_options:
+                        options_to_clear.append(field_to_update.form_field_id)
+                        options_to_insert[field_to_update.form_field_id] = options
 
-                last_field = field_to_order
+            # 5. Insert new fields and their options in bulk
+            inserted_fields = iter(
+                await self._insert_form_fields(list(new_fields_input.values()))
+            )
+
+            ordered_fields: List[FormField] = [
+                existing_fields.get(i) or next(inserted_fields)
+                for i in range(len(fields_update))
+            ]
 
-                await self.db.flush()
-                await self.db.refresh(field_to_order)
+            for i in new_fields_input:
+                options = fields_options[i]
 
-            form_pattern.form_field_id = first_field_id
+                if options:
+                    options_to_insert[ordered_fields[i].form_field_id] = options
 
+            await self._delete_field_options(options_to_clear)
+            await self._insert_field_options(options_to_insert)
+
+            # 6. Relink the chain, writing only the fields whose link or position
+            # changed
+            await self._link_form_fields(form_pattern.form_pattern_id, ordered_fields)
+
+            form_pattern.form_field_id = ordered_fields[0].form_field_id
+
+            # 7. Delete the fields left out, once nothing links to them
+            await self._delete_form_fields(update.fields_to_delete)
+
+            await self.db.flush()
             await self.db.refresh(form_pattern)
 
-            fields_chain = await self._get_form_fields_chain(form_pattern.form_field_id)
+            fields_chain = await self._get_form_fields_chain(
+                form_pattern.form_pattern_id
+            )
             fields_read = fields_chain._to_fields_read()
 
             form_pattern_read = FormPatternRead.model_validate(
-                {**form_pattern.to_dict(), "fields": fields_read}
+                loaded(form_pattern, fields=fields_read)
             )
 
             await self.db.commit()
             return form_pattern_read
 
-            # Create new
         except Exception:
             await self.db.rollback()
             raise
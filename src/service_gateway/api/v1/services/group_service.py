@@ -1,13 +1,24 @@
-from typing import List, Optional, Sequence
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import literal_column
+from sqlalchemy import delete, exists, func, insert, literal, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import aliased, selectinload
 
-from src.database.models.access_control.group import Group
-from src.database.models.access_control.user import User
+from src.database.configuration import async_session_factory
+from src.database.models.access_control.group import Group, GroupClosure, UserGroups
+from src.database.models.access_control.user import User, UserInfo
+from src.database.search import contains, similarity
+from src.database.serialization import loaded, type_adapter, validate_all
+from src.database.versions import ResourceVersion, row_version, versions_digest
+from src.service_gateway.api.v1.functions.caches import (
+    groups_tree_cache,
+    groups_tree_key,
+    invalidate_groups_tree,
+)
 from src.service_gateway.api.v1.schemas.access_control.group_schemas import (
     GroupAssignUserInput,
     GroupFilters,
@@ -15,10 +26,22 @@ from src.service_gateway.api.v1.schemas.access_control.group_schemas import (
     GroupQuery,
     GroupRead,
     GroupUpdate,
+    GroupUsersFilters,
+)
+from src.service_gateway.api.v1.schemas.access_control.user_schemas import UserRead
+from src.service_gateway.api.v1.schemas.general.general_schemas import (
+    PaginatedData,
+    Pagination,
 )
 from src.service_gateway.api.v1.services.user_service import UserService
+from src.utils.cursors import decode_datetime_uuid_cursor, encode_cursor
 from src.utils.http_exceptions import BadRequestError
 
+# Key of the advisory lock that serializes changes to the group hierarchy.
+GROUP_HIERARCHY_LOCK = "access_control.group_closure"
+# Separates the version of a cached group tree from its groups.
+GROUP_TREE_SEPARATOR = b"\n"
+
 
 class GroupHierarchy:
     """Class to represent a Group(Model) hierarchy"""
@@ -35,9 +58,11 @@ class GroupHierarchy:
         return f"GroupHierarchy(group={self.group.name}, child_groups={len(self.child_groups)})"
 
     def to_group_read(self) -> GroupRead:
-        return GroupRead(
-            **self.group.to_dict(),
-            child_groups=[group.to_group_read() for group in self.child_groups],
+        return GroupRead.model_validate(
+            loaded(
+                self.group,
+                child_groups=[group.to_group_read() for group in self.child_groups],
+            )
         )
 
 
@@ -62,6 +87,25 @@ class GroupService:
 
         return group
 
+    async def _get_groups_by_ids(self, group_ids: Sequence[UUID]) -> List[Group]:
+        """
+        Fetches `group_ids` in a single query, in the given order, and raises if
+        any of them doesn't exist.
+        """
+        if not group_ids:
+            return []
+
+        result = await self.db.execute(
+            select(Group).where(Group.group_id.in_(group_ids))
+        )
+        groups = {group.group_id: group for group in result.scalars().all()}
+
+        for group_id in group_ids:
+            if group_id not in groups:
+                raise BadRequestError(f"Group with id {group_id} not found")
+
+        return [groups[group_id] for group_id in dict.fromkeys(group_ids)]
+
     async def _get_all_groups(
         self,
         include_users: bool = False,
@@ -73,7 +117,9 @@ class GroupService:
             query = query.options(selectinload(Group.users).joinedload(User.user_info))
 
         if name_like:
-            query = query.where(Group.name.ilike(f"%{name_like}%"))
+            query = query.where(contains(Group.name, name_like)).order_by(
+                similarity(Group.name, term=name_like).desc(), Group.name
+            )
 
         result = await self.db.execute(query)
         groups = result.scalars().all()
@@ -84,33 +130,13 @@ class GroupService:
         self, group_id: UUID, include_users: bool = False
     ) -> Optional[GroupHierarchy]:
         """
-        Recursively retrieves a group with all its children using SQLAlchemy CTE,
-        without modifying the `Group` model, and returns a `GroupHierarchy`.
+        Retrieves a group with its whole subtree, read from `GroupClosure` in a
+        single indexed lookup, and returns a `GroupHierarchy`.
         """
-        group_hierarchy_cte = (
-            select(
-                Group.group_id,
-                Group.name,
-                Group.parent_id,
-                literal_column("0").label("depth"),
-            )
-            .where(Group.group_id == group_id)
-            .cte(name="group_hierarchy", recursive=True)
-        )
-
-        parent_cte_alias = aliased(group_hierarchy_cte, name="parent_cte_alias")
-
-        group_hierarchy_cte = group_hierarchy_cte.union_all(
-            select(
-                Group.group_id,
-                Group.name,
-                Group.parent_id,
-                (parent_cte_alias.c.depth + 1).label("depth"),
-            ).join(parent_cte_alias, Group.parent_id == parent_cte_alias.c.group_id)
-        )
-
-        stmt = select(Group).where(
-            Group.group_id.in_(select(group_hierarchy_cte.c.group_id))
+        stmt = (
+            select(Group)
+            .join(GroupClosure, GroupClosure.descendant_id == Group.group_id)
+            .where(GroupClosure.ancestor_id == group_id)
         )
 
         if include_users:
@@ -132,12 +158,104 @@ class GroupService:
 
         return groups_dict.get(group_id)
 
-    ## Public methods
+    async def _is_in_subtree(self, group_id: UUID, root_id: UUID) -> bool:
+        """Whether `group_id` is `root_id` or one of its descendants."""
+        result = await self.db.execute(
+            select(
+                exists().where(
+                    GroupClosure.ancestor_id == root_id,
+                    GroupClosure.descendant_id == group_id,
+                )
+            )
+        )
 
-    async def get_groups(self, filters: GroupFilters) -> List[GroupRead]:
+        return result.scalar_one()
+
+    async def _lock_group_hierarchy(self) -> None:
+        """
+        Serializes the changes to the hierarchy until the end of the transaction,
+        so that concurrent moves can't build a cycle between them.
+        """
+        await self.db.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(GROUP_HIERARCHY_LOCK)))
+        )
+
+    async def _insert_group_closure(
+        self, group_id: UUID, parent_id: Optional[UUID]
+    ) -> None:
+        """Links the new group `group_id` to itself and every ancestor of its parent."""
+        group_id_literal = literal(group_id, GroupClosure.descendant_id.type)
+
+        links = select(group_id_literal, group_id_literal, literal(0))
+
+        if parent_id is not None:
+            links = union_all(
+                links,
+                select(
+                    GroupClosure.ancestor_id,
+                    group_id_literal,
+                    GroupClosure.depth + 1,
+                ).where(GroupClosure.descendant_id == parent_id),
+            )
+
+        await self.db.execute(
+            insert(GroupClosure).from_select(
+                ["ancestor_id", "descendant_id", "depth"], links
+            )
+        )
+
+    async def _move_group_closure(
+        self, group_id: UUID, parent_id: Optional[UUID]
+    ) -> None:
+        """
+        Detaches the subtree of `group_id` from its former ancestors and links it
+        under `parent_id`, in two statements whatever the size of the subtree.
+        """
+        subtree_ids = select(GroupClosure.descendant_id).where(
+            GroupClosure.ancestor_id == group_id
+        )
+        former_ancestor_ids = select(GroupClosure.ancestor_id).where(
+            GroupClosure.descendant_id == group_id,
+            GroupClosure.ancestor_id != group_id,
+        )
+
+        await self.db.execute(
+            delete(GroupClosure)
+            .where(
+                GroupClosure.descendant_id.in_(subtree_ids),
+                GroupClosure.ancestor_id.in_(former_ancestor_ids),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        if parent_id is None:
+            return
+
+        ancestors = aliased(GroupClosure, name="ancestors")
+        descendants = aliased(GroupClosure, name="descendants")
+
+        await self.db.execute(
+            insert(GroupClosure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(
+                    ancestors.ancestor_id,
+                    descendants.descendant_id,
+                    ancestors.depth + descendants.depth + 1,
+                ).where(
+                    ancestors.descendant_id == parent_id,
+                    descendants.ancestor_id == group_id,
+                ),
+            )
+        )
+
+    async def _get_groups_tree(
+        self,
+        include_users: bool = False,
+        name_like: Optional[str] = None,
+    ) -> List[GroupRead]:
         groups = await self._get_all_groups(
-            include_users=filters.include_users,
-            name_like=filters.name,
+            include_users=include_users,
+            name_like=name_like,
         )
 
         if not groups:
@@ -146,8 +264,8 @@ class GroupService:
         await self.db.flush()
 
         groups_dict = {
-            group.group_id: GroupRead.model_validate(group.to_dict())
-            for group in groups
+            group_read.group_id: group_read
+            for group_read in validate_all(GroupRead, groups)
         }
 
         for group in groups_dict.values():
@@ -168,6 +286,101 @@ class GroupService:
 
         return [group for group in groups_dict.values() if group.parent_id is None]
 
+    async def _get_version(self, filters: GroupFilters) -> ResourceVersion:
+        """Fingerprint of the rows the group tree is built from for `filters`."""
+        group_ids = select(Group.group_id)
+        versions = select(row_version(Group))
+
+        if filters.name:
+            group_ids = group_ids.where(contains(Group.name, filters.name))
+            versions = versions.where(contains(Group.name, filters.name))
+
+        stmt = select(
+            versions_digest(
+                versions,
+                *(
+                    [
+                        select(row_version(UserGroups)).where(
+                            UserGroups.group_id.in_(group_ids)
+                        ),
+                        select(row_version(User))
+                        .join(UserGroups, UserGroups.user_id == User.user_id)
+                        .where(UserGroups.group_id.in_(group_ids)),
+                        select(row_version(UserInfo))
+                        .join(UserGroups, UserGroups.user_id == UserInfo.user_id)
+                        .where(UserGroups.group_id.in_(group_ids)),
+                    ]
+                    if filters.include_users
+                    else []
+                ),
+            )
+        )
+
+        result = await self.db.execute(stmt)
+
+        return ResourceVersion(digest=result.scalar_one())
+
+    async def _dump_group_tree(self, filters: GroupFilters) -> bytes:
+        # The version is read first: if a write lands in between, the tree is
+        # newer than its version, which at worst costs clients a download.
+        version = await self._get_version(filters)
+        groups = await self._get_groups_tree(include_users=filters.include_users)
+
+        return GROUP_TREE_SEPARATOR.join(
+            [
+                version.digest.encode(),
+                type_adapter(List[GroupRead]).dump_json(groups),
+            ]
+        )
+
+    async def _get_cached_group_tree(self, filters: GroupFilters) -> Tuple[str, bytes]:
+        """
+        Version and groups (JSON) of the whole tree, from `groups_tree_cache`.
+        The version is stored ahead of the groups, so it is read without parsing
+        them.
+        """
+
+        async def refresh() -> bytes:
+            async with async_session_factory() as db:
+                return await GroupService(db)._dump_group_tree(filters)
+
+        group_tree = await groups_tree_cache.get_or_load(
+            groups_tree_key(filters.include_users),
+            load=lambda: self._dump_group_tree(filters),
+            refresh=refresh,
+        )
+        version, _, groups = group_tree.partition(GROUP_TREE_SEPARATOR)
+
+        return version.decode(), groups
+
+    ## Public methods
+
+    async def get_groups_version(self, filters: GroupFilters) -> ResourceVersion:
+        """
+        Fingerprint of the rows `get_groups` reads for `filters`. The whole tree
+        is requested on almost every page and rarely changes, so its version is
+        the one of the tree in `groups_tree_cache`: a stale tree never gets the
+        `ETag` of a newer one.
+        """
+        if filters.name:
+            return await self._get_version(filters)
+
+        version, _ = await self._get_cached_group_tree(filters)
+
+        return ResourceVersion(digest=version)
+
+    async def get_groups(self, filters: GroupFilters) -> List[GroupRead]:
+        if filters.name:
+            return await self._get_groups_tree(
+                include_users=filters.include_users,
+                name_like=filters.name,
+            )
+
+        # Read after `get_groups_version`, the cached tree can only be newer.
+        _, groups = await self._get_cached_group_tree(filters)
+
+        return type_adapter(List[GroupRead]).validate_json(groups)
+
     async def get_group(self, group_id: UUID, query: GroupQuery) -> GroupRead:
         group_read: Optional[GroupRead] = None
 
@@ -185,25 +398,80 @@ class GroupService:
                 include_users=query.include_users,
             )
             if group is not None:
-                group_read = GroupRead.model_validate(group.to_dict())
+                group_read = GroupRead.model_validate(loaded(group))
 
         if group_read is None:
             raise BadRequestError("Group not found")
 
         return group_read
 
+    async def get_group_users(
+        self, group_id: UUID, filters: GroupUsersFilters
+    ) -> PaginatedData[UserRead]:
+        """
+        Members of the group, keyset paginated by (created_at, user_id), so
+        large groups are never loaded at once.
+        """
+        group = await self._get_group_by_id(group_id)
+
+        if group is None:
+            raise BadRequestError("Group not found")
+
+        after: Optional[Tuple[datetime, UUID]] = None
+
+        if filters.cursor is not None:
+            after = decode_datetime_uuid_cursor(filters.cursor)
+
+            if after is None:
+                raise BadRequestError("Invalid pagination cursor.")
+
+        user_service = UserService(self.db)
+
+        # One extra row tells whether there is a next page.
+        users = list(
+            await user_service._get_users(
+                include_user_info=filters.include_user_info,
+                group_id=group_id,
+                include_descendant_groups=filters.include_descendants,
+                page_size=filters.page_size + 1,
+                keyset=True,
+                after=after,
+            )
+        )
+
+        next_cursor: Optional[str] = None
+
+        if len(users) > filters.page_size:
+            users = users[: filters.page_size]
+            next_cursor = encode_cursor((users[-1].created_at, users[-1].user_id))
+
+        return PaginatedData(
+            items=validate_all(UserRead, users),
+            pagination=Pagination(
+                size=filters.page_size,
+                next_cursor=next_cursor,
+            ),
+        )
+
     async def create_group(self, input: GroupInput) -> GroupRead:
         try:
             new_group = Group(**input.model_dump())
+
+            if new_group.parent_id is not None:
+                await self._lock_group_hierarchy()
+
             self.db.add(new_group)
 
             await self.db.flush()
+            await self._insert_group_closure(new_group.group_id, new_group.parent_id)
             await self.db.refresh(new_group)
 
-            group_schema = GroupRead.model_validate(new_group)
+            group_schema = GroupRead.model_validate(loaded(new_group))
 
             await self.db.commit()
 
+            await invalidate_groups_tree()
+
             return group_schema
 
         except Exception:
@@ -219,15 +487,38 @@ class GroupService:
 
             group_update_data = input.model_dump(exclude_unset=True)
 
+            is_moved = (
+                "parent_id" in group_update_data
+                and group_update_data["parent_id"] != group.parent_id
+            )
+
+            if is_moved:
+                await self._lock_group_hierarchy()
+
+                parent_id = group_update_data["parent_id"]
+
+                if parent_id is not None and await self._is_in_subtree(
+                    parent_id, root_id=group_id
+                ):
+                    raise BadRequestError(
+                        "A group can't be moved under itself or one of its descendants"
+                    )
+
             for key, value in group_update_data.items():
                 setattr(group, key, value)
 
+            if is_moved:
+                await self.db.flush()
+                await self._move_group_closure(group_id, group.parent_id)
+
             await self.db.refresh(group)
 
-            group_read = GroupRead.model_validate(group)
+            group_read = GroupRead.model_validate(loaded(group))
 
             await self.db.commit()
 
+            await invalidate_groups_tree()
+
             return group_read
 
         except Exception:
@@ -236,7 +527,7 @@ class GroupService:
 
     async def assign_user_to_group(self, input: GroupAssignUserInput) -> GroupRead:
         try:
-            group = await self._get_group_by_id(input.group_id, include_users=True)
+            group = await self._get_group_by_id(input.group_id)
 
             if group is None:
                 raise BadRequestError("User or Group not found")
@@ -248,15 +539,19 @@ class GroupService:
             if user is None:
                 raise BadRequestError("User or Group not found")
 
-            group.users.append(user)
-
-            await self.db.flush()
-            await self.db.refresh(group)
+            # Adds the membership without loading the members of the group.
+            await self.db.execute(
+                pg_insert(UserGroups)
+                .values(user_id=user.user_id, group_id=group.group_id)
+                .on_conflict_do_nothing()
+            )
 
-            group_read = GroupRead.model_validate(group.to_dict())
+            group_read = GroupRead.model_validate(loaded(group))
 
             await self.db.commit()
 
+            await invalidate_groups_tree()
+
             return group_read
 
         except Exception:
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, NamedTuple, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.database.models.access_control.refresh_token import RefreshToken
+from src.service_gateway.api.v1.services.user_service import UserService
+from src.service_gateway.security.authentication import (
+    REFRESH_TOKEN_EXPIRATION_IN_DAYS,
+    generate_refresh_token,
+    hash_refresh_token,
+)
+from src.service_gateway.security.revocation import revoked_sessions
+from src.utils.http_exceptions import AuthenticationError
+
+
+class RotatedSession(NamedTuple):
+    user_id: UUID
+    roles: List[str]
+    session_id: UUID
+    refresh_token: str
+
+
+class RefreshTokenService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db: AsyncSession = db
+
+    ## Friendly methods
+
+    async def _get_refresh_token_for_update(self, token: str) -> Optional[RefreshToken]:
+        # The row lock serializes concurrent refreshes of the same token, the
+        # second one sees it used and is handled as a reuse.
+        result = await self.db.execute(
+            select(RefreshToken)
+            .where(RefreshToken.token_hash == hash_refresh_token(token))
+            .with_for_update()
+        )
+
+        return result.scalars().first()
+
+    def _add_refresh_token(self, user_id: UUID, session_id: UUID) -> str:
+        token = generate_refresh_token()
+        expires_at = datetime.now(timezone.utc) + timedelta(
+            days=REFRESH_TOKEN_EXPIRATION_IN_DAYS
+        )
+
+        self.db.add(
+            RefreshToken(
+                session_id=session_id,
+                user_id=user_id,
+                token_hash=hash_refresh_token(token),
+                expires_at=expires_at.replace(tzinfo=None),
+            )
+        )
+
+        return token
+
+    ## Public methods
+
+    async def create_session(self, user_id: UUID) -> Tuple[UUID, str]:
+        session_id = uuid4()
+
+        try:
+            token = self._add_refresh_token(user_id, session_id)
+
+            await self.db.commit()
+
+        except Exception:
+            await self.db.rollback()
+
+            raise
+
+        return session_id, token
+
+    async def rotate_refresh_token(self, token: str) -> RotatedSession:
+        """
+        Exchanges a refresh token for a new one of the same session. A token is
+        valid once: presenting it again revokes its whole session.
+        """
+        refresh_token = await self._get_refresh_token_for_update(token)
+
+        if refresh_token is None or refresh_token.revoked_at is not None:
+            await self.db.rollback()
+            raise AuthenticationError("Invalid refresh token")
+
+        user_id = refresh_token.user_id
+        session_id = refresh_token.session_id
+
+        if refresh_token.used_at is not None:
+            await self.revoke_session(session_id)
+            raise AuthenticationError("Refresh token already used, session revoked")
+
+        if refresh_token.expires_at.replace(tzinfo=timezone.utc) < datetime.now(
+            timezone.utc
+        ):
+            await self.db.rollback()
+            raise AuthenticationError("Refresh token expired")
+
+        user_service = UserService(self.db)
+
+        if await user_service._get_user(by="id", value=user_id) is None:
+            await self.revoke_session(session_id)
+            raise AuthenticationError("Invalid refresh token")
+
+        try:
+            refresh_token.used_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
+            new_token = self._add_refresh_token(user_id, session_id)
+
+            roles = [role.value for role in await user_service._get_user_roles(user_id)]
+
+            await self.db.commit()
+
+        except Exception:
+            await self.db.rollback()
+
+            raise
+
+        return RotatedSession(
+            user_id=user_id,
+            roles=roles,
+            session_id=session_id,
+            refresh_token=new_token,
+        )
+
+    async def revoke_session(self, session_id: UUID) -> None:
+        try:
+            await self.db.execute(
+                update(RefreshToken)
+                .where(
+                    RefreshToken.session_id == session_id,
+                    RefreshToken.revoked_at.is_(None),
+                )
+                .values(revoked_at=func.now())
+            )
+
+            await self.db.commit()
+
+        except Exception:
+            await self.db.rollback()
+
+            raise
+
+        # Applied at once in this worker, the others pick it up on their sync.
+        revoked_sessions.add([session_id])
@@ -1,41 +1,65 @@
 from collections import Counter
 from datetime import datetime, timezone
-from typing import List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypeVar
 from uuid import UUID
 
+from sqlalchemy import Integer, Select, Text, all_, cast, delete, func, literal
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from src.database.models.access_control.group import Group
 from src.database.models.workflow.activity import (
     Activity,
     ActivityAssignees,
     ActivityFieldDisplay,
 )
 from src.database.models.workflow.enums import AssigneeEnum, InputTypeEnum
-from src.database.models.workflow.request_pattern import RequestPattern
+from src.database.models.workflow.form_pattern import FormPattern
+from src.database.models.workflow.request_pattern import (
+    RequestGroups,
+    RequestPattern,
+    RequestPatternSnapshot,
+)
+from src.database.search import contains, similarity
+from src.database.serialization import loaded, type_adapter, validate_all
+from src.database.versions import ResourceVersion, row_version, versions_digest
+from src.service_gateway.api.v1.schemas.workflow.activity_asignees_schemas import (
+    ActivityAsigneesInput,
+)
 from src.service_gateway.api.v1.schemas.workflow.activity_fields_shemas import (
     ActivityFieldsInput,
     ActivityFieldsRead,
     FieldDisplayRead,
 )
+from src.service_gateway.api.v1.schemas.workflow.activity_schemas import ActivityRead
 from src.service_gateway.api.v1.schemas.workflow.form_field_schemas import FormFieldRead
 from src.service_gateway.api.v1.schemas.workflow.form_pattern_schemas import (
     FormPatternInput,
     FormPatternRead,
 )
 from src.service_gateway.api.v1.schemas.workflow.request_pattern_schemas import (
+    REQUEST_PATTERN_SNAPSHOT_VERSION,
+    PublishViolation,
     RequestPatternFilters,
     RequestPatternInput,
     RequestPatternQuery,
     RequestPatternRead,
+    RequestPatternSnapshotDocument,
     RequestPatternUpdate,
 )
-from src.service_gateway.api.v1.services.activity_service import ActivityService
+from src.service_gateway.api.v1.services.activity_service import (
+    ActivitiesChain,
+    ActivityService,
+)
 from src.service_gateway.api.v1.services.form_pattern_service import FormPatternService
 from src.service_gateway.api.v1.services.group_service import GroupService
 from src.utils.http_exceptions import BadRequestError, NotFoundError
 
+T = TypeVar("T", bound=tuple)
+
 
 class RequestPatternService:
     def __init__(self, db: AsyncSession):
@@ -60,30 +84,53 @@ class RequestPatternService:
 
         return request_pattern
 
-    async def _get_request_patterns(
+    def _filter_request_patterns_query(
         self,
+        query: Select[T],
+        *,
         label: Optional[str] = None,
         supervisor_id: Optional[UUID] = None,
         is_published: Optional[bool] = None,
         is_active: Optional[bool] = None,
-        include_groups: bool = False,
-    ) -> Sequence[RequestPattern]:
-        stmt = select(RequestPattern)
-
+    ) -> Select[T]:
         if label:
-            stmt = stmt.where(RequestPattern.label.ilike(f"%{label}%"))
+            query = query.where(contains(RequestPattern.label, label))
 
         if supervisor_id:
-            stmt = stmt.where(RequestPattern.supervisor_id == supervisor_id)
+            query = query.where(RequestPattern.supervisor_id == supervisor_id)
 
         if is_published is not None:
             if is_published:
-                stmt = stmt.where(RequestPattern.published_at.isnot(None))
+                query = query.where(RequestPattern.published_at.isnot(None))
             else:
-                stmt = stmt.where(RequestPattern.published_at.is_(None))
+                query = query.where(RequestPattern.published_at.is_(None))
 
         if is_active is not None:
-            stmt = stmt.where(RequestPattern.is_active.is_(is_active))
+            query = query.where(RequestPattern.is_active.is_(is_active))
+
+        return query
+
+    async def _get_request_patterns(
+        self,
+        label: Optional[str] = None,
+        supervisor_id: Optional[UUID] = None,
+        is_published: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        include_groups: bool = False,
+    ) -> Sequence[RequestPattern]:
+        stmt = self._filter_request_patterns_query(
+            select(RequestPattern),
+            label=label,
+            supervisor_id=supervisor_id,
+            is_published=is_published,
+            is_active=is_active,
+        )
+
+        if label:
+            stmt = stmt.order_by(
+                similarity(RequestPattern.label, term=label).desc(),
+                RequestPattern.label,
+            )
 
         if include_groups:
             stmt = stmt.options(selectinload(RequestPattern.groups))
@@ -93,6 +140,335 @@ class RequestPatternService:
 
         return request_patterns
 
+    def _request_patterns_versions(
+        self,
+        request_pattern_ids: Any,
+        include_groups: bool = False,
+        include_activities: bool = False,
+    ) -> List[Select[Tuple[str]]]:
+        """
+        `row_version` selects of the rows, other than the request patterns
+        themselves, that the representation of `request_pattern_ids` (a value or
+        a subquery) is built from.
+        """
+        versions = [
+            select(row_version(RequestPatternSnapshot)).where(
+                RequestPatternSnapshot.request_pattern_id.in_(request_pattern_ids)
+            )
+        ]
+
+        if include_groups:
+            versions += [
+                select(row_version(RequestGroups)).where(
+                    RequestGroups.request_pattern_id.in_(request_pattern_ids)
+                ),
+                select(row_version(Group))
+                .join(RequestGroups, RequestGroups.group_id == Group.group_id)
+                .where(RequestGroups.request_pattern_id.in_(request_pattern_ids)),
+            ]
+
+        if include_activities:
+            versions += [
+                select(row_version(Activity)).where(
+                    Activity.request_pattern_id.in_(request_pattern_ids)
+                ),
+                select(row_version(ActivityAssignees))
+                .join(Activity, Activity.activity_id == ActivityAssignees.activity_id)
+                .where(Activity.request_pattern_id.in_(request_pattern_ids)),
+            ]
+
+        return versions
+
+    async def _get_snapshot(
+        self, request_pattern_id: UUID
+    ) -> Optional[RequestPatternSnapshotDocument]:
+        stmt = select(RequestPatternSnapshot.document).where(
+            RequestPatternSnapshot.request_pattern_id == request_pattern_id,
+            RequestPatternSnapshot.version == REQUEST_PATTERN_SNAPSHOT_VERSION,
+        )
+
+        result = await self.db.execute(stmt)
+        document = result.scalar_one_or_none()
+
+        if document is None:
+            return None
+
+        return RequestPatternSnapshotDocument.model_validate(document)
+
+    async def _get_snapshots_activities(
+        self, request_pattern_ids: Sequence[UUID]
+    ) -> Dict[UUID, List[ActivityRead]]:
+        if not request_pattern_ids:
+            return {}
+
+        stmt = select(
+            RequestPatternSnapshot.request_pattern_id,
+            RequestPatternSnapshot.document["request_pattern"]["activities"],
+        ).where(
+            RequestPatternSnapshot.request_pattern_id.in_(request_pattern_ids),
+            RequestPatternSnapshot.version == REQUEST_PATTERN_SNAPSHOT_VERSION,
+        )
+
+        result = await self.db.execute(stmt)
+        activities_adapter = type_adapter(List[ActivityRead])
+
+        return {
+            request_pattern_id: activities_adapter.validate_python(activities or [])
+            for request_pattern_id, activities in result.all()
+        }
+
+    async def _get_fields_display(
+        self, activity_ids: Sequence[int]
+    ) -> Dict[int, List[int]]:
+        stmt = select(
+            ActivityFieldDisplay.activity_id, ActivityFieldDisplay.form_field_id
+        ).where(ActivityFieldDisplay.activity_id.in_(activity_ids))
+
+        result = await self.db.execute(stmt)
+
+        fields_display: Dict[int, List[int]] = {}
+
+        for activity_id, form_field_id in result.all():
+            fields_display.setdefault(activity_id, []).append(form_field_id)
+
+        return fields_display
+
+    async def _get_upstream_fields(
+        self, activities_chain: ActivitiesChain, activity_id: int
+    ) -> List[Tuple[ActivityRead, List[FormFieldRead]]]:
+        """
+        Every activity before `activity_id` with the fields of its form pattern.
+        The field chains are read in one batch, whatever the number of steps.
+        Activities whose form pattern has no fields are left out.
+        """
+        upstream_activities: List[ActivityRead] = []
+
+        for activity_read in activities_chain._to_activities_read():
+            if activity_read.activity_id == activity_id:
+                break
+
+            upstream_activities.append(activity_read)
+
+        fields_chains = await FormPatternService(self.db)._get_form_fields_chains(
+            [
+                activity_read.form_pattern_id
+                for activity_read in upstream_activities
+                if activity_read.form_pattern_id
+            ]
+        )
+
+        upstream_fields: List[Tuple[ActivityRead, List[FormFieldRead]]] = []
+
+        for activity_read in upstream_activities:
+            fields_read: List[FormFieldRead] = []
+
+            if activity_read.form_pattern_id:
+                fields_chain = fields_chains.get(activity_read.form_pattern_id)
+
+                if fields_chain is None:
+                    continue
+
+                fields_read = fields_chain._to_fields_read()
+
+            upstream_fields.append((activity_read, fields_read))
+
+        return upstream_fields
+
+    async def _set_fields_display(
+        self, activity_id: int, form_field_ids: Sequence[int]
+    ) -> None:
+        """
+        Replaces the fields displayed on `activity_id` in a single statement:
+        rows no longer selected are deleted in a CTE, new ones are inserted and
+        the ones that don't change are left untouched.
+        """
+        # Bound as one array, so the statement is the same for any selection.
+        form_field_ids_array = literal(list(form_field_ids), ARRAY(Integer))
+
+        deleted = (
+            delete(ActivityFieldDisplay)
+            .where(
+                ActivityFieldDisplay.activity_id == activity_id,
+                ActivityFieldDisplay.form_field_id != all_(form_field_ids_array),
+            )
+            .returning(ActivityFieldDisplay.form_field_id)
+            .cte("deleted")
+        )
+
+        stmt = (
+            pg_insert(ActivityFieldDisplay)
+            .from_select(
+                ["activity_id", "form_field_id"],
+                select(
+                    literal(activity_id, Integer),
+                    func.unnest(form_field_ids_array),
+                ),
+            )
+            .on_conflict_do_nothing()
+            .add_cte(deleted)
+        )
+
+        await self.db.execute(stmt)
+
+    def _get_activity_fields_from_snapshot(
+        self,
+        snapshot: RequestPatternSnapshotDocument,
+        request_pattern_id: UUID,
+        activity_id: int,
+    ) -> List[ActivityFieldsRead]:
+        activities_read = snapshot.request_pattern.activities or []
+
+        if not any(
+            activity_read.activity_id == activity_id
+            for activity_read in activities_read
+        ):
+            raise NotFoundError(
+                f"Activity with id {activity_id} not found in request pattern with id {request_pattern_id}"
+            )
+
+        actual_fields_display_ids = snapshot.fields_display.get(activity_id, [])
+
+        activities_fields_read = []
+
+        for activity_read in activities_read:
+            if activity_read.activity_id == activity_id:
+                break
+
+            form_pattern_read = (
+                snapshot.form_patterns.get(activity_read.form_pattern_id)
+                if activity_read.form_pattern_id
+                else None
+            )
+            fields_read = form_pattern_read.fields if form_pattern_read else []
+
+            activities_fields_read.append(
+                ActivityFieldsRead(
+                    activity_id=activity_read.activity_id,
+                    activity_order=activity_read.activity_order,
+                    label=activity_read.label,
+                    fields=[
+                        FieldDisplayRead.model_validate(
+                            dict(
+                                **field.model_dump(),
+                                selected=field.form_field_id
+                                in actual_fields_display_ids,
+                            )
+                        )
+                        for field in fields_read
+                    ],
+                )
+            )
+
+        return activities_fields_read
+
+    def _get_publish_violations(
+        self,
+        activities_read: Sequence[ActivityRead],
+        form_patterns: Dict[int, FormPattern],
+        fields_reads: Dict[int, List[FormFieldRead]],
+    ) -> List[PublishViolation]:
+        """Checks every publishing rule in memory and returns all the violations."""
+        violations: List[PublishViolation] = []
+        form_pattern_activities: Dict[int, int] = {}
+
+        for activity_read in activities_read:
+            activity_id = activity_read.activity_id
+            assignee = activity_read.assignee
+
+            def violation(msg: str, **location: Any) -> None:
+                violations.append(
+                    PublishViolation(activity_id=activity_id, msg=msg, **location)
+                )
+
+            if not assignee:
+                violation("Activity must have an assignee")
+            else:
+                if (
+                    activity_read is activities_read[0]
+                    and assignee.assignee_type != AssigneeEnum.REQUESTER
+                ):
+                    violation("First activity must have a 'requester' assignee")
+
+                if assignee.assignee_type == AssigneeEnum.REQUESTER:
+                    if assignee.user_id or assignee.group_id:
+                        violation(
+                            "Assignee type is 'requester' and must not have user_id or group_id"
+                        )
+                elif assignee.assignee_type == AssigneeEnum.USER:
+                    if not assignee.user_id:
+                        violation("Assignee type is 'user' and must have user_id")
+                    if assignee.group_id:
+                        violation("Assignee type is 'user' and must not have group_id")
+                elif assignee.assignee_type == AssigneeEnum.GROUP:
+                    if not assignee.group_id:
+                        violation("Assignee type is 'group' and must have group_id")
+                    if assignee.user_id:
+                        violation("Assignee type is 'group' and must not have user_id")
+
+            form_pattern_id = activity_read.form_pattern_id
+
+            if not form_pattern_id:
+                violation("Activity does not have a form pattern")
+                continue
+
+            form_pattern = form_patterns.get(form_pattern_id)
+
+            if form_pattern is None:
+                violation("Form pattern not found", form_pattern_id=form_pattern_id)
+                continue
+
+            if form_pattern.is_published:
+                violation(
+                    "Form pattern is already published",
+                    form_pattern_id=form_pattern_id,
+                )
+
+            if form_pattern_id in form_pattern_activities:
+                violation(
+                    "Form pattern is already used by activity with id "
+                    f"{form_pattern_activities[form_pattern_id]}",
+                    form_pattern_id=form_pattern_id,
+                )
+                continue
+
+            form_pattern_activities[form_pattern_id] = activity_id
+
+            fields_read = fields_reads.get(form_pattern_id)
+
+            if not fields_read:
+                violation("Form pattern has no fields", form_pattern_id=form_pattern_id)
+                continue
+
+            for field_read in fields_read:
+                location = {
+                    "form_pattern_id": form_pattern_id,
+                    "form_field_id": field_read.form_field_id,
+                }
+
+                if field_read.form_field_order == 0:
+                    if field_read.input_type != InputTypeEnum.SECTION:
+                        violation("Field in order 0 must be a section", **location)
+                elif field_read.form_field_order == 1:
+                    if field_read.input_type == InputTypeEnum.SECTION:
+                        violation("Field in order 1 must not be a section", **location)
+
+                options_length = len(field_read.options) if field_read.options else 0
+
+                if field_read.input_type == InputTypeEnum.SINGLE_CHOICE:
+                    if options_length < 2:
+                        violation(
+                            "Single choice field must have at least 2 options",
+                            **location,
+                        )
+                elif field_read.input_type == InputTypeEnum.MULTIPLE_CHOICE:
+                    if options_length < 1:
+                        violation(
+                            "Multiple choice field must have at least 1 option",
+                            **location,
+                        )
+
+        return violations
+
     ## Public methods
 
     async def create_request_pattern(
@@ -103,9 +479,6 @@ class RequestPatternService:
         try:
             activities_input = sorted(input.activities, key=lambda x: x.activity_order)
 
-            first_activity_id: int = 0
-            last_activity: Optional[Activity] = None
-
             if len(activities_input) == 0:
                 raise BadRequestError(
                     "At least one activity with 'requester' assignee is required"
@@ -122,87 +495,66 @@ class RequestPatternService:
                         f"Activity order must be continuous. Found {activity_input.activity_order} and {i}"
                     )
 
-                new_activity = Activity(
-                    label=activity_input.label,
-                    description=activity_input.description,
-                )
-
-                if activity_input.estimated_time:
-                    new_activity.estimated_time = activity_input.estimated_time
+            first_activity_input = activities_input[0]
 
-                self.db.add(new_activity)
-                await self.db.flush()
-                await self.db.refresh(new_activity)
+            if not first_activity_input.assignee:
+                raise BadRequestError(
+                    f"Assignee is required for the first activity {first_activity_input.label}"
+                )
+            if first_activity_input.assignee.assignee_type != AssigneeEnum.REQUESTER:
+                raise BadRequestError(
+                    f"Assignee type must be 'requester' for the first activity {first_activity_input.label}"
+                )
 
-                assignee_input = activity_input.assignee
+            # Activities, assignees and links are written with one statement each,
+            # whatever the length of the chain.
+            new_activities = await activity_service._insert_activities(activities_input)
 
-                if assignee_input:
-                    activity_assignee = ActivityAssignees(
-                        activity_id=new_activity.activity_id,
-                        assignee_type=assignee_input.assignee_type,
-                        user_id=assignee_input.user_id,
-                        group_id=assignee_input.group_id,
+            await activity_service._upsert_assignees(
+                {
+                    activity.activity_id: activity_input.assignee
+                    for activity, activity_input in zip(
+                        new_activities, activities_input
                     )
-
-                    new_activity.assignee = activity_assignee
-                    await self.db.flush()
-                    await self.db.refresh(activity_assignee)
-
-                if last_activity:
-                    last_activity.next_activity_id = new_activity.activity_id
-
-                if i == 0:
-                    first_activity_id = new_activity.activity_id
-
-                    if not activity_input.assignee:
-                        raise BadRequestError(
-                            f"Assignee is required for the first activity {activity_input.label}"
-                        )
-                    if activity_input.assignee.assignee_type != AssigneeEnum.REQUESTER:
-                        raise BadRequestError(
-                            f"Assignee type must be 'requester' for the first activity {activity_input.label}"
-                        )
-
-                last_activity = new_activity
-
-                await self.db.flush()
-                await self.db.refresh(new_activity)
+                    if activity_input.assignee
+                }
+            )
 
             request_pattern = RequestPattern(
                 label=input.label,
                 description=input.description,
                 supervisor_id=input.supervisor_id,
-                activity_id=first_activity_id,
+                activity_id=new_activities[0].activity_id,
                 published_at=None,
             )
 
             group_service = GroupService(self.db)
-
-            for group_id in input.groups:
-                group = await group_service._get_group_by_id(group_id)
-
-                if not group:
-                    raise BadRequestError(f"Group with id {group_id} not found")
-
-                request_pattern.groups.append(group)
-            else:
-                request_pattern.groups = []
+            request_pattern.groups = await group_service._get_groups_by_ids(
+                input.groups
+            )
 
             self.db.add(request_pattern)
             await self.db.flush()
+
+            # The activities point back to their request pattern, so the chain is
+            # linked once the request pattern row exists.
+            await activity_service._link_activities(
+                request_pattern.request_pattern_id, new_activities
+            )
+
             await self.db.refresh(
                 request_pattern, attribute_names=["groups", "supervisor"]
             )
 
             activities_chain = await activity_service._get_activities_chain(
-                first_activity_id=request_pattern.activity_id
+                request_pattern_id=request_pattern.request_pattern_id
             )
 
-            request_pattern_dict = request_pattern.to_dict()
-            request_pattern_dict["activities"] = activities_chain._to_activities_read()
-
             request_pattern_read = RequestPatternRead.model_validate(
-                request_pattern_dict
+                loaded(
+                    request_pattern,
+                    activities=activities_chain._to_activities_read(),
+                )
             )
 
             await self.db.commit()
@@ -230,20 +582,142 @@ class RequestPatternService:
 
         if query.include_activities:
             activities_chain = await activity_service._get_activities_chain(
-                first_activity_id=request_pattern.activity_id
+                request_pattern_id=request_pattern.request_pattern_id
             )
         else:
             activities_chain = None
 
-        request_pattern_dict = request_pattern.to_dict()
-
         if activities_chain is not None:
-            request_pattern_dict["activities"] = activities_chain._to_activities_read()
+            request_pattern_attributes = loaded(
+                request_pattern,
+                activities=activities_chain._to_activities_read(),
+            )
+        else:
+            request_pattern_attributes = loaded(request_pattern)
 
-        request_pattern_read = RequestPatternRead.model_validate(request_pattern_dict)
+        request_pattern_read = RequestPatternRead.model_validate(
+            request_pattern_attributes
+        )
 
         return request_pattern_read
 
+    async def get_published_request_pattern_json(
+        self, request_pattern_id: UUID, query: RequestPatternQuery
+    ) -> Optional[str]:
+        """
+        Returns the JSON of the `RequestPatternRead` of a published request pattern,
+        built by Postgres from its snapshot in a single primary key lookup, or
+        `None` when the request pattern has no snapshot.
+        """
+        data = RequestPatternSnapshot.document["request_pattern"]
+        overrides: Dict[str, Any] = {}
+
+        if query.include_groups:
+            # Groups are read live, their names can change after publishing
+            groups = (
+                select(
+                    func.coalesce(
+                        func.jsonb_agg(
+                            func.jsonb_build_object(
+                                "group_id", Group.group_id, "name", Group.name
+                            )
+                        ),
+                        literal([], JSONB),
+                    )
+                )
+                .join(RequestGroups, RequestGroups.group_id == Group.group_id)
+                .where(
+                    RequestGroups.request_pattern_id
+                    == RequestPatternSnapshot.request_pattern_id
+                )
+                .scalar_subquery()
+            )
+            data = data.op("||", return_type=JSONB)(
+                func.jsonb_build_object("groups", groups)
+            )
+
+        if not query.include_activities:
+            overrides["activities"] = None
+
+        if overrides:
+            data = data.op("||", return_type=JSONB)(literal(overrides, JSONB))
+
+        stmt = select(cast(data, Text)).where(
+            RequestPatternSnapshot.request_pattern_id == request_pattern_id,
+            RequestPatternSnapshot.version == REQUEST_PATTERN_SNAPSHOT_VERSION,
+        )
+
+        result = await self.db.execute(stmt)
+
+        return result.scalar_one_or_none()
+
+    async def get_request_pattern_version(
+        self, request_pattern_id: UUID, query: RequestPatternQuery
+    ) -> Optional[ResourceVersion]:
+        """
+        Fingerprint of the rows `get_request_pattern` reads, computed without
+        loading them. Published request patterns are immutable unless their
+        groups, which are read live, are included.
+        """
+        stmt = select(
+            RequestPattern.published_at,
+            func.concat_ws(
+                ",",
+                row_version(RequestPattern),
+                versions_digest(
+                    *self._request_patterns_versions(
+                        [request_pattern_id],
+                        include_groups=query.include_groups,
+                        include_activities=query.include_activities,
+                    )
+                ),
+            ),
+        ).where(RequestPattern.request_pattern_id == request_pattern_id)
+
+        result = await self.db.execute(stmt)
+        row = result.first()
+
+        if row is None:
+            return None
+
+        published_at, digest = row
+
+        return ResourceVersion(
+            digest=digest,
+            immutable=published_at is not None and not query.include_groups,
+        )
+
+    async def get_request_patterns_version(
+        self, filters: RequestPatternFilters
+    ) -> ResourceVersion:
+        """Fingerprint of the rows `get_request_patterns` reads for `filters`."""
+        filter_kwargs: Dict[str, Any] = dict(
+            label=filters.label,
+            supervisor_id=filters.supervisor_id,
+            is_published=filters.is_published,
+            is_active=filters.is_active,
+        )
+        request_pattern_ids = self._filter_request_patterns_query(
+            select(RequestPattern.request_pattern_id), **filter_kwargs
+        )
+
+        stmt = select(
+            versions_digest(
+                self._filter_request_patterns_query(
+                    select(row_version(RequestPattern)), **filter_kwargs
+                ),
+                *self._request_patterns_versions(
+                    request_pattern_ids,
+                    include_groups=filters.include_groups,
+                    include_activities=filters.include_activities,
+                ),
+            )
+        )
+
+        result = await self.db.execute(stmt)
+
+        return ResourceVersion(digest=result.scalar_one())
+
     async def get_request_patterns(
         self,
         filters: RequestPatternFilters,
@@ -261,26 +735,41 @@ class RequestPatternService:
         if filters.include_activities:
             request_patterns_read = []
 
+            # Published request patterns take their activities from their
+            # snapshots, only the rest have their chains read.
+            snapshots_activities = await self._get_snapshots_activities(
+                [
+                    request_pattern.request_pattern_id
+                    for request_pattern in request_patterns
+                    if request_pattern.is_published
+                ]
+            )
+
+            activities_chains = await activity_service._get_activities_chains(
+                request_pattern_ids=[
+                    request_pattern.request_pattern_id
+                    for request_pattern in request_patterns
+                    if request_pattern.request_pattern_id not in snapshots_activities
+                ]
+            )
+
             for request_pattern in request_patterns:
-                activities_chain = await activity_service._get_activities_chain(
-                    first_activity_id=request_pattern.activity_id
+                activities_read = snapshots_activities.get(
+                    request_pattern.request_pattern_id
                 )
 
-                request_pattern_dict = request_pattern.to_dict()
-                request_pattern_dict["activities"] = (
-                    activities_chain._to_activities_read()
-                )
+                if activities_read is None:
+                    activities_read = activities_chains.get(
+                        request_pattern.request_pattern_id, ActivitiesChain()
+                    )._to_activities_read()
 
                 request_patterns_read.append(
                     RequestPatternRead.model_validate(
-                        request_pattern_dict, strict=False
+                        loaded(request_pattern, activities=activities_read)
                     )
                 )
         else:
-            request_patterns_read = [
-                RequestPatternRead.model_validate(request_pattern.to_dict())
-                for request_pattern in request_patterns
-            ]
+            request_patterns_read = validate_all(RequestPatternRead, request_patterns)
 
         return request_patterns_read
 
@@ -290,7 +779,10 @@ class RequestPatternService:
         activity_service = ActivityService(self.db)
 
         try:
-            request_pattern = await self._get_request_pattern_by_id(request_pattern_id)
+            request_pattern = await self._get_request_pattern_by_id(
+                request_pattern_id,
+                include_groups=bool(update.groups),
+            )
             if request_pattern is None:
                 raise BadRequestError("Request pattern not found")
 
@@ -306,13 +798,10 @@ class RequestPatternService:
 
             # B. Update groups if provided
             if update.groups:
-                request_pattern.groups.clear()
                 group_service = GroupService(self.db)
-                for group_id in update.groups:
-                    group = await group_service._get_group_by_id(group_id)
-                    if not group:
-                        raise BadRequestError(f"Group with id {group_id} not found")
-                    request_pattern.groups.append(group)
+                request_pattern.groups = await group_service._get_groups_by_ids(
+                    update.groups
+                )
 
             # C. Replace activity chain if provided
             if update.activities:
@@ -332,7 +821,7 @@ class RequestPatternService:
 
                 # 1. Get actual activitie chain
                 last_activities_chain = await activity_service._get_activities_chain(
-                    first_activity_id=request_pattern.activity_id
+                    request_pattern_id=request_pattern.request_pattern_id
                 )
 
                 # 2. Validate activities
@@ -357,23 +846,7 @@ class RequestPatternService:
                         "Activity ids to delete must be unique and match the existing activities"
                     )
 
-                # 3. Delete activities if provided
-                for activity_id in update.activities_to_delete:
-                    activity_to_delete = last_activities_chain._get_activity_by_id(
-                        activity_id
-                    )
-                    if not activity_to_delete:
-                        raise BadRequestError(
-                            f"Activity with id {activity_id} not found"
-                        )
-
-                    await self.db.delete(activity_to_delete)
-
-                await self.db.flush()
-
-                # 4. Create new activity chain
-                first_activity_id = 0
-                last_activity = None
+                existing_activities: Dict[int, Activity] = {}
 
                 for i, activity_update in enumerate(activities_update):
                     if i != activity_update.activity_order:
@@ -381,8 +854,6 @@ class RequestPatternService:
                             f"Activity order must be continuous. Found {activity_update.activity_order} and {i}"
                         )
 
-                    activity_to_order: Optional[Activity] = None
-
                     if activity_update.activity_id:
                         activity_on_pattern = last_activities_chain._get_activity_by_id(
                             activity_update.activity_id
@@ -393,101 +864,102 @@ class RequestPatternService:
                                 f"Activity with id {activity_update.activity_id} not found on Request-Pattern"
                             )
 
-                        # Update simple activity fields if provided
-                        if activity_update.label:
-                            activity_on_pattern.label = activity_update.label
+                        existing_activities[i] = activity_on_pattern
 
-                        if activity_update.description:
-                            activity_on_pattern.description = (
-                                activity_update.description
-                            )
+                    elif not (activity_update.label and activity_update.description):
+                        raise BadRequestError(
+                            "New activity must have label and description"
+                        )
 
-                        if activity_update.estimated_time:
-                            activity_on_pattern.estimated_time = (
-                                activity_update.estimated_time
-                            )
+                first_activity_update = activities_update[0]
+                first_assignee_type = (
+                    first_activity_update.assignee.assignee_type
+                    if first_activity_update.assignee
+                    else (
+                        existing_activities[0].assignee.assignee_type
+                        if 0 in existing_activities and existing_activities[0].assignee
+                        else None
+                    )
+                )
 
-                        if activity_update.assignee:
-                            if activity_on_pattern.assignee:
-                                activity_on_pattern.assignee.assignee_type = (
-                                    activity_update.assignee.assignee_type
-                                )
-                                activity_on_pattern.assignee.user_id = (
-                                    activity_update.assignee.user_id
-                                )
-                                activity_on_pattern.assignee.group_id = (
-                                    activity_update.assignee.group_id
-                                )
-                            else:
-                                activity_on_pattern.assignee = ActivityAssignees(
-                                    activity_id=activity_on_pattern.activity_id,
-                                    assignee_type=activity_update.assignee.assignee_type,
-                                    user_id=activity_update.assignee.user_id,
-                                    group_id=activity_update.assignee.group_id,
-                                )
-
-                            await self.db.flush()
-                            await self.db.refresh(activity_on_pattern.assignee)
-
-                        activity_on_pattern.next_activity_id = None
-                        activity_to_order = activity_on_pattern
-
-                    else:
-                        if not (activity_update.label and activity_update.description):
-                            raise BadRequestError(
-                                "New activity must have label and description"
-                            )
+                if first_assignee_type is None:
+                    raise BadRequestError(
+                        f"Assignee is required for the first activity '{first_activity_update.label}'"
+                    )
+                if first_assignee_type != AssigneeEnum.REQUESTER:
+                    raise BadRequestError(
+                        f"Assignee type must be 'requester' for the first activity '{first_activity_update.label}'"
+                    )
+
+                # 3. Update simple fields of existing activities, the session
+                # only writes the rows whose values actually changed
+                for i, activity_on_pattern in existing_activities.items():
+                    activity_update = activities_update[i]
+
+                    if activity_update.label:
+                        activity_on_pattern.label = activity_update.label
+
+                    if activity_update.description:
+                        activity_on_pattern.description = activity_update.description
 
-                        new_activity = Activity(
-                            label=activity_update.label,
-                            description=activity_update.description,
+                    if activity_update.estimated_time:
+                        activity_on_pattern.estimated_time = (
+                            activity_update.estimated_time
                         )
-                        if activity_update.estimated_time:
-                            new_activity.estimated_time = activity_update.estimated_time
 
-                        self.db.add(new_activity)
+                # 4. Insert new activities in bulk
+                new_activities_update = [
+                    activity_update
+                    for i, activity_update in enumerate(activities_update)
+                    if i not in existing_activities
+                ]
+                new_activities = iter(
+                    await activity_service._insert_activities(new_activities_update)
+                )
 
-                        await self.db.flush()
-                        await self.db.refresh(new_activity)
+                ordered_activities: List[Activity] = [
+                    existing_activities.get(i) or next(new_activities)
+                    for i in range(len(activities_update))
+                ]
 
-                        if activity_update.assignee:
-                            assignee = ActivityAssignees(
-                                activity_id=new_activity.activity_id,
-                                assignee_type=activity_update.assignee.assignee_type,
-                                user_id=activity_update.assignee.user_id,
-                                group_id=activity_update.assignee.group_id,
-                            )
-                            new_activity.assignee = assignee
-                            await self.db.flush()
-                            await self.db.refresh(assignee)
+                # 5. Write new and changed assignees in one statement
+                assignees_to_write: Dict[int, ActivityAsigneesInput] = {}
 
-                        activity_to_order = new_activity
+                for activity, activity_update in zip(
+                    ordered_activities, activities_update
+                ):
+                    assignee_input = activity_update.assignee
 
-                    if last_activity:
-                        last_activity.next_activity_id = activity_to_order.activity_id
-                        await self.db.flush()
-                        await self.db.refresh(last_activity)
+                    if assignee_input is None:
+                        continue
 
-                    if i == 0:
-                        if not activity_to_order.assignee:
-                            raise BadRequestError(
-                                f"Assignee is required for the first activity '{activity_update.label}'"
-                            )
-                        if (
-                            activity_to_order.assignee.assignee_type
-                            != AssigneeEnum.REQUESTER
-                        ):
-                            raise BadRequestError(
-                                f"Assignee type must be 'requester' for the first activity '{activity_update.label}'"
-                            )
-                        first_activity_id = activity_to_order.activity_id
+                    current_assignee = (
+                        activity.assignee if activity_update.activity_id else None
+                    )
 
-                    last_activity = activity_to_order
+                    if current_assignee is None or (
+                        current_assignee.assignee_type,
+                        current_assignee.user_id,
+                        current_assignee.group_id,
+                    ) != (
+                        assignee_input.assignee_type,
+                        assignee_input.user_id,
+                        assignee_input.group_id,
+                    ):
+                        assignees_to_write[activity.activity_id] = assignee_input
+
+                await activity_service._upsert_assignees(assignees_to_write)
+
+                # 6. Relink the chain, writing only the activities whose link or
+                # position changed
+                await activity_service._link_activities(
+                    request_pattern.request_pattern_id, ordered_activities
+                )
 
-                if last_activity is not None:
-                    last_activity.next_activity_id = None
+                request_pattern.activity_id = ordered_activities[0].activity_id
 
-                request_pattern.activity_id = first_activity_id
+                # 7. Delete the activities left out, once nothing links to them
+                await activity_service._delete_activities(update.activities_to_delete)
 
             # D. Return the updated request pattern
             await self.db.flush()
@@ -496,12 +968,14 @@ class RequestPatternService:
             )
 
             activities_chain = await activity_service._get_activities_chain(
-                first_activity_id=request_pattern.activity_id
+                request_pattern_id=request_pattern.request_pattern_id
+            )
+            result = RequestPatternRead.model_validate(
+                loaded(
+                    request_pattern,
+                    activities=activities_chain._to_activities_read(),
+                )
             )
-            request_pattern_dict = request_pattern.to_dict()
-            request_pattern_dict["activities"] = activities_chain._to_activities_read()
-
-            result = RequestPatternRead.model_validate(request_pattern_dict)
             await self.db.commit()
             return result
 
@@ -526,7 +1000,7 @@ class RequestPatternService:
                 )
 
             activity = await activity_service._get_activity_from_activity_chain(
-                first_activity_id=request_pattern.activity_id,
+                request_pattern_id=request_pattern.request_pattern_id,
                 target_activity_id=activity_id,
             )
 
@@ -554,14 +1028,11 @@ class RequestPatternService:
             await self.db.refresh(activity, attribute_names=["form_pattern"])
 
             fields_chain = await form_pattern_service._get_form_fields_chain(
-                first_field_id=form_pattern.form_field_id
+                form_pattern_id=form_pattern.form_pattern_id
             )
 
             form_pattern_read = FormPatternRead.model_validate(
-                dict(
-                    **activity.form_pattern.to_dict(),
-                    fields=fields_chain._to_fields_read(),
-                ),
+                loaded(activity.form_pattern, fields=fields_chain._to_fields_read())
             )
 
             await self.db.commit()
@@ -576,7 +1047,13 @@ class RequestPatternService:
         self, request_pattern_id: UUID, activity_id: int
     ) -> List[ActivityFieldsRead]:
         activity_service = ActivityService(self.db)
-        form_pattern_service = FormPatternService(self.db)
+
+        snapshot = await self._get_snapshot(request_pattern_id)
+
+        if snapshot is not None:
+            return self._get_activity_fields_from_snapshot(
+                snapshot, request_pattern_id, activity_id
+            )
 
         request_pattern = await self._get_request_pattern_by_id(request_pattern_id)
 
@@ -586,7 +1063,7 @@ class RequestPatternService:
             )
 
         activities_chain = await activity_service._get_activities_chain(
-            first_activity_id=request_pattern.activity_id
+            request_pattern_id=request_pattern.request_pattern_id
         )
 
         if not activities_chain:
@@ -601,64 +1078,33 @@ class RequestPatternService:
                 f"Activity with id {activity_id} not found in request pattern with id {request_pattern_id}"
             )
 
-        await self.db.refresh(activity, attribute_names=["fields_display"])
-        actual_fields_display_ids = [
-            field_display.form_field_id for field_display in activity.fields_display
-        ]
-
-        activities_read = activities_chain._to_activities_read()
-
-        activities_fields_read = []
-
-        for activity_read in activities_read:
-            fields_read: List[FormFieldRead] = []
-
-            if activity_read.activity_id == activity.activity_id:
-                break
-
-            if activity_read.form_pattern_id:
-                form_pattern = await form_pattern_service._get_form_pattern_by_id(
-                    form_pattern_id=activity_read.form_pattern_id
-                )
-
-                if not form_pattern:
-                    raise NotFoundError(
-                        f"Form pattern with id {activity_read.form_pattern_id} not found"
-                    )
-
-                if not form_pattern.form_field_id:
-                    continue
-
-                fields_chain = await form_pattern_service._get_form_fields_chain(
-                    first_field_id=form_pattern.form_field_id
-                )
-                fields_read = fields_chain._to_fields_read()
-
-            activities_fields_read.append(
-                ActivityFieldsRead(
-                    activity_id=activity_read.activity_id,
-                    activity_order=activity_read.activity_order,
-                    label=activity_read.label,
-                    fields=[
-                        FieldDisplayRead.model_validate(
-                            dict(
-                                **field.model_dump(),
-                                selected=field.form_field_id
-                                in actual_fields_display_ids,
-                            )
+        fields_display = await self._get_fields_display([activity.activity_id])
+        actual_fields_display_ids = set(fields_display.get(activity.activity_id, []))
+
+        return [
+            ActivityFieldsRead(
+                activity_id=activity_read.activity_id,
+                activity_order=activity_read.activity_order,
+                label=activity_read.label,
+                fields=[
+                    FieldDisplayRead.model_validate(
+                        dict(
+                            **field.model_dump(),
+                            selected=field.form_field_id in actual_fields_display_ids,
                         )
-                        for field in fields_read
-                    ],
-                )
+                    )
+                    for field in fields_read
+                ],
             )
-
-        return activities_fields_read
+            for activity_read, fields_read in await self._get_upstream_fields(
+                activities_chain, activity.activity_id
+            )
+        ]
 
     async def put_request_pattern_activity_fields(
         self, request_pattern_id: UUID, activity_id: int, input: ActivityFieldsInput
     ) -> None:
         activity_service = ActivityService(self.db)
-        form_pattern_service = FormPatternService(self.db)
 
         try:
             request_pattern = await self._get_request_pattern_by_id(request_pattern_id)
@@ -668,8 +1114,11 @@ class RequestPatternService:
                     f"Request pattern with id {request_pattern_id} not found"
                 )
 
+            if request_pattern.is_published:
+                raise BadRequestError("Cannot update a published request pattern.")
+
             activities_chain = await activity_service._get_activities_chain(
-                first_activity_id=request_pattern.activity_id
+                request_pattern_id=request_pattern.request_pattern_id
             )
 
             if not activities_chain:
@@ -684,57 +1133,26 @@ class RequestPatternService:
                     f"Activity with id {activity_id} not found in request pattern with id {request_pattern_id}"
                 )
 
-            await self.db.refresh(activity, attribute_names=["fields_display"])
-
-            activity.fields_display.clear()
-
-            await self.db.flush()
-
-            activities_read = activities_chain._to_activities_read()
-
-            all_fields_ids = []
-
-            for activity_read in activities_read:
-                fields_read: List[FormFieldRead] = []
-
-                if activity_read.activity_id == activity.activity_id:
-                    break
-
-                if activity_read.form_pattern_id:
-                    form_pattern = await form_pattern_service._get_form_pattern_by_id(
-                        form_pattern_id=activity_read.form_pattern_id
-                    )
-
-                    if not form_pattern:
-                        raise NotFoundError(
-                            f"Form pattern with id {activity_read.form_pattern_id} not found"
-                        )
-
-                    if not form_pattern.form_field_id:
-                        continue
-
-                    fields_chain = await form_pattern_service._get_form_fields_chain(
-                        first_field_id=form_pattern.form_field_id
-                    )
-
-                    fields_read = fields_chain._to_fields_read()
+            upstream_fields_ids = {
+                field_read.form_field_id
+                for _, fields_read in await self._get_upstream_fields(
+                    activities_chain, activity.activity_id
+                )
+                for field_read in fields_read
+            }
 
-                    all_fields_ids.extend(
-                        [field.form_field_id for field in fields_read]
-                    )
+            unknown_fields_ids = set(input.fields) - upstream_fields_ids
 
-            for field_id in input.fields:
-                if field_id not in all_fields_ids:
-                    raise BadRequestError(
+            if unknown_fields_ids:
+                raise BadRequestError(
+                    [
                         f"Field with id {field_id} not found in request pattern with id {request_pattern_id}"
-                    )
-
-                activity.fields_display.append(
-                    ActivityFieldDisplay(
-                        form_field_id=field_id, activity_id=activity.activity_id
-                    )
+                        for field_id in sorted(unknown_fields_ids)
+                    ]
                 )
 
+            await self._set_fields_display(activity.activity_id, input.fields)
+
             await self.db.commit()
 
         except Exception:
@@ -742,6 +1160,10 @@ class RequestPatternService:
             raise
 
     async def publish_request_pattern(self, request_pattern_id: UUID) -> None:
+        """
+        Publishes the request pattern and its form patterns. Everything the rules
+        need is loaded upfront, so all violations are reported at once.
+        """
         activity_service = ActivityService(self.db)
         form_pattern_service = FormPatternService(self.db)
 
@@ -756,7 +1178,7 @@ class RequestPatternService:
             raise BadRequestError("Request pattern is already published")
 
         activity_chain = await activity_service._get_activities_chain(
-            first_activity_id=request_pattern.activity_id
+            request_pattern_id=request_pattern.request_pattern_id
         )
 
         if not activity_chain:
@@ -764,109 +1186,70 @@ class RequestPatternService:
                 f"No activities found for request pattern with id {request_pattern_id}"
             )
 
-        datetime_now = datetime.now(timezone.utc)
-
-        try:
-            activities_read = activity_chain._to_activities_read()
-            for activity_read in activities_read:
-                assignee = activity_read.assignee
-
-                if not assignee:
-                    raise BadRequestError(
-                        f"Activity with id {activity_read.activity_id} must have a assignee"
-                    )
-                elif activity_read.activity_order == 0:
-                    if assignee.assignee_type != AssigneeEnum.REQUESTER:
-                        raise BadRequestError(
-                            f"Activity with id {activity_read.activity_id} in order 0, must have a 'requester' assignee"
-                        )
+        activities_read = activity_chain._to_activities_read()
+        form_pattern_ids = [
+            activity_read.form_pattern_id
+            for activity_read in activities_read
+            if activity_read.form_pattern_id
+        ]
 
-                if assignee.assignee_type == AssigneeEnum.REQUESTER:
-                    if assignee.user_id or assignee.group_id:
-                        raise BadRequestError(
-                            f"Activity with id {activity_read.activity_id} assignee type is 'requester' and must not have user_id or group_id"
-                        )
-                elif assignee.assignee_type == AssigneeEnum.USER:
-                    if not assignee.user_id:
-                        raise BadRequestError(
-                            f"Activity with id {activity_read.activity_id} assignee type is 'user' and must have user_id"
-                        )
-                    if assignee.group_id:
-                        raise BadRequestError(
-                            f"Activity with id {activity_read.activity_id} assignee type is 'user' and must not have group_id"
-                        )
-                elif assignee.assignee_type == AssigneeEnum.GROUP:
-                    if not assignee.group_id:
-                        raise BadRequestError(
-                            f"Activity with id {activity_read.activity_id} assignee type is 'group' and must have group_id"
-                        )
-                    if assignee.user_id:
-                        raise BadRequestError(
-                            f"Activity with id {activity_read.activity_id} assignee type is 'group' and must not have user_id"
-                        )
+        form_patterns = await form_pattern_service._get_form_patterns_by_ids(
+            form_pattern_ids
+        )
+        fields_chains = await form_pattern_service._get_form_fields_chains(
+            form_pattern_ids
+        )
+        fields_reads = {
+            form_pattern_id: fields_chain._to_fields_read()
+            for form_pattern_id, fields_chain in fields_chains.items()
+        }
 
-                if not activity_read.form_pattern_id:
-                    raise BadRequestError(
-                        f"Activity with id {activity_read.activity_id} does not have a form pattern"
-                    )
+        violations = self._get_publish_violations(
+            activities_read, form_patterns, fields_reads
+        )
 
-                form_pattern = await form_pattern_service._get_form_pattern_by_id(
-                    form_pattern_id=activity_read.form_pattern_id
-                )
+        if violations:
+            raise BadRequestError(
+                [violation.model_dump(mode="json") for violation in violations]
+            )
 
-                if not form_pattern:
-                    raise NotFoundError(
-                        f"Form pattern with id {activity_read.form_pattern_id} not found for activity with id {activity_read.activity_id}"
-                    )
+        # The columns are naive UTC timestamps.
+        datetime_now = datetime.now(timezone.utc).replace(tzinfo=None)
 
-                if form_pattern.is_published:
-                    raise BadRequestError(
-                        f"Form pattern with id {activity_read.form_pattern_id} is already published for activity with id {activity_read.activity_id}"
-                    )
+        try:
+            form_patterns_read: Dict[int, FormPatternRead] = {}
 
-                fields_chain = await form_pattern_service._get_form_fields_chain(
-                    first_field_id=form_pattern.form_field_id
+            for form_pattern_id in form_pattern_ids:
+                form_pattern = form_patterns[form_pattern_id]
+                form_pattern.published_at = datetime_now
+                form_patterns_read[form_pattern_id] = FormPatternRead.model_validate(
+                    loaded(form_pattern, fields=fields_reads[form_pattern_id])
                 )
 
-                if not fields_chain:
-                    raise NotFoundError(
-                        f"No fields found for form pattern with id {form_pattern.form_pattern_id} for activity with id {activity_read.activity_id}"
-                    )
-
-                fields_read = fields_chain._to_fields_read()
-                for field_read in fields_read:
-                    if field_read.form_field_order == 0:
-                        if field_read.input_type != InputTypeEnum.SECTION:
-                            raise BadRequestError(
-                                f"Field with id {field_read.form_field_id} in order 0 must be a section. In activity with id {activity_read.activity_id}"
-                            )
-                    elif field_read.form_field_order == 1:
-                        if field_read.input_type == InputTypeEnum.SECTION:
-                            raise BadRequestError(
-                                f"Field with id {field_read.form_field_id} in order 1 must be a other field than a section. In activity with id {activity_read.activity_id}"
-                            )
-
-                    options_length = (
-                        len(field_read.options) if field_read.options else 0
-                    )
-
-                    if field_read.input_type == InputTypeEnum.SINGLE_CHOICE:
-                        if options_length < 2:
-                            raise BadRequestError(
-                                f"Field with id {field_read.form_field_id} must have at least 2 options for single choice input type. In activity with id {activity_read.activity_id}"
-                            )
-                    elif field_read.input_type == InputTypeEnum.MULTIPLE_CHOICE:
-                        if options_length < 1:
-                            raise BadRequestError(
-                                f"Field with id {field_read.form_field_id} must have at least 1 option for multiple choice input type. In activity with id {activity_read.activity_id}"
-                            )
+            request_pattern.published_at = datetime_now
 
-                form_pattern.published_at = datetime_now
+            # Freeze everything the read endpoints return, so they are served
+            # from the snapshot from now on.
+            snapshot = RequestPatternSnapshotDocument(
+                request_pattern=RequestPatternRead.model_validate(
+                    loaded(request_pattern, activities=activities_read)
+                ),
+                form_patterns=form_patterns_read,
+                fields_display=await self._get_fields_display(
+                    [activity_read.activity_id for activity_read in activities_read]
+                ),
+            )
 
-            request_pattern.published_at = datetime_now
+            self.db.add(
+                RequestPatternSnapshot(
+                    request_pattern_id=request_pattern.request_pattern_id,
+                    version=REQUEST_PATTERN_SNAPSHOT_VERSION,
+                    document=snapshot.model_dump(mode="json"),
+                )
+            )
 
             await self.db.commit()
 
         except Exception:
             await self.db.rollback()
-            raise BadRequestError("Failed to publish request pattern")
+            raise
@@ -1,19 +1,38 @@
 from datetime import datetime, timedelta, timezone
 from math import ceil
-from typing import List, Literal, Optional, Sequence, Tuple
+from typing import List, Literal, Optional, Sequence, Tuple, TypeVar
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import Select, exists, func, tuple_, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql import or_
 
+from src.database.configuration import async_session_factory
+from src.database.estimates import estimate_row_count
 from src.database.models.access_control.enums import RoleEnum
+from src.database.models.access_control.group import (
+    Group,
+    GroupClosure,
+    UserGroups,
+)
 from src.database.models.access_control.role import UserRoles
 from src.database.models.access_control.secure_code import SecureCode
 from src.database.models.access_control.user import User, UserInfo
+from src.database.search import contains, similarity
+from src.database.serialization import loaded, type_adapter, validate_all
+from src.database.versions import ResourceVersion, row_version, versions_digest
+from src.service_gateway.api.v1.functions.caches import (
+    invalidate_groups_tree,
+    user_roles_cache,
+)
+from src.service_gateway.api.v1.functions.email_dispatcher import email_dispatcher
+from src.service_gateway.api.v1.functions.send_emails import (
+    cancel_secure_code_emails,
+    enqueue_secure_code_email,
+)
 from src.service_gateway.api.v1.schemas.access_control.auth_schemas import (
     SecureCodeRead,
     SecureCodeValidate,
@@ -35,14 +54,22 @@ from src.service_gateway.security.authentication import (
     hash_password,
     verify_password,
 )
+from src.utils.cursors import decode_datetime_uuid_cursor, encode_cursor
 from src.utils.http_exceptions import (
     AuthenticationError,
+    BadRequestError,
     DatabaseIntegrityError,
     EmailAlreadyExistsError,
     NotFoundError,
     UnprocessableEntityError,
 )
 
+T = TypeVar("T", bound=tuple)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 class UserService:
     def __init__(self, db: AsyncSession) -> None:
@@ -84,6 +111,73 @@ class UserService:
 
         return user
 
+    def _filter_users_query(
+        self,
+        query: Select[T],
+        *,
+        only_active: bool = True,
+        only_verified: Optional[bool] = None,
+        name_like: Optional[str] = None,
+        group_id: Optional[UUID] = None,
+        include_descendant_groups: bool = False,
+    ) -> Select[T]:
+        query = query.where(
+            User.is_active.is_(only_active),
+        )
+
+        if group_id is not None:
+            in_groups = (
+                UserGroups.group_id.in_(
+                    select(GroupClosure.descendant_id).where(
+                        GroupClosure.ancestor_id == group_id
+                    )
+                )
+                if include_descendant_groups
+                else UserGroups.group_id == group_id
+            )
+
+            # EXISTS lists members of several of the groups once.
+            query = query.where(
+                exists().where(UserGroups.user_id == User.user_id, in_groups)
+            )
+
+        if only_verified is not None:
+            query = query.where(User.is_verified.is_(only_verified))
+
+        if name_like:
+            query = query.join(User.user_info).where(
+                or_(
+                    contains(UserInfo.first_name, name_like),
+                    contains(UserInfo.last_name, name_like),
+                )
+            )
+
+        return query
+
+    async def _count_users(
+        self,
+        *,
+        mode: Literal["exact", "estimated"] = "exact",
+        only_active: bool = True,
+        only_verified: Optional[bool] = None,
+        name_like: Optional[str] = None,
+    ) -> int:
+        filters = dict(
+            only_active=only_active,
+            only_verified=only_verified,
+            name_like=name_like,
+        )
+
+        if mode == "estimated":
+            return await estimate_row_count(
+                self.db, self._filter_users_query(select(User.user_id), **filters)
+            )
+
+        result = await self.db.execute(
+            self._filter_users_query(select(func.count(User.user_id)), **filters)
+        )
+        return result.scalar_one()
+
     async def _get_users(
         self,
         *,
@@ -93,22 +187,49 @@ class UserService:
         only_active: bool = True,
         only_verified: Optional[bool] = None,
         name_like: Optional[str] = None,
+        group_id: Optional[UUID] = None,
+        include_descendant_groups: bool = False,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        keyset: bool = False,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> Sequence[User]:
-        query = select(User).where(
-            User.is_active.is_(only_active),
+        """
+        Users ordered by (created_at, user_id). Pages either with `page` and
+        `page_size` (OFFSET) or, with `keyset`, with `page_size` and the keyset
+        of the last user of the previous page as `after`. OFFSET pages filtered
+        by `name_like` are ranked by name similarity first.
+        """
+        query = self._filter_users_query(
+            select(User),
+            only_active=only_active,
+            only_verified=only_verified,
+            name_like=name_like,
+            group_id=group_id,
+            include_descendant_groups=include_descendant_groups,
         )
 
-        if page is not None and page_size is not None:
+        if name_like and not keyset:
+            query = query.order_by(
+                similarity(
+                    UserInfo.first_name, UserInfo.last_name, term=name_like
+                ).desc()
+            )
+
+        query = query.order_by(User.created_at, User.user_id)
+
+        if keyset:
+            if after is not None:
+                query = query.where(tuple_(User.created_at, User.user_id) > after)
+
+            if page_size is not None:
+                query = query.limit(page_size)
+        elif page is not None and page_size is not None:
             offset = (page - 1) * page_size
             query = query.offset(offset).limit(page_size)
         elif page is not None or page_size is not None:
             raise ValueError("Both page and page_size must be provided together.")
 
-        if only_verified is not None:
-            query = query.where(User.is_verified.is_(only_verified))
-
         if include_user_info:
             query = query.options(joinedload(User.user_info))
 
@@ -118,24 +239,40 @@ class UserService:
         if include_roles:
             query = query.options(selectinload(User.roles))
 
-        if name_like:
-            query = query.join(User.user_info).where(
-                or_(
-                    UserInfo.first_name.ilike(f"%{name_like}%"),
-                    UserInfo.last_name.ilike(f"%{name_like}%"),
-                )
-            )
-
         result = await self.db.execute(query)
         users = result.scalars().all()
 
         return users
 
+    async def _dump_user_roles(self, user_id: UUID) -> bytes:
+        result = await self.db.execute(
+            select(UserRoles.role).where(UserRoles.user_id == user_id)
+        )
+
+        return type_adapter(List[RoleEnum]).dump_json(list(result.scalars().all()))
+
+    async def _get_user_roles(self, user_id: UUID) -> List[RoleEnum]:
+        """Roles of `user_id`, looked up through `user_roles_cache`."""
+
+        async def refresh() -> bytes:
+            async with async_session_factory() as db:
+                return await UserService(db)._dump_user_roles(user_id)
+
+        roles = await user_roles_cache.get_or_load(
+            str(user_id),
+            load=lambda: self._dump_user_roles(user_id),
+            refresh=refresh,
+        )
+
+        return type_adapter(List[RoleEnum]).validate_json(roles)
+
     ## Public methods
 
     async def create_user(self, user_signin: SignupInput) -> UUID:
         try:
-            hashed_password = hash_password(user_signin.password.get_secret_value())
+            hashed_password = await hash_password(
+                user_signin.password.get_secret_value()
+            )
 
             new_user = User(
                 email=user_signin.email,
@@ -179,46 +316,142 @@ class UserService:
             value=user_id,
             include_user_info=user_query.include_user_info,
             include_groups=user_query.include_groups,
-            include_roles=user_query.include_roles,
         )
 
         if user is None:
             raise NotFoundError("User not found")
 
-        return UserRead.model_validate(user.to_dict())
+        if user_query.include_roles:
+            return UserRead.model_validate(
+                loaded(user, roles=await self._get_user_roles(user_id))
+            )
+
+        return UserRead.model_validate(loaded(user))
+
+    async def get_user_version(
+        self, user_id: UUID, user_query: UserQuery
+    ) -> Optional[ResourceVersion]:
+        """
+        Fingerprint of the rows `get_user_data_by_id` reads, computed without
+        loading them.
+        """
+        versions: List[Select[Tuple[str]]] = []
+
+        if user_query.include_user_info:
+            versions.append(
+                select(row_version(UserInfo)).where(UserInfo.user_id == user_id)
+            )
+        if user_query.include_groups:
+            versions += [
+                select(row_version(UserGroups)).where(UserGroups.user_id == user_id),
+                select(row_version(Group))
+                .join(UserGroups, UserGroups.group_id == Group.group_id)
+                .where(UserGroups.user_id == user_id),
+            ]
+        version = row_version(User)
+
+        if versions:
+            version = func.concat_ws(",", version, versions_digest(*versions))
+
+        stmt = select(version).where(
+            User.user_id == user_id,
+            User.is_active.is_(True),
+        )
+
+        result = await self.db.execute(stmt)
+        digest = result.scalar_one_or_none()
+
+        if digest is None:
+            return None
+
+        # Roles are served from the cache: the version must be the one sent.
+        if user_query.include_roles:
+            roles = await self._get_user_roles(user_id)
+            digest = ",".join([digest, *(role.value for role in roles)])
+
+        return ResourceVersion(digest=digest)
 
     async def get_users(
         self,
         filters: UserFilters,
     ) -> PaginatedData[UserRead]:
-        total_count = await self.db.execute(select(func.count()).select_from(User))
-        total_count = total_count.scalar_one()
+        use_keyset = filters.pagination == "keyset" or filters.cursor is not None
+
+        after: Optional[Tuple[datetime, UUID]] = None
+
+        if filters.cursor is not None:
+            after = decode_datetime_uuid_cursor(filters.cursor)
+
+            if after is None:
+                raise BadRequestError("Invalid pagination cursor.")
+
+        total_count: Optional[int] = None
+
+        if filters.count != "none":
+            total_count = await self._count_users(
+                mode=filters.count,
+                only_active=filters.only_active,
+                only_verified=filters.only_verified,
+                name_like=filters.name,
+            )
 
-        total_pages = ceil(total_count / filters.page_size)
+        total_pages = (
+            ceil(total_count / filters.page_size) if total_count is not None else None
+        )
 
-        if filters.page > total_pages:
+        if (
+            not use_keyset
+            and total_pages is not None
+            and filters.count == "exact"
+            and filters.page > max(total_pages, 1)
+        ):
             raise UnprocessableEntityError(
                 f"Page {filters.page} exceeds the total number of pages {total_pages}."
             )
 
-        users = await self._get_users(
+        users_filters = dict(
             include_user_info=filters.include_user_info,
             include_groups=filters.include_groups,
             include_roles=filters.include_roles,
             only_active=filters.only_active,
             only_verified=filters.only_verified,
             name_like=filters.name,
-            page=filters.page,
-            page_size=filters.page_size,
         )
 
-        users_schema = [UserRead.model_validate(user.to_dict()) for user in users]
+        next_cursor: Optional[str] = None
+
+        if use_keyset:
+            # One extra row tells whether there is a next page.
+            users = list(
+                await self._get_users(
+                    **users_filters,
+                    page_size=filters.page_size + 1,
+                    keyset=True,
+                    after=after,
+                )
+            )
+
+            if len(users) > filters.page_size:
+                users = users[: filters.page_size]
+                next_cursor = encode_cursor((users[-1].created_at, users[-1].user_id))
+        else:
+            users = list(
+                await self._get_users(
+                    **users_filters,
+                    page=filters.page,
+                    page_size=filters.page_size,
+                )
+            )
+
+        users_schema = validate_all(UserRead, users)
 
         pagination = Pagination(
-            page=filters.page,
+            page=None if use_keyset else filters.page,
             size=filters.page_size,
             total=total_count,
+            total_is_estimate=filters.count == "estimated",
             pages=total_pages,
+            next_cursor=next_cursor,
         )
 
         paginated_data = PaginatedData(
@@ -250,10 +483,12 @@ class UserService:
 
         await self.db.refresh(user)
 
-        user_schema = UserRead.model_validate(user.to_dict())
+        user_schema = UserRead.model_validate(loaded(user))
 
         await self.db.commit()
 
+        await invalidate_groups_tree()
+
         return user_schema
 
     async def verify_user_password(
@@ -265,14 +500,21 @@ class UserService:
         if user is None:
             raise AuthenticationError("Invalid email or password")
 
-        password_verified = verify_password(
+        password_verified = await verify_password(
             input.password.get_secret_value(), user.hashed_password
         )
 
-        if not password_verified:
+        if not password_verified.ok:
             raise AuthenticationError("Invalid email or password")
 
-        return user.user_id, user.email
+        user_id, user_email = user.user_id, user.email
+
+        if password_verified.data is not None:
+            # The stored hash uses outdated argon2 parameters, upgrade it.
+            user.hashed_password = password_verified.data
+            await self.db.commit()
+
+        return user_id, user_email
 
     async def change_user_password(self, email: str, new_password: str) -> bool:
         user = await self._get_user(by="email", value=email)
@@ -280,7 +522,7 @@ class UserService:
         if user is None:
             return False
 
-        hashed_password = hash_password(new_password)
+        hashed_password = await hash_password(new_password)
         user.hashed_password = hashed_password
 
         await self.db.commit()
@@ -291,46 +533,45 @@ class UserService:
         self, secure_code_input: SecureCodeValidate
     ) -> Tuple[UUID, List[str]]:
         try:
+            # Consumed in one statement, so a code can't be used twice
+            # concurrently. The `expires_at` bound prunes the expired
+            # partitions and the rest is served by the index of unused codes.
             result = await self.db.execute(
-                select(SecureCode).where(
+                update(SecureCode)
+                .where(
                     SecureCode.secure_code_id == secure_code_input.secure_code_id,
                     SecureCode.code == secure_code_input.code,
+                    SecureCode.has_been_used.is_(False),
+                    SecureCode.expires_at > _utcnow(),
                 )
+                .values(has_been_used=True)
+                .returning(SecureCode.user_id)
             )
-            secure_code = result.scalars().first()
-
-            if secure_code is None:
-                raise AuthenticationError("Invalid secure code")
+            user_id = result.scalar_one_or_none()
 
-            if secure_code.expires_at.replace(tzinfo=timezone.utc) < datetime.now(
-                timezone.utc
-            ):
-                raise AuthenticationError("Secure code expired")
+            if user_id is None:
+                raise AuthenticationError("Invalid or expired secure code")
 
-            if secure_code.has_been_used:
-                raise AuthenticationError("Secure code already used")
-
-            secure_code.has_been_used = True
-
-            user = await self._get_user(
-                by="id",
-                value=secure_code.user_id,
-                include_roles=True,
-            )
+            user = await self._get_user(by="id", value=user_id)
 
             if not user:
                 raise NotFoundError("User not found")
 
-            if user.is_verified is False:
+            was_verified = user.is_verified
+
+            if was_verified is False:
                 user.is_verified = True
                 await self.db.flush()
 
-            roles = [user_role.role.value for user_role in user.roles]
+            roles = [role.value for role in await self._get_user_roles(user.user_id)]
 
-            response = (secure_code.user_id, roles)
+            response = (user_id, roles)
 
             await self.db.commit()
 
+            if was_verified is False:
+                await invalidate_groups_tree()
+
             return response
 
         except Exception:
@@ -338,25 +579,50 @@ class UserService:
 
             raise
 
-    async def create_secure_code(self, user_id: UUID) -> Tuple[SecureCodeRead, str]:
-        expires_at = datetime.now(timezone.utc) + timedelta(minutes=15)
+    async def create_secure_code(self, user_id: UUID, email: str) -> SecureCodeRead:
+        """
+        Creates a secure code for the user, invalidating the codes issued to
+        them before along with their undelivered emails. Its email is enqueued
+        in the same transaction and delivered in the background.
+        """
+        now = _utcnow()
 
         try:
+            await self.db.execute(
+                update(SecureCode)
+                .where(
+                    SecureCode.user_id == user_id,
+                    SecureCode.has_been_used.is_(False),
+                    SecureCode.expires_at > now,
+                )
+                .values(has_been_used=True)
+            )
+            await cancel_secure_code_emails(self.db, email)
+
             secure_code = SecureCode(
                 user_id=user_id,
-                expires_at=expires_at.replace(tzinfo=None),
+                expires_at=now + timedelta(minutes=15),
                 code=generate_random_code(6),
             )
             self.db.add(secure_code)
 
             await self.db.flush()
 
+            enqueue_secure_code_email(
+                self.db,
+                email=email,
+                code=secure_code.code,
+                code_id=secure_code.secure_code_id,
+                expires_at=secure_code.expires_at,
+            )
+
             secure_schema = SecureCodeRead.model_validate(secure_code)
-            code = secure_code.code
 
             await self.db.commit()
 
-            return (secure_schema, code)
+            email_dispatcher.notify()
+
+            return secure_schema
 
         except Exception:
             await self.db.rollback()
@@ -1,23 +1,33 @@
+import hashlib
 import re
 import secrets
 import string
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
 from decouple import config
 from jose import ExpiredSignatureError, JWTError, jwt
 
-from src.utils.function_responses import ResponseComplete, ResponseMessage
+from src.service_gateway.security.password_hasher import password_hasher
+from src.service_gateway.security.signing_keys import SigningKeys
+from src.utils.function_responses import ResponseComplete, ResponseData, ResponseMessage
 
 # Environment variables
-SECRET_KEY = str(config("SECRET_KEY"))
+SECRET_KEY = str(config("SECRET_KEY", default=""))
 ALGORITHM = str(config("ALGORITHM"))
+JWT_KEYS_DIR = str(config("JWT_KEYS_DIR", default=""))
+JWT_ACTIVE_KEY_ID = str(config("JWT_ACTIVE_KEY_ID", default=""))
 EXPIRATION_TIME_IN_MINUTES = int(config("EXPIRATION_TIME_IN_MINUTES"))
+REFRESH_TOKEN_EXPIRATION_IN_DAYS = config(
+    "REFRESH_TOKEN_EXPIRATION_IN_DAYS", default=30, cast=int
+)
 
-# Password hasher
-ph = PasswordHasher()
+signing_keys = SigningKeys(
+    ALGORITHM,
+    secret_key=SECRET_KEY,
+    keys_dir=JWT_KEYS_DIR,
+    active_kid=JWT_ACTIVE_KEY_ID,
+)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -31,12 +41,20 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         )
 
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+    key, headers = signing_keys.signing_key()
+
+    return jwt.encode(to_encode, key, algorithm=ALGORITHM, headers=headers)
 
 
 def decode_access_token(token: str) -> ResponseComplete[Optional[Dict[str, Any]]]:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        key = signing_keys.verification_key(jwt.get_unverified_header(token).get("kid"))
+
+        if key is None:
+            return ResponseComplete(msg="Invalid Token", data=None, ok=False)
+
+        payload = jwt.decode(token, key, algorithms=[ALGORITHM])
         return ResponseComplete(msg="Authenticated", data=payload, ok=True)
     except ExpiredSignatureError:
         return ResponseComplete(msg="Expired Token", data=None, ok=False)
@@ -44,6 +62,15 @@ def decode_access_token(token: str) -> ResponseComplete[Optional[Dict[str, Any]]
         return ResponseComplete(msg="Invalid Token", data=None, ok=False)
 
 
+def generate_refresh_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    """Refresh tokens are random enough for a plain SHA-256 to be safe to store."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def validate_password(value: str) -> ResponseMessage:
     message: str = ""
 
@@ -68,17 +95,20 @@ def validate_password_match(password: str, confirm_password: str) -> ResponseMes
     return ResponseMessage(msg="Password and re-password match", ok=True)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    try:
-        result = ph.verify(hashed_password, plain_password)
-    except VerifyMismatchError:
-        result = False
+async def verify_password(
+    plain_password: str, hashed_password: str
+) -> ResponseData[Optional[str]]:
+    """
+    Verifies the password off the event loop. When the stored hash was made with
+    outdated argon2 parameters, `data` carries a fresh hash to store instead.
+    """
+    verified, new_hash = await password_hasher.verify(plain_password, hashed_password)
 
-    return result
+    return ResponseData(data=new_hash, ok=verified)
 
 
-def hash_password(password: str) -> str:
-    return ph.hash(password)
+async def hash_password(password: str) -> str:
+    return await password_hasher.hash(password)
 
 
 def generate_random_code(length: int) -> str:
@@ -0,0 +1,187 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, TypeVar
+
+import argon2
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from decouple import Choices, config
+
+from src.utils.metrics import Histogram
+
+T = TypeVar("T")
+
+# Argon2 cost parameters
+ARGON2_TIME_COST = config(
+    "ARGON2_TIME_COST", default=argon2.DEFAULT_TIME_COST, cast=int
+)
+ARGON2_MEMORY_COST = config(
+    "ARGON2_MEMORY_COST", default=argon2.DEFAULT_MEMORY_COST, cast=int
+)
+ARGON2_PARALLELISM = config(
+    "ARGON2_PARALLELISM", default=argon2.DEFAULT_PARALLELISM, cast=int
+)
+ARGON2_HASH_LENGTH = config(
+    "ARGON2_HASH_LENGTH", default=argon2.DEFAULT_HASH_LENGTH, cast=int
+)
+ARGON2_SALT_LENGTH = config(
+    "ARGON2_SALT_LENGTH", default=argon2.DEFAULT_RANDOM_SALT_LENGTH, cast=int
+)
+
+# Executor settings
+PASSWORD_HASHER_EXECUTOR = config(
+    "PASSWORD_HASHER_EXECUTOR",
+    default="thread",
+    cast=Choices(["thread", "process"]),
+)
+PASSWORD_HASHER_WORKERS = config(
+    "PASSWORD_HASHER_WORKERS", default=min(4, os.cpu_count() or 1), cast=int
+)
+PASSWORD_HASHER_MAX_CONCURRENCY = config(
+    "PASSWORD_HASHER_MAX_CONCURRENCY", default=PASSWORD_HASHER_WORKERS, cast=int
+)
+
+
+class Argon2Parameters(NamedTuple):
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    hash_len: int
+    salt_len: int
+
+
+@lru_cache(maxsize=None)
+def _get_hasher(params: Argon2Parameters) -> PasswordHasher:
+    return PasswordHasher(**params._asdict())
+
+
+# The job functions live at module level so a process pool can pickle them.
+
+
+def _hash(params: Argon2Parameters, password: str) -> str:
+    return _get_hasher(params).hash(password)
+
+
+def _verify(
+    params: Argon2Parameters, hashed_password: str, plain_password: str
+) -> Tuple[bool, Optional[str]]:
+    ph = _get_hasher(params)
+
+    try:
+        ph.verify(hashed_password, plain_password)
+    except VerifyMismatchError:
+        return False, None
+
+    if ph.check_needs_rehash(hashed_password):
+        return True, ph.hash(plain_password)
+
+    return True, None
+
+
+class PasswordHasherExecutor:
+    """
+    Runs argon2 hashing and verification off the event loop, in a thread or
+    process pool, with at most `max_concurrency` jobs in flight at once.
+    """
+
+    def __init__(
+        self,
+        params: Argon2Parameters,
+        kind: str = "thread",
+        workers: int = 1,
+        max_concurrency: int = 1,
+    ) -> None:
+        self.params = params
+        self.kind = kind
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+
+        self.waiting = 0
+        self.in_flight = 0
+        self.queue_time_ms = Histogram()
+        self.run_time_ms = Histogram()
+
+        self._executor: Optional[Executor] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="password-hasher",
+                )
+
+        return self._executor
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        queued_at = time.perf_counter()
+        self.waiting += 1
+
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        started_at = time.perf_counter()
+        self.queue_time_ms.observe((started_at - queued_at) * 1000)
+        self.in_flight += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.run_time_ms.observe((time.perf_counter() - started_at) * 1000)
+            self._semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, self.params, password)
+
+    async def verify(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Returns whether the password matches and, when the stored hash was made
+        with outdated parameters, a fresh hash to replace it with.
+        """
+        return await self._run(_verify, self.params, hashed_password, plain_password)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "executor": self.kind,
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "queue_time_ms": self.queue_time_ms.snapshot(),
+            "run_time_ms": self.run_time_ms.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasherExecutor(
+    params=Argon2Parameters(
+        time_cost=ARGON2_TIME_COST,
+        memory_cost=ARGON2_MEMORY_COST,
+        parallelism=ARGON2_PARALLELISM,
+        hash_len=ARGON2_HASH_LENGTH,
+        salt_len=ARGON2_SALT_LENGTH,
+    ),
+    kind=PASSWORD_HASHER_EXECUTOR,
+    workers=PASSWORD_HASHER_WORKERS,
+    max_concurrency=PASSWORD_HASHER_MAX_CONCURRENCY,
+)
@@ -0,0 +1,139 @@
+from itertools import product
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from decouple import config
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.future import select
+
+from src.database.configuration import async_session_factory
+from src.database.models.access_control.enums import (
+    OperationEnum,
+    ResourceEnum,
+    RoleEnum,
+)
+from src.database.models.access_control.role import Policy
+from src.database.versions import row_version, versions_digest
+from src.service_gateway.security.principal import Principal, get_principal
+from src.utils.http_exceptions import ForbiddenError
+from src.utils.periodic_task import PeriodicTask
+
+POLICY_RELOAD_INTERVAL = config("POLICY_RELOAD_INTERVAL", default=30.0, cast=float)
+
+# One bit per (resource, operation) pair.
+PERMISSION_BITS: Dict[Tuple[ResourceEnum, OperationEnum], int] = {
+    permission: 1 << index
+    for index, permission in enumerate(product(ResourceEnum, OperationEnum))
+}
+
+
+def compile_policies(
+    policies: Iterable[Tuple[RoleEnum, ResourceEnum, OperationEnum]],
+) -> Dict[RoleEnum, int]:
+    """Folds `(role, resource, operation)` rows into a permission bitset per role."""
+    permissions: Dict[RoleEnum, int] = {}
+
+    for role, resource, operation in policies:
+        permissions[role] = (
+            permissions.get(role, 0) | PERMISSION_BITS[(resource, operation)]
+        )
+
+    return permissions
+
+
+class PolicyEngine(PeriodicTask):
+    """
+    Authorizes the roles of a `Principal`, already in its token, against the
+    `access_control.policy` table without querying it on every request.
+
+    Policies are compiled into a bitset per role, so a check is a bitwise AND
+    per role. A background task compares a digest of the table every
+    `reload_interval` seconds and recompiles when it changed. Until policies
+    are loaded every check is denied.
+    """
+
+    failure_message = "Failed to reload the authorization policies"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        reload_interval: float = POLICY_RELOAD_INTERVAL,
+    ) -> None:
+        super().__init__(reload_interval)
+
+        self.session_factory = session_factory
+
+        self._permissions: Optional[Dict[RoleEnum, int]] = None
+        self._digest: Optional[str] = None
+
+    ## Friendly methods
+
+    async def _get_digest(self, db: AsyncSession) -> str:
+        result = await db.execute(select(versions_digest(select(row_version(Policy)))))
+        return result.scalar_one()
+
+    async def _run_once(self) -> None:
+        await self.reload()
+
+    ## Public methods
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._permissions is not None
+
+    async def reload(self, force: bool = False) -> bool:
+        """
+        Recompiles the policies if the table changed since the last load, or
+        always with `force`. Returns whether they were recompiled.
+        """
+        async with self.session_factory() as db:
+            digest = await self._get_digest(db)
+
+            if not force and self.is_loaded and digest == self._digest:
+                return False
+
+            result = await db.execute(
+                select(Policy.role, Policy.resource, Policy.operation)
+            )
+            permissions = compile_policies(result.tuples().all())
+
+        self._permissions = permissions
+        self._digest = digest
+
+        return True
+
+    def is_allowed(
+        self,
+        roles: Iterable[RoleEnum],
+        resource: ResourceEnum,
+        operation: OperationEnum,
+    ) -> bool:
+        if self._permissions is None:
+            return False
+
+        bit = PERMISSION_BITS[(resource, operation)]
+
+        return any(self._permissions.get(role, 0) & bit for role in roles)
+
+
+policy_engine = PolicyEngine(session_factory=async_session_factory)
+
+
+def require(
+    resource: ResourceEnum, operation: OperationEnum
+) -> Callable[..., Awaitable[Principal]]:
+    """
+    Route dependency that lets the request through only if one of the roles of
+    the caller may perform `operation` on `resource`, e.g.
+    `dependencies=[Depends(require(ResourceEnum.ALL_PATTERNS, OperationEnum.UPDATE))]`.
+    """
+
+    async def dependency(principal: Principal = Depends(get_principal)) -> Principal:
+        if not policy_engine.is_allowed(principal.roles, resource, operation):
+            raise ForbiddenError(
+                f"Not allowed to {operation.value} {resource.value.replace('_', ' ')}."
+            )
+
+        return principal
+
+    return dependency
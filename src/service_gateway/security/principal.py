@@ -0,0 +1,47 @@
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from fastapi import Request
+from fastapi.security import HTTPBearer
+
+from src.database.models.access_control.enums import RoleEnum
+from src.utils.http_exceptions import AuthenticationError
+
+
+class Principal(NamedTuple):
+    """Authenticated caller, resolved once per request by `JWTMiddleware`."""
+
+    user_id: UUID
+    roles: Tuple[RoleEnum, ...]
+    # Refresh token session the access token was issued for, `None` for tokens
+    # issued before sessions existed.
+    session_id: Optional[UUID] = None
+
+
+def principal_from_payload(payload: Dict[str, Any]) -> Optional[Principal]:
+    try:
+        return Principal(
+            user_id=UUID(payload["sub"]),
+            roles=tuple(RoleEnum(role) for role in payload.get("roles", [])),
+            session_id=UUID(payload["sid"]) if "sid" in payload else None,
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class PrincipalBearer(HTTPBearer):
+    """
+    Declares the bearer scheme for OpenAPI and hands routes the `Principal`
+    already resolved by `JWTMiddleware`, without parsing the header again.
+    """
+
+    async def __call__(self, request: Request) -> Principal:  # type: ignore[override]
+        principal: Optional[Principal] = getattr(request.state, "principal", None)
+
+        if principal is None:
+            raise AuthenticationError("Token missing or invalid.")
+
+        return principal
+
+
+get_principal = PrincipalBearer(scheme_name="HTTPBearer")
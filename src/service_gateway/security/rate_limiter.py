@@ -0,0 +1,82 @@
+import logging
+
+from decouple import config
+from starlette.types import Scope
+
+from src.utils.http_exceptions import TooManyRequestsError
+from src.utils.rate_limit import RateLimit, RateLimitBackend, get_rate_limit_backend
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_ENABLED = config("RATE_LIMIT_ENABLED", default=True, cast=bool)
+# Only behind a proxy that sets `X-Forwarded-For`, otherwise clients pick their IP.
+RATE_LIMIT_TRUST_PROXY = config("RATE_LIMIT_TRUST_PROXY", default=False, cast=bool)
+
+# Per client IP, `<requests>/<seconds>`.
+SIGNUP_LIMIT = config("RATE_LIMIT_SIGNUP", default="5/600", cast=RateLimit.parse)
+SIGNIN_LIMIT = config("RATE_LIMIT_SIGNIN", default="10/60", cast=RateLimit.parse)
+SECURE_CODE_VALIDATE_LIMIT = config(
+    "RATE_LIMIT_SECURE_CODE_VALIDATE", default="10/60", cast=RateLimit.parse
+)
+REFRESH_LIMIT = config("RATE_LIMIT_REFRESH", default="30/60", cast=RateLimit.parse)
+# Per email and client IP (see `email_key`), secure code or user.
+SIGNUP_EMAIL_LIMIT = config(
+    "RATE_LIMIT_SIGNUP_EMAIL", default="3/3600", cast=RateLimit.parse
+)
+SIGNIN_EMAIL_LIMIT = config(
+    "RATE_LIMIT_SIGNIN_EMAIL", default="5/600", cast=RateLimit.parse
+)
+SECURE_CODE_ATTEMPTS_LIMIT = config(
+    "RATE_LIMIT_SECURE_CODE_ATTEMPTS", default="5/900", cast=RateLimit.parse
+)
+WRITES_LIMIT = config("RATE_LIMIT_WRITES", default="60/60", cast=RateLimit.parse)
+
+
+def client_ip(scope: Scope) -> str:
+    if RATE_LIMIT_TRUST_PROXY:
+        for key, value in scope["headers"]:
+            if key == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+
+    client = scope.get("client")
+
+    return client[0] if client else "unknown"
+
+
+def email_key(scope: Scope, email: str) -> str:
+    """
+    Key of the per email limits. The client IP is part of it, otherwise anyone
+    could use up the limit of an email and lock its owner out.
+    """
+    return f"{email.lower()}:{client_ip(scope)}"
+
+
+class RateLimiter:
+    """
+    Token bucket rate limits by name (e.g. `"signin:email"`) and key. A failing
+    backend lets requests through rather than taking the API down with it.
+    """
+
+    def __init__(self, backend: RateLimitBackend, enabled: bool = True) -> None:
+        self.backend = backend
+        self.enabled = enabled
+
+    async def retry_after(self, name: str, key: str, limit: RateLimit) -> float:
+        """Takes a token, returns 0 when allowed or the seconds to wait."""
+        if not self.enabled:
+            return 0.0
+
+        try:
+            return await self.backend.take(f"{name}:{key}", limit)
+        except Exception:
+            logger.warning("Failed to check the rate limit %s", name, exc_info=True)
+            return 0.0
+
+    async def enforce(self, name: str, key: str, limit: RateLimit) -> None:
+        retry_after = await self.retry_after(name, key, limit)
+
+        if retry_after > 0:
+            raise TooManyRequestsError(retry_after)
+
+
+rate_limiter = RateLimiter(get_rate_limit_backend(), enabled=RATE_LIMIT_ENABLED)
@@ -0,0 +1,88 @@
+import time
+from datetime import timedelta
+from typing import Dict, Iterable
+from uuid import UUID
+
+from decouple import config
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.future import select
+
+from src.database.configuration import async_session_factory
+from src.database.models.access_control.refresh_token import RefreshToken
+from src.service_gateway.security.authentication import EXPIRATION_TIME_IN_MINUTES
+from src.utils.periodic_task import PeriodicTask
+
+TOKEN_REVOCATION_SYNC_INTERVAL = config(
+    "TOKEN_REVOCATION_SYNC_INTERVAL", default=2.0, cast=float
+)
+
+
+class RevokedSessions(PeriodicTask):
+    """
+    Sessions (`sid` claim of the access tokens) revoked recently enough for
+    access tokens issued to them to be still valid, checked in memory on every
+    request.
+
+    A revocation is applied at once in the worker that makes it, and reaches
+    the other workers on their next sync, every `sync_interval` seconds, which
+    reads the revocations of the last `retention` from `RefreshToken`.
+    """
+
+    failure_message = "Failed to sync the revoked sessions"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        retention: timedelta = timedelta(minutes=EXPIRATION_TIME_IN_MINUTES),
+        sync_interval: float = TOKEN_REVOCATION_SYNC_INTERVAL,
+    ) -> None:
+        super().__init__(sync_interval)
+
+        self.session_factory = session_factory
+        self.retention = retention
+
+        # Session id -> when it can be forgotten (monotonic clock).
+        self._revoked: Dict[UUID, float] = {}
+
+    def __contains__(self, session_id: UUID) -> bool:
+        forget_at = self._revoked.get(session_id)
+
+        return forget_at is not None and forget_at > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    ## Friendly methods
+
+    async def _run_once(self) -> None:
+        await self.sync()
+
+    ## Public methods
+
+    def add(self, session_ids: Iterable[UUID]) -> None:
+        forget_at = time.monotonic() + self.retention.total_seconds()
+
+        for session_id in session_ids:
+            self._revoked[session_id] = forget_at
+
+    async def sync(self) -> None:
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(RefreshToken.session_id)
+                .where(RefreshToken.revoked_at > func.now() - self.retention)
+                .distinct()
+            )
+            session_ids = result.scalars().all()
+
+        now = time.monotonic()
+
+        self._revoked = {
+            session_id: forget_at
+            for session_id, forget_at in self._revoked.items()
+            if forget_at > now
+        }
+        self.add(session_ids)
+
+
+revoked_sessions = RevokedSessions(session_factory=async_session_factory)
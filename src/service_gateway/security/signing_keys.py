@@ -0,0 +1,108 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from jose import jwk
+from jose.backends.base import Key
+
+SYMMETRIC_ALGORITHMS = ("HS256", "HS384", "HS512")
+
+
+class SigningKeys:
+    """
+    Keys of the access tokens, parsed once at startup.
+
+    With an HMAC `algorithm` tokens are signed and verified with `secret_key`
+    and carry no `kid`. Otherwise every `<kid>.pem` file of `keys_dir` is a key
+    of `algorithm` (e.g. ES256): tokens are signed with the private key
+    `active_kid` and verified with the key named by their `kid` header. Keys
+    still in the directory keep verifying the tokens they signed, so a key can
+    be rotated by adding the new one, switching `active_kid` once the JWKS of
+    the consumers picked it up, and removing the old one after the access
+    tokens it signed expired. Retired keys may be kept as public keys only.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        *,
+        secret_key: Optional[str] = None,
+        keys_dir: Optional[str] = None,
+        active_kid: Optional[str] = None,
+    ) -> None:
+        self.algorithm = algorithm
+        self.active_kid: Optional[str] = None
+
+        self._verification_keys: Dict[Optional[str], Key] = {}
+        self._jwks: Dict[str, Any] = {"keys": []}
+
+        if algorithm in SYMMETRIC_ALGORITHMS:
+            if not secret_key:
+                raise ValueError(f"SECRET_KEY is required to sign with {algorithm}")
+
+            self._signing_key = jwk.construct(secret_key, algorithm)
+            self._verification_keys[None] = self._signing_key
+        else:
+            self._signing_key, public_jwks = self._load_keys(keys_dir, active_kid)
+            self.active_kid = active_kid
+            self._jwks = {"keys": public_jwks}
+
+        self.jwks_etag = (
+            '"'
+            + hashlib.sha256(
+                json.dumps(self._jwks, sort_keys=True).encode("utf-8")
+            ).hexdigest()[:32]
+            + '"'
+        )
+
+    ## Friendly methods
+
+    def _load_keys(
+        self, keys_dir: Optional[str], active_kid: Optional[str]
+    ) -> Tuple[Key, list]:
+        if not keys_dir or not active_kid:
+            raise ValueError(
+                f"JWT_KEYS_DIR and JWT_ACTIVE_KEY_ID are required to sign with "
+                f"{self.algorithm}"
+            )
+
+        signing_key: Optional[Key] = None
+        public_jwks = []
+
+        for path in sorted(Path(keys_dir).glob("*.pem")):
+            kid = path.stem
+            key = jwk.construct(path.read_bytes(), self.algorithm)
+            public_key = key if key.is_public() else key.public_key()
+
+            if kid == active_kid:
+                if key.is_public():
+                    raise ValueError(f"Active signing key '{kid}' is not private")
+
+                signing_key = key
+
+            self._verification_keys[kid] = public_key
+            public_jwks.append(
+                {**public_key.to_dict(), "kid": kid, "use": "sig"},
+            )
+
+        if signing_key is None:
+            raise ValueError(f"Active signing key '{active_kid}' not found")
+
+        return signing_key, public_jwks
+
+    ## Public methods
+
+    @property
+    def jwks(self) -> Dict[str, Any]:
+        """Public keys as a JWK Set, empty with an HMAC algorithm."""
+        return self._jwks
+
+    def signing_key(self) -> Tuple[Key, Dict[str, str]]:
+        """Key to sign new tokens with and the headers to add to them."""
+        headers = {"kid": self.active_kid} if self.active_kid else {}
+
+        return self._signing_key, headers
+
+    def verification_key(self, kid: Optional[str]) -> Optional[Key]:
+        return self._verification_keys.get(kid)
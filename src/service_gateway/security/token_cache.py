@@ -0,0 +1,60 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Generic, Optional, Tuple, TypeVar
+
+from decouple import config
+
+T = TypeVar("T")
+
+TOKEN_CACHE_SIZE = config("TOKEN_CACHE_SIZE", default=10_000, cast=int)
+
+
+class VerifiedTokenCache(Generic[T]):
+    """
+    Bounded LRU of already-verified tokens, keyed by the SHA-256 digest of the
+    token and evicted once the token's `exp` has passed.
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, Tuple[T, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[T]:
+        key = self._digest(token)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+
+        return value
+
+    def set(self, token: str, value: T, expires_at: float) -> None:
+        if self.max_size <= 0 or expires_at <= time.time():
+            return
+
+        key = self._digest(token)
+
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
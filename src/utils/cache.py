@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import struct
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Protocol, Tuple
+
+from decouple import Choices, config
+
+from src.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKEND = config(
+    "CACHE_BACKEND",
+    default="memory",
+    cast=Choices(["memory", "redis"]),
+)
+CACHE_MAX_ENTRIES = config("CACHE_MAX_ENTRIES", default=1024, cast=int)
+CACHE_KEY_PREFIX = str(config("CACHE_KEY_PREFIX", default="sigmachain:"))
+
+Loader = Callable[[], Awaitable[bytes]]
+
+# Entries are stored as `<fresh until (unix time)><value>`.
+_ENTRY_HEADER = struct.Struct("!d")
+
+
+class CacheBackend(ABC):
+    """
+    Stores bytes with a per-key time to live. Implementations must not block the
+    event loop.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """The value stored at `key`, `None` if there is none or it expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Stores `value` at `key` for `ttl` seconds."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Removes `keys`, missing keys are ignored."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Per-process store that evicts the least recently used entries past
+    `max_entries`. Invalidations only reach the process that makes them.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class KeyValueStore(Protocol):
+    """
+    Subset of the `redis.asyncio` client the shared backend relies on, any local
+    stand-in implementing it works as well.
+    """
+
+    async def get(self, name: str) -> Optional[bytes]: ...
+
+    async def set(self, name: str, value: bytes, px: Optional[int] = None) -> Any: ...
+
+    async def delete(self, *names: str) -> Any: ...
+
+
+class SharedCacheBackend(CacheBackend):
+    """Store shared by every worker, so invalidations reach all of them."""
+
+    def __init__(self, store: KeyValueStore, prefix: str = CACHE_KEY_PREFIX) -> None:
+        self.store = store
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.store.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.store.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.store.delete(*(self.prefix + key for key in keys))
+
+
+class Cache:
+    """
+    Stale-while-revalidate on top of a `CacheBackend`.
+
+    Entries are fresh for `ttl` seconds, then served stale for up to `stale_ttl`
+    more seconds while a single background task per key reloads them. Backend
+    errors are logged and handled as misses: the cache never fails a request.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        ttl: float,
+        stale_ttl: float = 0,
+    ) -> None:
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+
+        # Loads started before an invalidation must not store what they read.
+        self._invalidations = 0
+        self._refreshes: Dict[str, asyncio.Task[None]] = {}
+
+    ## Friendly methods
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def _read(self, key: str) -> Optional[Tuple[float, bytes]]:
+        try:
+            entry = await self.backend.get(key)
+        except Exception:
+            logger.warning("Failed to read cache entry %s", key, exc_info=True)
+            return None
+
+        if entry is None or len(entry) < _ENTRY_HEADER.size:
+            return None
+
+        (fresh_until,) = _ENTRY_HEADER.unpack_from(entry)
+
+        return fresh_until, entry[_ENTRY_HEADER.size :]
+
+    async def _write(self, key: str, value: bytes, invalidations: int) -> None:
+        if invalidations != self._invalidations:
+            return
+
+        entry = _ENTRY_HEADER.pack(time.time() + self.ttl) + value
+
+        try:
+            await self.backend.set(key, entry, self.ttl + self.stale_ttl)
+        except Exception:
+            logger.warning("Failed to write cache entry %s", key, exc_info=True)
+
+    async def _refresh(self, key: str, refresh: Loader, invalidations: int) -> None:
+        try:
+            value = await refresh()
+        except Exception:
+            logger.warning("Failed to refresh cache entry %s", key, exc_info=True)
+            return
+
+        await self._write(key, value, invalidations)
+
+    def _schedule_refresh(self, key: str, refresh: Loader) -> None:
+        if key in self._refreshes:
+            return
+
+        task = asyncio.create_task(self._refresh(key, refresh, self._invalidations))
+        self._refreshes[key] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(key, None))
+
+    ## Public methods
+
+    async def get_or_load(
+        self,
+        key: str,
+        load: Loader,
+        refresh: Optional[Loader] = None,
+    ) -> bytes:
+        """
+        The value at `key`. `load` runs inline on a miss, `refresh` revalidates a
+        stale entry in the background, so it must not depend on anything scoped
+        to the caller (e.g. its database session). Without `refresh`, stale
+        entries are reloaded inline.
+        """
+        key = self._key(key)
+        entry = await self._read(key)
+
+        if entry is not None:
+            fresh_until, value = entry
+
+            if fresh_until > time.time():
+                return value
+
+            if refresh is not None:
+                self._schedule_refresh(key, refresh)
+                return value
+
+        invalidations = self._invalidations
+        value = await load()
+
+        await self._write(key, value, invalidations)
+
+        return value
+
+    async def invalidate(self, *keys: str) -> None:
+        """
+        Drops `keys`. Call it once the change is committed, otherwise a
+        concurrent load can store the previous state again.
+        """
+        self._invalidations += 1
+
+        try:
+            await self.backend.delete(*(self._key(key) for key in keys))
+        except Exception:
+            logger.warning("Failed to invalidate cache entries %s", keys, exc_info=True)
+
+
+def get_cache_backend() -> CacheBackend:
+    if CACHE_BACKEND == "redis":
+        return SharedCacheBackend(get_redis_client("CACHE_BACKEND=redis"))
+
+    return MemoryCacheBackend()
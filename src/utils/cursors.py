@@ -0,0 +1,40 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encodes the keyset of the last item of a page as an opaque cursor."""
+    serialized = [
+        value.isoformat() if isinstance(value, datetime) else str(value)
+        for value in values
+    ]
+    raw = json.dumps(serialized, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[List[str]]:
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except ValueError:
+        return None
+
+    if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+        return None
+
+    return values
+
+
+def decode_datetime_uuid_cursor(cursor: str) -> Optional[Tuple[datetime, UUID]]:
+    values = decode_cursor(cursor)
+
+    if values is None or len(values) != 2:
+        return None
+
+    try:
+        return datetime.fromisoformat(values[0]), UUID(values[1])
+    except ValueError:
+        return None
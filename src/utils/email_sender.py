@@ -1,22 +1,161 @@
+import asyncio
+import smtplib
+import uuid
+from abc import ABC, abstractmethod
+from email.message import EmailMessage as MIMEEmailMessage
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence
+
 import resend
-from decouple import config
+from decouple import Choices, config
 
-resend.api_key = config("RESEND_API_KEY")
+EMAIL_TRANSPORT = config(
+    "EMAIL_TRANSPORT",
+    default="resend",
+    cast=Choices(["resend", "smtp", "file"]),
+)
 
 email_from = config("EMAIL_FROM")
+sender = f"SigmaChain Info <{email_from}>"
+
+
+class EmailMessage(NamedTuple):
+    to: str
+    subject: str
+    html: str
+
+
+class EmailTransport(ABC):
+    """Delivers rendered emails. Implementations must not block the event loop."""
+
+    @abstractmethod
+    async def send(self, messages: Sequence[EmailMessage]) -> List[Optional[str]]:
+        """
+        Sends `messages` and returns, in the same order, `None` for every message
+        that was delivered or a description of the error for those that were not.
+        """
+
+
+class ResendEmailTransport(EmailTransport):
+    # Limit of the Resend batch endpoint.
+    MAX_BATCH_SIZE = 100
+
+    def __init__(self, api_key: str) -> None:
+        resend.api_key = api_key
+
+    @staticmethod
+    def _send_batch(messages: Sequence[EmailMessage]) -> None:
+        params: List[resend.Emails.SendParams] = [
+            {
+                "from": sender,
+                "to": message.to,
+                "subject": message.subject,
+                "html": message.html,
+            }
+            for message in messages
+        ]
+
+        resend.Batch.send(params)
+
+    async def send(self, messages: Sequence[EmailMessage]) -> List[Optional[str]]:
+        errors: List[Optional[str]] = []
+
+        for start in range(0, len(messages), self.MAX_BATCH_SIZE):
+            chunk = messages[start : start + self.MAX_BATCH_SIZE]
+
+            try:
+                await asyncio.to_thread(self._send_batch, chunk)
+                errors.extend(None for _ in chunk)
+            except Exception as e:
+                errors.extend(str(e) or e.__class__.__name__ for _ in chunk)
+
+        return errors
+
+
+def _to_mime(message: EmailMessage) -> MIMEEmailMessage:
+    mime = MIMEEmailMessage()
+    mime["From"] = sender
+    mime["To"] = message.to
+    mime["Subject"] = message.subject
+    mime.set_content(message.html, subtype="html")
+    return mime
+
+
+class SMTPEmailTransport(EmailTransport):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        use_tls: bool = False,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+
+    def _send_all(self, messages: Sequence[EmailMessage]) -> List[Optional[str]]:
+        errors: List[Optional[str]] = []
+
+        with smtplib.SMTP(self.host, self.port) as smtp:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+
+            for message in messages:
+                try:
+                    smtp.send_message(_to_mime(message))
+                    errors.append(None)
+                except smtplib.SMTPException as e:
+                    errors.append(str(e))
+
+        return errors
+
+    async def send(self, messages: Sequence[EmailMessage]) -> List[Optional[str]]:
+        try:
+            return await asyncio.to_thread(self._send_all, messages)
+        except (OSError, smtplib.SMTPException) as e:
+            return [str(e) for _ in messages]
+
+
+class FileEmailTransport(EmailTransport):
+    """Writes every email as an `.eml` file, for local development and tests."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+
+    def _write_all(self, messages: Sequence[EmailMessage]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        for message in messages:
+            path = self.directory / f"{uuid.uuid4()}.eml"
+            path.write_bytes(_to_mime(message).as_bytes())
+
+    async def send(self, messages: Sequence[EmailMessage]) -> List[Optional[str]]:
+        try:
+            await asyncio.to_thread(self._write_all, messages)
+        except OSError as e:
+            return [str(e) for _ in messages]
 
+        return [None for _ in messages]
 
-def send_html_email(to: str, subject: str, html: str) -> bool:
-    params: resend.Emails.SendParams = {
-        "from": f"SigmaChain Info <{email_from}>",
-        "to": to,
-        "subject": subject,
-        "html": html,
-    }
 
-    email = resend.Emails.send(params)
+def get_email_transport() -> EmailTransport:
+    if EMAIL_TRANSPORT == "smtp":
+        return SMTPEmailTransport(
+            host=str(config("SMTP_HOST", default="localhost")),
+            port=config("SMTP_PORT", default=25, cast=int),
+            username=str(config("SMTP_USERNAME", default="")),
+            password=str(config("SMTP_PASSWORD", default="")),
+            use_tls=config("SMTP_USE_TLS", default=False, cast=bool),
+        )
 
-    if email is None:
-        return False
+    if EMAIL_TRANSPORT == "file":
+        return FileEmailTransport(
+            directory=str(config("EMAIL_FILE_DIR", default="sent_emails"))
+        )
 
-    return True
+    return ResendEmailTransport(api_key=str(config("RESEND_API_KEY")))
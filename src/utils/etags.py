@@ -0,0 +1,57 @@
+import hashlib
+from typing import Dict, Mapping, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from src.database.versions import ResourceVersion
+
+# Responses depend on the caller's token, so only the client may cache them.
+# Immutable resources are never revalidated, the rest on every use.
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def cache_headers(
+    version: Optional[ResourceVersion], *queries: BaseModel
+) -> Dict[str, str]:
+    """
+    `ETag` and `Cache-Control` of a resource at `version`, `queries` being the
+    query models that shape its representation. Empty when there is no version
+    (e.g. the resource doesn't exist).
+    """
+    if version is None:
+        return {}
+
+    fingerprint = hashlib.sha256(version.digest.encode("utf-8"))
+
+    for query in queries:
+        fingerprint.update(query.model_dump_json().encode("utf-8"))
+
+    return {
+        "ETag": f'"{fingerprint.hexdigest()[:32]}"',
+        "Cache-Control": (
+            IMMUTABLE_CACHE_CONTROL if version.immutable else REVALIDATE_CACHE_CONTROL
+        ),
+    }
+
+
+def is_not_modified(request: Request, headers: Mapping[str, str]) -> bool:
+    etag = headers.get("ETag")
+    if_none_match = request.headers.get("if-none-match")
+
+    if not etag or not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match uses the weak comparison, `W/"x"` matches `"x"`.
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def not_modified_response(headers: Mapping[str, str]) -> Response:
+    return Response(status_code=304, headers=dict(headers))
@@ -1,4 +1,5 @@
-from typing import List
+import math
+from typing import Any, Dict, List
 
 from fastapi.exceptions import HTTPException
 
@@ -39,11 +40,21 @@ class BadRequestError(HTTPException):
 
     def __init__(
         self,
-        detail: str | List[str] = "Bad request error.",
+        detail: str | List[str] | List[Dict[str, Any]] = "Bad request error.",
     ) -> None:
         super().__init__(status_code=400, detail=detail)
 
 
+class ForbiddenError(HTTPException):
+    """Exception when the caller is not allowed to perform the operation."""
+
+    def __init__(
+        self,
+        detail: str | List[str] = "Forbidden.",
+    ) -> None:
+        super().__init__(status_code=403, detail=detail)
+
+
 class NotFoundError(HTTPException):
     """Exception when a resource is not found in the database."""
 
@@ -64,6 +75,21 @@ class UnprocessableEntityError(HTTPException):
         super().__init__(status_code=422, detail=detail)
 
 
+class TooManyRequestsError(HTTPException):
+    """Exception when the caller exceeded a rate limit."""
+
+    def __init__(
+        self,
+        retry_after: float,
+        detail: str | List[str] = "Too many requests.",
+    ) -> None:
+        super().__init__(
+            status_code=429,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
 class InternalServerError(HTTPException):
     """Exception when an internal server error occurs."""
 
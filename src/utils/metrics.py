@@ -0,0 +1,52 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_LATENCY_BUCKETS_MS: Sequence[float] = (
+    1,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram, snapshotted with cumulative counts per bucket."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts: List[int] = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            total = self._sum
+
+        buckets: List[Dict[str, Optional[float]]] = []
+        cumulative = 0
+
+        for bound, bucket_count in zip([*self.buckets, None], counts):
+            cumulative += bucket_count
+            buckets.append({"le": bound, "count": cumulative})
+
+        return {"buckets": buckets, "count": count, "sum": total}
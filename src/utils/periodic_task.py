@@ -0,0 +1,71 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from typing import Optional
+
+
+class PeriodicTask(ABC):
+    """
+    Background task of a worker calling `_run_once` every `interval` seconds,
+    from `start()` until `stop()`. A failed run is logged with
+    `failure_message` and the task goes on, the next run is the retry.
+    """
+
+    failure_message = "Failed to run the periodic task"
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+
+        self._wake_up = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    ## Friendly methods
+
+    @abstractmethod
+    async def _run_once(self) -> Optional[bool]:
+        """One run of the task. Returning `True` runs it again without waiting."""
+
+    async def _run(self) -> None:
+        # Logged under the module of the task, not this one.
+        logger = logging.getLogger(type(self).__module__)
+
+        while True:
+            self._wake_up.clear()
+
+            try:
+                run_again = await self._run_once()
+            except Exception:
+                logger.exception(self.failure_message)
+                run_again = False
+
+            if run_again:
+                continue
+
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake_up.wait(), self.interval)
+
+    ## Public methods
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def wake_up(self) -> None:
+        """Starts the next run right away instead of after the interval."""
+        self._wake_up.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
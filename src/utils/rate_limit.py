@@ -0,0 +1,160 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Protocol, Tuple
+
+from decouple import Choices, config
+
+from src.utils.redis_client import get_redis_client
+
+RATE_LIMIT_BACKEND = config(
+    "RATE_LIMIT_BACKEND",
+    default="memory",
+    cast=Choices(["memory", "redis"]),
+)
+RATE_LIMIT_SHARDS = config("RATE_LIMIT_SHARDS", default=16, cast=int)
+RATE_LIMIT_MAX_KEYS = config("RATE_LIMIT_MAX_KEYS", default=100_000, cast=int)
+RATE_LIMIT_KEY_PREFIX = str(
+    config("RATE_LIMIT_KEY_PREFIX", default="sigmachain:rate-limit:")
+)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Bucket of `capacity` tokens refilled over `period` seconds."""
+
+    capacity: int
+    period: float
+
+    @property
+    def rate(self) -> float:
+        """Tokens refilled per second."""
+        return self.capacity / self.period
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parses `<capacity>/<period in seconds>`, e.g. `"10/60"`."""
+        capacity, _, period = value.partition("/")
+        limit = cls(capacity=int(capacity), period=float(period))
+
+        if limit.capacity < 1 or limit.period <= 0:
+            raise ValueError(f"Invalid rate limit: {value}")
+
+        return limit
+
+
+def take_token(
+    tokens: float, updated_at: float, now: float, limit: RateLimit
+) -> Tuple[float, float]:
+    """
+    Refills a bucket holding `tokens` at `updated_at` up to `now` and takes a
+    token from it. Returns the tokens left and the seconds to wait for a token,
+    0 when it was taken.
+    """
+    tokens = min(limit.capacity, tokens + (now - updated_at) * limit.rate)
+
+    if tokens >= 1:
+        return tokens - 1, 0.0
+
+    return tokens, (1 - tokens) / limit.rate
+
+
+class RateLimitBackend(ABC):
+    """Token buckets by key. Implementations must not block the event loop."""
+
+    @abstractmethod
+    async def take(self, key: str, limit: RateLimit) -> float:
+        """
+        Takes a token from the bucket of `key`. Returns 0 when it was taken,
+        otherwise the seconds until one is available.
+        """
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    Per-process buckets, spread over `shards` LRUs so evictions past
+    `max_keys` only scan one of them. Each worker enforces its own limits.
+    """
+
+    def __init__(
+        self, shards: int = RATE_LIMIT_SHARDS, max_keys: int = RATE_LIMIT_MAX_KEYS
+    ) -> None:
+        self.max_keys_per_shard = max(1, max_keys // shards)
+        # Key -> (tokens, updated at (monotonic clock)).
+        self._shards: List[OrderedDict[str, Tuple[float, float]]] = [
+            OrderedDict() for _ in range(shards)
+        ]
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        shard = self._shards[hash(key) % len(self._shards)]
+        now = time.monotonic()
+
+        # A missing bucket is a full one, so evicting idle buckets is harmless.
+        tokens, updated_at = shard.pop(key, (limit.capacity, now))
+        tokens, retry_after = take_token(tokens, updated_at, now, limit)
+
+        shard[key] = (tokens, now)
+
+        while len(shard) > self.max_keys_per_shard:
+            shard.popitem(last=False)
+
+        return retry_after
+
+
+class ScriptStore(Protocol):
+    """Runs Lua scripts atomically, as `Redis.eval` of the shared redis client."""
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any: ...
+
+
+# Same algorithm as `take_token`, run atomically with the clock of the server.
+_TAKE_TOKEN_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+local retry_after = 0
+
+tokens = math.min(capacity, tokens + (now - updated_at) * rate)
+
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+
+return tostring(retry_after)
+"""
+
+
+class SharedRateLimitBackend(RateLimitBackend):
+    """Buckets shared by every worker, so limits hold across all of them."""
+
+    def __init__(self, store: ScriptStore, prefix: str = RATE_LIMIT_KEY_PREFIX) -> None:
+        self.store = store
+        self.prefix = prefix
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        retry_after = await self.store.eval(
+            _TAKE_TOKEN_SCRIPT,
+            1,
+            self.prefix + key,
+            limit.capacity,
+            repr(limit.rate),
+        )
+
+        return float(retry_after)
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    if RATE_LIMIT_BACKEND == "redis":
+        return SharedRateLimitBackend(get_redis_client("RATE_LIMIT_BACKEND=redis"))
+
+    return MemoryRateLimitBackend()
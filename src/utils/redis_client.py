@@ -0,0 +1,27 @@
+from typing import Any, Optional
+
+from decouple import config
+
+REDIS_URL = str(config("REDIS_URL", default="redis://localhost:6379/0"))
+
+_client: Optional[Any] = None
+
+
+def get_redis_client(required_by: str) -> Any:
+    """
+    `redis.asyncio` client of `REDIS_URL`, built on first use and shared by
+    every backend of the process. `required_by` names the setting needing it
+    in the error raised when the package is missing.
+    """
+    global _client
+
+    if _client is None:
+        # Optional dependency, only needed by the backends shared by workers.
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError(f"{required_by} requires the `redis` package") from e
+
+        _client = Redis.from_url(REDIS_URL)
+
+    return _client
@@ -0,0 +1,45 @@
+import json
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class ModelResponse(Response):
+    """
+    JSON response that serializes a pydantic model straight to bytes, instead of
+    dumping it to Python objects first and running `json.dumps` over them.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+
+        return super().render(content)
+
+
+class RawDataResponse(Response):
+    """
+    `APIResponse` whose `data` is a JSON document serialized beforehand (e.g. by
+    Postgres), written to the body as is instead of being parsed and dumped again.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        msg: str,
+        data: str,
+        ok: bool = True,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        content = '{"msg":%s,"data":%s,"ok":%s}' % (
+            json.dumps(msg, ensure_ascii=False),
+            data,
+            json.dumps(ok),
+        )
+
+        super().__init__(content=content, status_code=status_code, headers=headers)
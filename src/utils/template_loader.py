@@ -1,7 +1,60 @@
-from jinja2 import Template
+import asyncio
+from pathlib import Path
+from typing import Any, Optional
 
+from decouple import config
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
 
-def load_html_template(template_path: str, **kwargs):
-    with open(template_path, "r", encoding="utf-8") as file:
-        template = Template(file.read())
-    return template.render(**kwargs)
+TEMPLATES_DIR = str(config("TEMPLATES_DIR", default="templates"))
+# Empty disables the on-disk bytecode cache.
+TEMPLATES_BYTECODE_CACHE_DIR = str(config("TEMPLATES_BYTECODE_CACHE_DIR", default=""))
+TEMPLATES_RENDER_OFFLOAD = config("TEMPLATES_RENDER_OFFLOAD", default=False, cast=bool)
+
+
+def _get_bytecode_cache() -> Optional[BytecodeCache]:
+    if not TEMPLATES_BYTECODE_CACHE_DIR:
+        return None
+
+    Path(TEMPLATES_BYTECODE_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(TEMPLATES_BYTECODE_CACHE_DIR)
+
+
+# Process-wide environment: templates are compiled once and kept in memory, the
+# files are not checked for changes after that.
+environment = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=select_autoescape(["html"]),
+    bytecode_cache=_get_bytecode_cache(),
+    auto_reload=False,
+    cache_size=-1,
+)
+
+
+def precompile_templates() -> int:
+    """Compiles every template up front, meant to be called at startup."""
+    template_names = environment.list_templates()
+
+    for template_name in template_names:
+        environment.get_template(template_name)
+
+    return len(template_names)
+
+
+def render_template(template_name: str, **kwargs: Any) -> str:
+    return environment.get_template(template_name).render(**kwargs)
+
+
+async def render_template_async(
+    template_name: str, offload: bool = TEMPLATES_RENDER_OFFLOAD, **kwargs: Any
+) -> str:
+    """Renders the template, in a worker thread when `offload` is set."""
+    if offload:
+        return await asyncio.to_thread(render_template, template_name, **kwargs)
+
+    return render_template(template_name, **kwargs)
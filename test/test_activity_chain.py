@@ -0,0 +1,147 @@
+from typing import List
+from uuid import UUID
+
+import pytest
+
+from src.database.models.workflow.enums import AssigneeEnum
+from src.service_gateway.api.v1.schemas.workflow.activity_asignees_schemas import (
+    ActivityAsigneesInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.activity_schemas import (
+    ActivityInput,
+    ActivityUpdate,
+)
+from src.service_gateway.api.v1.schemas.workflow.request_pattern_schemas import (
+    RequestPatternInput,
+    RequestPatternUpdate,
+)
+from src.service_gateway.api.v1.services.activity_service import ActivityService
+from src.service_gateway.api.v1.services.request_pattern_service import (
+    RequestPatternService,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def activities_input(length: int, user_id: UUID, group_id: UUID) -> List[ActivityInput]:
+    """A requester step followed by steps alternately assigned to a user and a group."""
+    activities = [
+        ActivityInput(
+            activity_order=0,
+            label="Request",
+            assignee=ActivityAsigneesInput(assignee_type=AssigneeEnum.REQUESTER),
+        )
+    ]
+
+    for order in range(1, length):
+        assignee = (
+            ActivityAsigneesInput(assignee_type=AssigneeEnum.USER, user_id=user_id)
+            if order % 2
+            else ActivityAsigneesInput(
+                assignee_type=AssigneeEnum.GROUP, group_id=group_id
+            )
+        )
+        activities.append(
+            ActivityInput(
+                activity_order=order, label=f"Step {order}", assignee=assignee
+            )
+        )
+
+    return activities
+
+
+async def create_request_pattern(
+    db, length: int, user_id: UUID, group_id: UUID
+) -> UUID:
+    request_pattern = await RequestPatternService(db).create_request_pattern(
+        RequestPatternInput(
+            label=f"Pattern of {length}",
+            description="",
+            groups=[group_id],
+            activities=activities_input(length, user_id, group_id),
+        )
+    )
+
+    return request_pattern.request_pattern_id
+
+
+async def test_activities_chain_is_read_in_a_constant_number_of_statements(
+    db, session_factory, statements, user_id, group_id
+):
+    short_id = await create_request_pattern(db, 1, user_id, group_id)
+    long_id = await create_request_pattern(db, 20, user_id, group_id)
+
+    counts = {}
+
+    for request_pattern_id, length in ((short_id, 1), (long_id, 20)):
+        # A new session, so nothing is served from the identity map.
+        async with session_factory() as session:
+            with statements:
+                chain = await ActivityService(session)._get_activities_chain(
+                    request_pattern_id
+                )
+                activities = chain._to_activities_read()
+
+        assert len(activities) == length
+        assert activities[-1].assignee is not None
+        counts[length] = len(statements)
+
+    assert counts[1] == counts[20] == 1
+
+
+async def test_activities_chain_is_created_in_a_constant_number_of_statements(
+    db, statements, user_id, group_id
+):
+    counts = {}
+
+    for length in (3, 30):
+        with statements:
+            await create_request_pattern(db, length, user_id, group_id)
+
+        counts[length] = len(statements)
+
+    # The groups lookup, 5 writes, then the pattern, its groups and its chain.
+    assert counts[3] == counts[30] == 9
+
+
+async def test_activities_chain_is_updated_in_a_constant_number_of_statements(
+    db, session_factory, statements, user_id, group_id
+):
+    request_pattern_id = await create_request_pattern(db, 4, user_id, group_id)
+
+    async with session_factory() as session:
+        chain = await ActivityService(session)._get_activities_chain(request_pattern_id)
+        activity_ids = [
+            activity.activity_id for activity in chain._to_activities_read()
+        ]
+
+    # Keeps the first and third activities, adds one and deletes the others.
+    update = RequestPatternUpdate(
+        activities=[
+            ActivityUpdate(activity_order=0, activity_id=activity_ids[0]),
+            ActivityUpdate(activity_order=1, activity_id=activity_ids[2]),
+            ActivityUpdate(
+                activity_order=2,
+                label="Approve",
+                description="Final approval",
+                assignee=ActivityAsigneesInput(
+                    assignee_type=AssigneeEnum.GROUP, group_id=group_id
+                ),
+            ),
+        ],
+        activities_to_delete=[activity_ids[1], activity_ids[3]],
+    )
+
+    async with session_factory() as session:
+        with statements:
+            request_pattern = await RequestPatternService(
+                session
+            ).update_request_pattern(request_pattern_id, update)
+
+    # 2 reads, 4 writes, then the request pattern, its groups and its chain.
+    assert len(statements) == 9
+    assert [activity.label for activity in request_pattern.activities] == [
+        "Request",
+        "Step 2",
+        "Approve",
+    ]
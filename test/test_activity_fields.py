@@ -0,0 +1,167 @@
+from typing import List, Tuple
+from uuid import UUID
+
+import pytest
+
+from src.database.models.workflow.enums import AssigneeEnum, InputTypeEnum
+from src.service_gateway.api.v1.schemas.workflow.activity_asignees_schemas import (
+    ActivityAsigneesInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.activity_fields_shemas import (
+    ActivityFieldsInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.activity_schemas import ActivityInput
+from src.service_gateway.api.v1.schemas.workflow.form_field_schemas import (
+    FormFieldInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.form_pattern_schemas import (
+    FormPatternInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.request_pattern_schemas import (
+    RequestPatternInput,
+)
+from src.service_gateway.api.v1.services.activity_service import ActivityService
+from src.service_gateway.api.v1.services.request_pattern_service import (
+    RequestPatternService,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_request_pattern(
+    session_factory, length: int, user_id: UUID, group_id: UUID
+) -> Tuple[UUID, List[int], List[int]]:
+    """
+    A chain of `length` activities, each one but the last with a form of a
+    section and a field. Returns the pattern id, the activity ids and the field ids in order.
+    """
+    async with session_factory() as session:
+        request_pattern = await RequestPatternService(session).create_request_pattern(
+            RequestPatternInput(
+                label=f"Pattern of {length}",
+                description="",
+                groups=[group_id],
+                activities=[
+                    ActivityInput(
+                        activity_order=0,
+                        label="Request",
+                        assignee=ActivityAsigneesInput(
+                            assignee_type=AssigneeEnum.REQUESTER
+                        ),
+                    ),
+                    *(
+                        ActivityInput(
+                            activity_order=order,
+                            label=f"Step {order}",
+                            assignee=ActivityAsigneesInput(
+                                assignee_type=AssigneeEnum.USER, user_id=user_id
+                            ),
+                        )
+                        for order in range(1, length)
+                    ),
+                ],
+            )
+        )
+        request_pattern_id = request_pattern.request_pattern_id
+
+    async with session_factory() as session:
+        chain = await ActivityService(session)._get_activities_chain(request_pattern_id)
+        activity_ids = [
+            activity.activity_id for activity in chain._to_activities_read()
+        ]
+
+    form_field_ids: List[int] = []
+
+    for order, activity_id in enumerate(activity_ids[:-1]):
+        async with session_factory() as session:
+            form_pattern = await RequestPatternService(
+                session
+            ).create_form_pattern_for_activity(
+                request_pattern_id,
+                activity_id,
+                FormPatternInput(
+                    fields=[
+                        FormFieldInput(
+                            form_field_order=field_order,
+                            input_type=(
+                                InputTypeEnum.SHORT_TEXT
+                                if field_order
+                                else InputTypeEnum.SECTION
+                            ),
+                            title=f"Field {order}.{field_order}",
+                        )
+                        for field_order in range(2)
+                    ]
+                ),
+            )
+        form_field_ids += [field.form_field_id for field in form_pattern.fields]
+
+    return request_pattern_id, activity_ids, form_field_ids
+
+
+async def test_fields_display_is_replaced_by_the_new_selection(
+    session_factory, statements, user_id, group_id
+):
+    request_pattern_id, activity_ids, form_field_ids = await create_request_pattern(
+        session_factory, 4, user_id, group_id
+    )
+    last_activity_id = activity_ids[-1]
+    counts = []
+
+    # The second selection keeps one field, drops one and adds two.
+    for selection in (form_field_ids[:2], form_field_ids[1:4]):
+        async with session_factory() as session:
+            with statements:
+                await RequestPatternService(
+                    session
+                ).put_request_pattern_activity_fields(
+                    request_pattern_id,
+                    last_activity_id,
+                    ActivityFieldsInput(fields=selection),
+                )
+        counts.append(len(statements))
+
+        async with session_factory() as session:
+            fields_display = await RequestPatternService(session)._get_fields_display(
+                [last_activity_id]
+            )
+
+        assert sorted(fields_display[last_activity_id]) == sorted(selection)
+
+    # The pattern, its chain, the fields and options of every upstream form in
+    # one batch, then the rows replaced in one statement.
+    assert counts == [5, 5]
+
+    # As many for a single upstream step.
+    async with session_factory() as session:
+        with statements:
+            await RequestPatternService(session).put_request_pattern_activity_fields(
+                request_pattern_id,
+                activity_ids[1],
+                ActivityFieldsInput(fields=form_field_ids[:1]),
+            )
+
+    assert len(statements) == 5
+
+
+async def test_fields_display_is_cleared_by_an_empty_selection(
+    session_factory, user_id, group_id
+):
+    request_pattern_id, activity_ids, form_field_ids = await create_request_pattern(
+        session_factory, 2, user_id, group_id
+    )
+
+    for selection in (form_field_ids, []):
+        async with session_factory() as session:
+            await RequestPatternService(session).put_request_pattern_activity_fields(
+                request_pattern_id,
+                activity_ids[-1],
+                ActivityFieldsInput(fields=selection),
+            )
+
+    async with session_factory() as session:
+        fields_display = await RequestPatternService(session)._get_fields_display(
+            [activity_ids[-1]]
+        )
+
+    assert fields_display == {}
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from src.utils.cache import Cache, CacheBackend, SharedCacheBackend
+
+pytestmark = pytest.mark.anyio
+
+
+class DictStore:
+    """Local stand-in for the redis client behind `SharedCacheBackend`."""
+
+    def __init__(self) -> None:
+        self.entries: Dict[str, Tuple[float, bytes]] = {}
+
+    async def get(self, name: str) -> Optional[bytes]:
+        entry = self.entries.get(name)
+
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+
+        return entry[1]
+
+    async def set(self, name: str, value: bytes, px: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + px / 1000 if px else float("inf")
+        self.entries[name] = (expires_at, value)
+
+    async def delete(self, *names: str) -> None:
+        for name in names:
+            self.entries.pop(name, None)
+
+
+class FailingBackend(CacheBackend):
+    async def get(self, key):
+        raise ConnectionError("down")
+
+    async def set(self, key, value, ttl):
+        raise ConnectionError("down")
+
+    async def delete(self, *keys):
+        raise ConnectionError("down")
+
+
+class Loads:
+    """Loader returning `value-<n>` on its n-th call."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        return f"value-{self.calls}".encode()
+
+
+@pytest.fixture
+def store() -> DictStore:
+    return DictStore()
+
+
+async def test_shared_backend_prefixes_keys_and_expires_entries(store):
+    backend = SharedCacheBackend(store, prefix="test:")
+
+    await backend.set("a", b"1", ttl=60)
+    await backend.set("b", b"2", ttl=0.001)
+    await asyncio.sleep(0.01)
+
+    assert set(store.entries) == {"test:a", "test:b"}
+    assert await backend.get("a") == b"1"
+    assert await backend.get("b") is None
+
+    await backend.delete("a", "b")
+
+    assert store.entries == {}
+
+
+async def test_invalidation_reaches_every_worker(store):
+    # Two workers, each with its own `Cache`, sharing the store.
+    first = Cache(SharedCacheBackend(store), namespace="roles", ttl=60)
+    second = Cache(SharedCacheBackend(store), namespace="roles", ttl=60)
+    load = Loads()
+
+    assert await first.get_or_load("ada", load) == b"value-1"
+    assert await second.get_or_load("ada", load) == b"value-1"
+
+    await first.invalidate("ada")
+
+    assert await second.get_or_load("ada", load) == b"value-2"
+    assert load.calls == 2
+
+
+async def test_stale_entry_is_served_while_one_refresh_runs(store):
+    # Stale as soon as it is written.
+    cache = Cache(SharedCacheBackend(store), namespace="tree", ttl=0, stale_ttl=60)
+    load = Loads()
+    refreshes: List[bytes] = []
+    release = asyncio.Event()
+
+    async def refresh() -> bytes:
+        await release.wait()
+        refreshes.append(b"fresh")
+        return b"fresh"
+
+    assert await cache.get_or_load("groups", load) == b"value-1"
+
+    stale = await asyncio.gather(
+        *(cache.get_or_load("groups", load, refresh) for _ in range(3))
+    )
+
+    assert stale == [b"value-1"] * 3
+    assert load.calls == 1
+
+    release.set()
+    await asyncio.gather(*cache._refreshes.values())
+
+    assert refreshes == [b"fresh"]
+    _, value = await cache._read(cache._key("groups"))
+    assert value == b"fresh"
+
+
+async def test_load_started_before_an_invalidation_is_not_stored(store):
+    cache = Cache(SharedCacheBackend(store), namespace="tree", ttl=60)
+    loading = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_load() -> bytes:
+        loading.set()
+        await release.wait()
+        return b"before"
+
+    pending = asyncio.create_task(cache.get_or_load("groups", slow_load))
+    await loading.wait()
+    await cache.invalidate("groups")
+    release.set()
+
+    assert await pending == b"before"
+    assert store.entries == {}
+
+
+async def test_failing_backend_is_a_miss():
+    cache = Cache(FailingBackend(), namespace="tree", ttl=60)
+    load = Loads()
+
+    assert await cache.get_or_load("groups", load) == b"value-1"
+    assert await cache.get_or_load("groups", load) == b"value-2"
+
+    await cache.invalidate("groups")
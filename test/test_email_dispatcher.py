@@ -0,0 +1,151 @@
+from datetime import timedelta
+from typing import List, Optional, Sequence
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.future import select
+
+from src.database.models.access_control.secure_code import SecureCode
+from src.database.models.messaging.email_outbox import EmailOutbox
+from src.database.models.messaging.enums import EmailStatusEnum
+from src.service_gateway.api.v1.functions.email_dispatcher import (
+    EmailDispatcher,
+    _utcnow,
+)
+from src.service_gateway.api.v1.services.user_service import UserService
+from src.utils.email_sender import EmailMessage, EmailTransport
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingTransport(EmailTransport):
+    """Delivers everything, checking no dispatcher lock is held meanwhile."""
+
+    def __init__(self, session_factory) -> None:
+        self.session_factory = session_factory
+        self.sent: List[EmailMessage] = []
+
+    async def send(self, messages: Sequence[EmailMessage]) -> List[Optional[str]]:
+        async with self.session_factory() as db:
+            # Raises if the rows being sent are still locked.
+            await db.execute(
+                select(EmailOutbox.email_outbox_id).with_for_update(nowait=True)
+            )
+
+        self.sent.extend(messages)
+
+        return [None for _ in messages]
+
+
+@pytest.fixture
+def transport(session_factory) -> RecordingTransport:
+    return RecordingTransport(session_factory)
+
+
+@pytest.fixture
+def dispatcher(transport, session_factory) -> EmailDispatcher:
+    return EmailDispatcher(transport=transport, session_factory=session_factory)
+
+
+async def get_emails(session_factory) -> List[EmailOutbox]:
+    async with session_factory(expire_on_commit=False) as db:
+        result = await db.execute(select(EmailOutbox).order_by(EmailOutbox.created_at))
+        return list(result.scalars())
+
+
+async def test_sent_email_is_scrubbed(
+    db, session_factory, dispatcher, transport, user_id
+):
+    await UserService(db).create_secure_code(user_id, "ada@example.com")
+
+    assert await dispatcher.dispatch_batch() == 1
+
+    [email] = await get_emails(session_factory)
+    assert email.status == EmailStatusEnum.SENT
+    assert email.attempts == 1
+    assert email.context == {}
+    assert email.lease_id is None
+    assert [message.to for message in transport.sent] == ["ada@example.com"]
+
+
+async def test_expired_email_is_not_sent(
+    db, session_factory, dispatcher, transport, user_id
+):
+    await UserService(db).create_secure_code(user_id, "ada@example.com")
+
+    async with session_factory() as session:
+        await session.execute(
+            update(EmailOutbox).values(expires_at=_utcnow() - timedelta(seconds=1))
+        )
+        await session.commit()
+
+    assert await dispatcher.dispatch_batch() == 1
+
+    [email] = await get_emails(session_factory)
+    assert email.status == EmailStatusEnum.FAILED
+    assert email.context == {}
+    assert transport.sent == []
+
+
+async def test_retry_past_expiry_gives_up(db, session_factory, user_id):
+    class FailingTransport(EmailTransport):
+        async def send(self, messages):
+            return ["Provider down" for _ in messages]
+
+    dispatcher = EmailDispatcher(
+        transport=FailingTransport(),
+        session_factory=session_factory,
+        retry_base_delay=16 * 60,
+        retry_max_delay=16 * 60,
+    )
+    await UserService(db).create_secure_code(user_id, "ada@example.com")
+
+    await dispatcher.dispatch_batch()
+
+    [email] = await get_emails(session_factory)
+    assert email.status == EmailStatusEnum.FAILED
+    assert email.last_error.startswith("Expired before delivery")
+    assert email.context == {}
+
+
+async def test_superseded_email_is_not_sent(
+    db, session_factory, dispatcher, transport, user_id
+):
+    service = UserService(db)
+    await service.create_secure_code(user_id, "ada@example.com")
+    await service.create_secure_code(user_id, "ada@example.com")
+
+    assert await dispatcher.dispatch_batch() == 1
+
+    async with session_factory() as session:
+        result = await session.execute(
+            select(SecureCode.code).where(SecureCode.has_been_used.is_(False))
+        )
+        code = result.scalar_one()
+
+    superseded, sent = await get_emails(session_factory)
+    assert superseded.status == EmailStatusEnum.FAILED
+    assert superseded.context == {}
+    assert sent.status == EmailStatusEnum.SENT
+    assert len(transport.sent) == 1
+    assert code in transport.sent[0].html
+
+
+async def test_purge_deletes_old_finished_emails(
+    db, session_factory, dispatcher, user_id
+):
+    service = UserService(db)
+    await service.create_secure_code(user_id, "ada@example.com")
+    await dispatcher.dispatch_batch()
+    await service.create_secure_code(user_id, "ada@example.com")
+
+    async with session_factory() as session:
+        await session.execute(
+            update(EmailOutbox).values(created_at=_utcnow() - timedelta(days=30))
+        )
+        await session.commit()
+
+    assert await dispatcher.purge() == 1
+
+    [email] = await get_emails(session_factory)
+    assert email.status == EmailStatusEnum.PENDING
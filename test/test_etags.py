@@ -0,0 +1,190 @@
+from uuid import UUID
+
+import pytest
+from sqlalchemy import insert, update
+
+from src.database.models.access_control.group import UserGroups
+from src.database.models.workflow.activity import Activity
+from src.database.models.workflow.enums import AssigneeEnum, InputTypeEnum
+from src.database.models.workflow.field_option import FieldOption
+from src.service_gateway.api.v1.schemas.access_control.group_schemas import (
+    GroupFilters,
+)
+from src.service_gateway.api.v1.schemas.workflow.activity_asignees_schemas import (
+    ActivityAsigneesInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.activity_schemas import ActivityInput
+from src.service_gateway.api.v1.schemas.workflow.field_option_schemas import (
+    FieldOptionInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.form_field_schemas import (
+    FormFieldInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.form_pattern_schemas import (
+    FormPatternInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.request_pattern_schemas import (
+    RequestPatternInput,
+    RequestPatternQuery,
+)
+from src.service_gateway.api.v1.services.form_pattern_service import (
+    FormPatternService,
+)
+from src.service_gateway.api.v1.services.group_service import GroupService
+from src.service_gateway.api.v1.services.request_pattern_service import (
+    RequestPatternService,
+)
+from src.utils.etags import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_request_pattern(db, group_id: UUID):
+    """A single requester step with a form holding a choice field."""
+    service = RequestPatternService(db)
+    request_pattern = await service.create_request_pattern(
+        RequestPatternInput(
+            label="Leave",
+            description="",
+            groups=[group_id],
+            activities=[
+                ActivityInput(
+                    activity_order=0,
+                    label="Request",
+                    assignee=ActivityAsigneesInput(
+                        assignee_type=AssigneeEnum.REQUESTER
+                    ),
+                )
+            ],
+        )
+    )
+    form_pattern = await service.create_form_pattern_for_activity(
+        request_pattern.request_pattern_id,
+        request_pattern.activity_id,
+        FormPatternInput(
+            fields=[
+                FormFieldInput(
+                    form_field_order=0, input_type=InputTypeEnum.SECTION, title="Data"
+                ),
+                FormFieldInput(
+                    form_field_order=1,
+                    input_type=InputTypeEnum.SINGLE_CHOICE,
+                    title="Size",
+                    options=[
+                        FieldOptionInput(title="Small", option_order=0),
+                        FieldOptionInput(title="Large", option_order=1),
+                    ],
+                ),
+            ]
+        ),
+    )
+
+    return request_pattern.request_pattern_id, form_pattern.form_pattern_id
+
+
+async def test_writes_to_child_rows_change_the_digest(
+    db, session_factory, group_id, user_id
+):
+    request_pattern_id, form_pattern_id = await create_request_pattern(db, group_id)
+    query = RequestPatternQuery(include_activities=True)
+    # Filtered by name, so it is computed from the database.
+    filters = GroupFilters(name="Reviewers", include_users=True)
+
+    async def versions():
+        async with session_factory() as session:
+            return (
+                await RequestPatternService(session).get_request_pattern_version(
+                    request_pattern_id, query
+                ),
+                await FormPatternService(session).get_form_pattern_version(
+                    form_pattern_id
+                ),
+                await GroupService(session).get_groups_version(filters),
+            )
+
+    before = await versions()
+
+    async with session_factory() as session:
+        await session.execute(update(Activity).values(label="Edited"))
+        await session.commit()
+
+    after_activity = await versions()
+
+    assert after_activity[0] != before[0]
+    assert after_activity[1:] == before[1:]
+
+    async with session_factory() as session:
+        await session.execute(
+            update(FieldOption)
+            .where(FieldOption.option_order == 1)
+            .values(title="Extra large")
+        )
+        await session.commit()
+
+    after_option = await versions()
+
+    assert after_option[1] != after_activity[1]
+    assert after_option[2] == after_activity[2]
+
+    async with session_factory() as session:
+        await session.execute(
+            insert(UserGroups).values(user_id=user_id, group_id=group_id)
+        )
+        await session.commit()
+
+    after_membership = await versions()
+
+    assert after_membership[2] != after_option[2]
+    assert after_membership[:2] == after_option[:2]
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/request-patterns/{request_pattern_id}", "/form-patterns/{form_pattern_id}"],
+)
+async def test_matching_etag_is_answered_before_loading_the_graph(
+    db, api_client, statements, group_id, path
+):
+    request_pattern_id, form_pattern_id = await create_request_pattern(db, group_id)
+    path = path.format(
+        request_pattern_id=request_pattern_id, form_pattern_id=form_pattern_id
+    )
+
+    response = await api_client.get(path)
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+
+    with statements:
+        response = await api_client.get(path, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    # The version statement only.
+    assert len(statements) == 1
+
+    response = await api_client.get(path, headers={"If-None-Match": '"outdated"'})
+
+    assert response.status_code == 200
+
+
+async def test_published_patterns_are_immutable_unless_groups_are_included(
+    db, api_client, group_id
+):
+    request_pattern_id, _ = await create_request_pattern(db, group_id)
+    path = f"/request-patterns/{request_pattern_id}"
+
+    response = await api_client.get(path)
+
+    assert response.headers["Cache-Control"] == REVALIDATE_CACHE_CONTROL
+
+    await RequestPatternService(db).publish_request_pattern(request_pattern_id)
+
+    response = await api_client.get(path, params={"include_activities": True})
+
+    assert response.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+
+    # Groups are read live, they can still change.
+    response = await api_client.get(path, params={"include_groups": True})
+
+    assert response.headers["Cache-Control"] == REVALIDATE_CACHE_CONTROL
@@ -0,0 +1,193 @@
+import pytest
+
+from src.database.models.workflow.enums import AssigneeEnum, InputTypeEnum
+from src.database.models.workflow.form_pattern import FormPattern
+from src.service_gateway.api.v1.schemas.workflow.activity_asignees_schemas import (
+    ActivityAsigneesInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.activity_schemas import ActivityInput
+from src.service_gateway.api.v1.schemas.workflow.field_option_schemas import (
+    FieldOptionInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.form_field_schemas import (
+    FormFieldInput,
+    FormFieldUpdate,
+)
+from src.service_gateway.api.v1.schemas.workflow.form_pattern_schemas import (
+    FormPatternInput,
+    FormPatternUpdate,
+)
+from src.service_gateway.api.v1.schemas.workflow.request_pattern_schemas import (
+    RequestPatternInput,
+)
+from src.service_gateway.api.v1.services.form_pattern_service import (
+    FormPatternService,
+)
+from src.service_gateway.api.v1.services.request_pattern_service import (
+    RequestPatternService,
+)
+from src.utils.http_exceptions import BadRequestError
+
+pytestmark = pytest.mark.anyio
+
+WRITES = ("INSERT", "UPDATE", "DELETE")
+
+
+async def test_invalid_options_of_a_new_field_are_rejected_before_any_write(
+    db, session_factory, statements
+):
+    request_pattern = await RequestPatternService(db).create_request_pattern(
+        RequestPatternInput(
+            label="Leave",
+            description="",
+            groups=[],
+            activities=[
+                ActivityInput(
+                    activity_order=0,
+                    label="Request",
+                    assignee=ActivityAsigneesInput(
+                        assignee_type=AssigneeEnum.REQUESTER
+                    ),
+                )
+            ],
+        )
+    )
+    form_pattern = await RequestPatternService(db).create_form_pattern_for_activity(
+        request_pattern.request_pattern_id,
+        request_pattern.activity_id,
+        FormPatternInput(
+            fields=[
+                FormFieldInput(
+                    form_field_order=0, input_type=InputTypeEnum.SECTION, title="Data"
+                ),
+                FormFieldInput(
+                    form_field_order=1,
+                    input_type=InputTypeEnum.SHORT_TEXT,
+                    title="Name",
+                ),
+            ]
+        ),
+    )
+    section, name = form_pattern.fields
+
+    update = FormPatternUpdate(
+        fields=[
+            FormFieldUpdate(form_field_order=0, form_field_id=section.form_field_id),
+            FormFieldUpdate(form_field_order=1, form_field_id=name.form_field_id),
+            FormFieldUpdate(
+                form_field_order=2,
+                input_type=InputTypeEnum.SINGLE_CHOICE,
+                title="Size",
+                # Orders must be continuous from 0.
+                options=[
+                    FieldOptionInput(title="Small", option_order=0),
+                    FieldOptionInput(title="Large", option_order=2),
+                ],
+            ),
+        ]
+    )
+
+    async with session_factory() as session:
+        with statements:
+            with pytest.raises(BadRequestError):
+                await FormPatternService(session).update_form_pattern(
+                    form_pattern.form_pattern_id, update
+                )
+
+    assert not [
+        statement
+        for statement in statements.statements
+        if statement.lstrip().upper().startswith(WRITES)
+    ]
+
+
+async def create_form_pattern(db, titles):
+    """A form pattern with a section followed by short text fields."""
+    request_pattern = await RequestPatternService(db).create_request_pattern(
+        RequestPatternInput(
+            label="Leave",
+            description="",
+            groups=[],
+            activities=[
+                ActivityInput(
+                    activity_order=0,
+                    label="Request",
+                    assignee=ActivityAsigneesInput(
+                        assignee_type=AssigneeEnum.REQUESTER
+                    ),
+                )
+            ],
+        )
+    )
+
+    return await RequestPatternService(db).create_form_pattern_for_activity(
+        request_pattern.request_pattern_id,
+        request_pattern.activity_id,
+        FormPatternInput(
+            fields=[
+                FormFieldInput(
+                    form_field_order=order,
+                    input_type=(
+                        InputTypeEnum.SECTION
+                        if order == 0
+                        else InputTypeEnum.SHORT_TEXT
+                    ),
+                    title=title,
+                )
+                for order, title in enumerate(titles)
+            ]
+        ),
+    )
+
+
+async def test_deleting_the_last_field_unlinks_the_new_last_one(db, session_factory):
+    form_pattern = await create_form_pattern(db, ["Data", "Name", "Age"])
+    section, name, age = form_pattern.fields
+
+    # Only `Name` is relinked, to no next field.
+    async with session_factory() as session:
+        await FormPatternService(session).update_form_pattern(
+            form_pattern.form_pattern_id,
+            FormPatternUpdate(
+                fields=[
+                    FormFieldUpdate(
+                        form_field_order=0, form_field_id=section.form_field_id
+                    ),
+                    FormFieldUpdate(
+                        form_field_order=1, form_field_id=name.form_field_id
+                    ),
+                ],
+                fields_to_delete=[age.form_field_id],
+            ),
+        )
+
+    async with session_factory() as session:
+        form_pattern = await FormPatternService(session).get_form_pattern(
+            form_pattern.form_pattern_id
+        )
+
+    assert [field.title for field in form_pattern.fields] == ["Data", "Name"]
+
+
+async def test_chain_of_one_field_is_linked(db):
+    service = FormPatternService(db)
+    (section,) = await service._insert_form_fields(
+        [
+            FormFieldInput(
+                form_field_order=0, input_type=InputTypeEnum.SECTION, title="Data"
+            )
+        ]
+    )
+    form_pattern = FormPattern(form_field_id=section.form_field_id)
+    db.add(form_pattern)
+    await db.flush()
+
+    form_pattern_id = form_pattern.form_pattern_id
+
+    # The only row relinked has no next field.
+    await service._link_form_fields(form_pattern_id, [section])
+    await db.commit()
+
+    fields_chain = await service._get_form_fields_chain(form_pattern_id)
+
+    assert [field.title for field in fields_chain._to_fields_read()] == ["Data"]
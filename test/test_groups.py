@@ -0,0 +1,244 @@
+import asyncio
+
+import pytest
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+
+from src.database.models.access_control.group import Group, GroupClosure, UserGroups
+from src.database.models.access_control.user import User
+from src.service_gateway.api.v1.functions.caches import invalidate_groups_tree
+from src.service_gateway.api.v1.schemas.access_control.group_schemas import (
+    GroupFilters,
+    GroupInput,
+    GroupUpdate,
+    GroupUsersFilters,
+)
+from src.service_gateway.api.v1.services.group_service import GroupService
+from src.utils.etags import cache_headers
+from src.utils.http_exceptions import BadRequestError
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+async def empty_groups_tree_cache():
+    # The cache outlives the database of each test.
+    await invalidate_groups_tree()
+    yield
+    await invalidate_groups_tree()
+
+
+def forbid_loading_groups(monkeypatch) -> None:
+    async def get_groups(self, filters):
+        pytest.fail("The groups were loaded")
+
+    monkeypatch.setattr(GroupService, "get_groups", get_groups)
+
+
+async def test_cached_tree_is_not_modified_without_reading_it(
+    api_client, group_id, statements, monkeypatch
+):
+    response = await api_client.get("/groups")
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+    assert [group["name"] for group in response.json()["data"]] == ["Reviewers"]
+
+    forbid_loading_groups(monkeypatch)
+
+    with statements:
+        response = await api_client.get("/groups", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    # Answered from the cached version alone.
+    assert len(statements) == 0
+
+
+async def test_searched_groups_are_not_modified_before_loading_them(
+    db, api_client, group_id, statements, monkeypatch
+):
+    filters = GroupFilters(name="Review")
+    headers = cache_headers(await GroupService(db).get_groups_version(filters), filters)
+
+    forbid_loading_groups(monkeypatch)
+
+    with statements:
+        response = await api_client.get(
+            "/groups",
+            params={"name": "Review"},
+            headers={"If-None-Match": headers["ETag"]},
+        )
+
+    assert response.status_code == 304
+    # The version statement only.
+    assert len(statements) == 1
+
+
+async def closure(session_factory) -> set:
+    """Rows of the closure table, as (ancestor, descendant, depth) names."""
+    ancestor = aliased(Group)
+    descendant = aliased(Group)
+
+    async with session_factory() as session:
+        result = await session.execute(
+            select(ancestor.name, descendant.name, GroupClosure.depth)
+            .join(ancestor, ancestor.group_id == GroupClosure.ancestor_id)
+            .join(descendant, descendant.group_id == GroupClosure.descendant_id)
+        )
+
+        return set(result.all())
+
+
+async def create_groups(session_factory, *names_and_parents) -> dict:
+    """Creates the (name, parent name) groups in order, returns their ids."""
+    group_ids = {}
+
+    for name, parent in names_and_parents:
+        async with session_factory() as session:
+            group = await GroupService(session).create_group(
+                GroupInput(name=name, parent_id=group_ids.get(parent))
+            )
+        group_ids[name] = group.group_id
+
+    return group_ids
+
+
+async def test_created_groups_are_linked_to_every_ancestor(session_factory):
+    await create_groups(
+        session_factory, ("Company", None), ("Sales", "Company"), ("Retail", "Sales")
+    )
+
+    assert await closure(session_factory) == {
+        ("Company", "Company", 0),
+        ("Sales", "Sales", 0),
+        ("Retail", "Retail", 0),
+        ("Company", "Sales", 1),
+        ("Sales", "Retail", 1),
+        ("Company", "Retail", 2),
+    }
+
+
+async def test_moved_subtree_is_relinked_to_its_new_ancestors(session_factory):
+    group_ids = await create_groups(
+        session_factory,
+        ("Company", None),
+        ("Sales", "Company"),
+        ("Retail", "Sales"),
+        ("Stores", "Retail"),
+        ("Partners", None),
+    )
+
+    async with session_factory() as session:
+        await GroupService(session).update_group(
+            group_ids["Retail"], GroupUpdate(parent_id=group_ids["Partners"])
+        )
+
+    assert await closure(session_factory) == {
+        ("Company", "Company", 0),
+        ("Sales", "Sales", 0),
+        ("Retail", "Retail", 0),
+        ("Stores", "Stores", 0),
+        ("Partners", "Partners", 0),
+        ("Company", "Sales", 1),
+        ("Retail", "Stores", 1),
+        ("Partners", "Retail", 1),
+        ("Partners", "Stores", 2),
+    }
+
+    # Back to the root, the subtree keeps its own links only.
+    async with session_factory() as session:
+        await GroupService(session).update_group(
+            group_ids["Retail"], GroupUpdate(parent_id=None)
+        )
+
+    assert {row for row in await closure(session_factory) if "Partners" in row[:2]} == {
+        ("Partners", "Partners", 0)
+    }
+
+
+async def test_group_is_not_moved_under_its_own_descendant(session_factory):
+    group_ids = await create_groups(
+        session_factory, ("Company", None), ("Sales", "Company"), ("Retail", "Sales")
+    )
+    rows = await closure(session_factory)
+
+    for name, parent in (("Company", "Company"), ("Sales", "Retail")):
+        async with session_factory() as session:
+            with pytest.raises(BadRequestError):
+                await GroupService(session).update_group(
+                    group_ids[name], GroupUpdate(parent_id=group_ids[parent])
+                )
+
+    assert await closure(session_factory) == rows
+
+
+async def test_hierarchy_changes_wait_for_the_lock(session_factory):
+    group_ids = await create_groups(session_factory, ("Company", None), ("Sales", None))
+
+    async with session_factory() as holder:
+        await GroupService(holder)._lock_group_hierarchy()
+
+        async def move() -> None:
+            async with session_factory() as session:
+                await GroupService(session).update_group(
+                    group_ids["Sales"], GroupUpdate(parent_id=group_ids["Company"])
+                )
+
+        moving = asyncio.create_task(move())
+        await asyncio.sleep(0.2)
+
+        assert not moving.done()
+
+        await holder.commit()
+
+    await asyncio.wait_for(moving, timeout=5)
+
+    assert ("Company", "Sales", 1) in await closure(session_factory)
+
+
+async def test_keyset_pages_cover_every_member_once(db, session_factory):
+    group_ids = await create_groups(
+        session_factory, ("Company", None), ("Sales", "Company")
+    )
+    # Outsiders belong to no group.
+    members = {"Company": 3, "Sales": 4, "Outsider": 1}
+
+    # Created in one transaction, they share `created_at`: only the id orders them.
+    for group, count in members.items():
+        for index in range(count):
+            user = User(email=f"{group}{index}@example.com", hashed_password="x")
+            db.add(user)
+            await db.flush()
+
+            if group in group_ids:
+                db.add(UserGroups(user_id=user.user_id, group_id=group_ids[group]))
+    await db.commit()
+
+    async def paginate(filters: GroupUsersFilters) -> list:
+        emails = []
+
+        while True:
+            page = await GroupService(db).get_group_users(group_ids["Company"], filters)
+            emails.extend(user.email for user in page.items)
+
+            if page.pagination.next_cursor is None:
+                return emails
+
+            filters = filters.model_copy(update={"cursor": page.pagination.next_cursor})
+
+    assert sorted(await paginate(GroupUsersFilters(page_size=2))) == [
+        f"Company{index}@example.com" for index in range(3)
+    ]
+    assert sorted(
+        await paginate(GroupUsersFilters(page_size=3, include_descendants=True))
+    ) == sorted(
+        f"{group}{index}@example.com"
+        for group in ("Company", "Sales")
+        for index in range(members[group])
+    )
+
+    with pytest.raises(BadRequestError):
+        await GroupService(db).get_group_users(
+            group_ids["Company"], GroupUsersFilters(cursor="not a cursor")
+        )
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+import pytest
+
+from src.utils.periodic_task import PeriodicTask
+
+pytestmark = pytest.mark.anyio
+
+
+class Runs(PeriodicTask):
+    """Records its runs, failing or asking to run again as told by `results`."""
+
+    failure_message = "Failed to run"
+
+    def __init__(self, interval: float, results: List[object]) -> None:
+        super().__init__(interval)
+
+        self.results = results
+        self.runs = 0
+
+    async def _run_once(self) -> Optional[bool]:
+        result = self.results[self.runs] if self.runs < len(self.results) else None
+        self.runs += 1
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+
+async def test_failed_run_is_logged_and_retried_after_the_interval(caplog):
+    task = Runs(interval=0.05, results=[ValueError("boom")])
+
+    with caplog.at_level(logging.ERROR):
+        task.start()
+        await asyncio.sleep(0.08)
+
+    assert task.is_running
+    assert task.runs == 2
+    assert "Failed to run" in caplog.text
+    # Logged under the module of the task.
+    assert caplog.records[0].name == __name__
+
+    await task.stop()
+
+    assert not task.is_running
+
+
+async def test_run_again_or_woken_up_skips_the_interval():
+    task = Runs(interval=60, results=[True, True])
+    task.start()
+    await asyncio.sleep(0.01)
+
+    assert task.runs == 3
+
+    task.wake_up()
+    await asyncio.sleep(0.01)
+
+    assert task.runs == 4
+
+    await task.stop()
+    # Stopping twice is harmless.
+    await task.stop()
@@ -0,0 +1,143 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, update
+
+from src.database.models.access_control.enums import (
+    OperationEnum,
+    ResourceEnum,
+    RoleEnum,
+)
+from src.database.models.access_control.role import Policy
+from src.service_gateway.security import policy_engine as policy_engine_module
+from src.service_gateway.security.policy_engine import (
+    PERMISSION_BITS,
+    PolicyEngine,
+    compile_policies,
+    require,
+)
+from src.service_gateway.security.principal import Principal
+from src.utils.http_exceptions import ForbiddenError
+
+pytestmark = pytest.mark.anyio
+
+POLICIES = [
+    (RoleEnum.REQUESTER, ResourceEnum.OWN_REQUESTS, OperationEnum.CREATE),
+    (RoleEnum.REQUESTER, ResourceEnum.OWN_REQUESTS, OperationEnum.READ),
+    (RoleEnum.MANAGER, ResourceEnum.ALL_PATTERNS, OperationEnum.UPDATE),
+]
+
+
+def compiled_engine(policies) -> PolicyEngine:
+    """Engine holding `policies` as if they were loaded from the table."""
+    engine = PolicyEngine(session_factory=None)
+    engine._permissions = compile_policies(policies)
+
+    return engine
+
+
+def test_every_permission_has_its_own_bit():
+    bits = list(PERMISSION_BITS.values())
+
+    assert len(bits) == len(ResourceEnum) * len(OperationEnum)
+    assert all(bit.bit_count() == 1 for bit in bits)
+    assert len(set(bits)) == len(bits)
+
+
+def test_policies_are_folded_into_one_bitset_per_role():
+    permissions = compile_policies(POLICIES)
+
+    assert permissions == {
+        RoleEnum.REQUESTER: (
+            PERMISSION_BITS[(ResourceEnum.OWN_REQUESTS, OperationEnum.CREATE)]
+            | PERMISSION_BITS[(ResourceEnum.OWN_REQUESTS, OperationEnum.READ)]
+        ),
+        RoleEnum.MANAGER: PERMISSION_BITS[
+            (ResourceEnum.ALL_PATTERNS, OperationEnum.UPDATE)
+        ],
+    }
+    # Duplicated rows set the same bit.
+    assert compile_policies(POLICIES + POLICIES[:1]) == permissions
+
+
+def test_any_role_of_the_caller_may_grant_the_permission():
+    engine = compiled_engine(POLICIES)
+    update_patterns = (ResourceEnum.ALL_PATTERNS, OperationEnum.UPDATE)
+
+    assert engine.is_allowed([RoleEnum.MANAGER], *update_patterns)
+    assert engine.is_allowed([RoleEnum.REQUESTER, RoleEnum.MANAGER], *update_patterns)
+    assert not engine.is_allowed([RoleEnum.REQUESTER], *update_patterns)
+    assert not engine.is_allowed([RoleEnum.REVIEWER], *update_patterns)
+    assert not engine.is_allowed([], *update_patterns)
+    assert not engine.is_allowed(
+        [RoleEnum.MANAGER], ResourceEnum.ALL_PATTERNS, OperationEnum.DELETE
+    )
+
+
+def test_every_check_is_denied_until_policies_are_loaded():
+    engine = PolicyEngine(session_factory=None)
+
+    assert not engine.is_loaded
+    assert not engine.is_allowed(
+        list(RoleEnum), ResourceEnum.OWN_REQUESTS, OperationEnum.READ
+    )
+
+
+async def test_require_raises_forbidden_without_a_granting_role(monkeypatch):
+    monkeypatch.setattr(
+        policy_engine_module, "policy_engine", compiled_engine(POLICIES)
+    )
+    dependency = require(ResourceEnum.ALL_PATTERNS, OperationEnum.UPDATE)
+
+    manager = Principal(user_id=uuid4(), roles=(RoleEnum.MANAGER,))
+    assert await dependency(principal=manager) == manager
+
+    with pytest.raises(ForbiddenError) as error:
+        await dependency(
+            principal=Principal(user_id=uuid4(), roles=(RoleEnum.REQUESTER,))
+        )
+
+    assert error.value.status_code == 403
+    assert error.value.detail == "Not allowed to update all patterns."
+
+
+async def test_policies_are_recompiled_only_when_the_table_changed(session_factory):
+    engine = PolicyEngine(session_factory)
+    read_requests = (ResourceEnum.OWN_REQUESTS, OperationEnum.READ)
+
+    # An empty table is loaded as well, denying every check.
+    assert await engine.reload()
+    assert engine.is_loaded
+    assert not await engine.reload()
+    assert not engine.is_allowed([RoleEnum.REQUESTER], *read_requests)
+
+    async with session_factory() as session:
+        session.add_all(
+            Policy(role=role, resource=resource, operation=operation)
+            for role, resource, operation in POLICIES
+        )
+        await session.commit()
+
+    assert await engine.reload()
+    assert engine.is_allowed([RoleEnum.REQUESTER], *read_requests)
+    assert not await engine.reload()
+    assert await engine.reload(force=True)
+
+    async with session_factory() as session:
+        await session.execute(
+            update(Policy)
+            .where(Policy.operation == OperationEnum.READ)
+            .values(role=RoleEnum.REVIEWER)
+        )
+        await session.commit()
+
+    assert await engine.reload()
+    assert not engine.is_allowed([RoleEnum.REQUESTER], *read_requests)
+    assert engine.is_allowed([RoleEnum.REVIEWER], *read_requests)
+
+    async with session_factory() as session:
+        await session.execute(delete(Policy))
+        await session.commit()
+
+    assert await engine.reload()
+    assert not engine.is_allowed([RoleEnum.REVIEWER], *read_requests)
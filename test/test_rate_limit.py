@@ -0,0 +1,114 @@
+import math
+from typing import List
+
+import pytest
+
+from src.service_gateway.api.v1.middlewares.rate_limit_middleware import (
+    API_ROOT,
+    RateLimitMiddleware,
+)
+from src.service_gateway.security.rate_limiter import (
+    SIGNIN_LIMIT,
+    RateLimiter,
+    email_key,
+)
+from src.utils.http_exceptions import TooManyRequestsError
+from src.utils.rate_limit import MemoryRateLimitBackend, RateLimit, take_token
+
+pytestmark = pytest.mark.anyio
+
+# 10 tokens a minute, one every 6 seconds.
+LIMIT = RateLimit(capacity=10, period=60)
+
+
+def scope(ip: str, path: str = f"{API_ROOT}/auth/signin") -> dict:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "headers": [],
+        "client": (ip, 50000),
+    }
+
+
+@pytest.mark.parametrize(
+    "tokens, elapsed, expected",
+    [
+        # A full bucket gives a token right away.
+        (10, 0, (9, 0)),
+        # Refilled up to the capacity, not beyond.
+        (9, 600, (9, 0)),
+        # 3 seconds refill half a token, the other half takes 3 more.
+        (0, 3, (0.5, 3)),
+        (0.5, 3, (0, 0)),
+        (0, 0, (0, 6)),
+    ],
+)
+def test_take_token_refills_at_the_limit_rate(tokens, elapsed, expected):
+    assert take_token(tokens, 100.0, 100.0 + elapsed, LIMIT) == pytest.approx(expected)
+
+
+async def test_memory_backend_limits_each_key():
+    backend = MemoryRateLimitBackend(shards=2)
+    limit = RateLimit(capacity=2, period=60)
+
+    assert [await backend.take("a", limit) for _ in range(3)] == pytest.approx(
+        [0, 0, 30]
+    )
+    assert await backend.take("b", limit) == 0
+
+
+async def test_email_limit_of_a_client_does_not_lock_out_others():
+    rate_limiter = RateLimiter(MemoryRateLimitBackend())
+    limit = RateLimit(capacity=2, period=60)
+    attacker = email_key(scope("203.0.113.1"), "Ada@example.com")
+
+    for _ in range(2):
+        await rate_limiter.enforce("signin:email", attacker, limit)
+
+    with pytest.raises(TooManyRequestsError) as error:
+        await rate_limiter.enforce(
+            "signin:email", email_key(scope("203.0.113.1"), "ada@example.com"), limit
+        )
+
+    assert error.value.status_code == 429
+    assert error.value.headers == {"Retry-After": "30"}
+
+    owner = email_key(scope("198.51.100.2"), "ada@example.com")
+    await rate_limiter.enforce("signin:email", owner, limit)
+
+
+async def test_limited_route_answers_429_with_retry_after():
+    async def app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = RateLimitMiddleware(app)
+
+    async def status(ip: str) -> List[dict]:
+        messages: List[dict] = []
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": b""}
+
+        async def send(message: dict) -> None:
+            messages.append(message)
+
+        await middleware(scope(ip), receive, send)
+
+        return messages
+
+    for _ in range(SIGNIN_LIMIT.capacity):
+        assert (await status("192.0.2.10"))[0]["status"] == 200
+
+    start = (await status("192.0.2.10"))[0]
+
+    assert start["status"] == 429
+    # The burst emptied the bucket, the next token is one refill away.
+    assert (
+        dict(start["headers"])[b"retry-after"]
+        == str(math.ceil(SIGNIN_LIMIT.period / SIGNIN_LIMIT.capacity)).encode()
+    )
+
+    # Another client is not affected.
+    assert (await status("192.0.2.11"))[0]["status"] == 200
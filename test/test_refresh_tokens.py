@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.future import select
+
+from src.database.models.access_control.refresh_token import RefreshToken
+from src.service_gateway.api.v1.functions.refresh_token_purge import RefreshTokenPurge
+from src.service_gateway.api.v1.middlewares.jwt_middleware import (
+    JWTMiddleware,
+    verified_token_cache,
+)
+from src.service_gateway.api.v1.services.refresh_token_service import (
+    RefreshTokenService,
+)
+from src.service_gateway.security.authentication import create_access_token
+from src.service_gateway.security.revocation import revoked_sessions
+from src.utils.http_exceptions import AuthenticationError
+
+pytestmark = pytest.mark.anyio
+
+
+async def call(app, token: str) -> List[dict]:
+    """Sends a GET with `token` through `app`, returns the messages sent back."""
+    scope = {
+        "type": "http",
+        "path": "/api/v1/auth/me",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    }
+    messages: List[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+
+    return messages
+
+
+async def test_reused_refresh_token_revokes_its_session(db, session_factory, user_id):
+    session_id, token = await RefreshTokenService(db).create_session(user_id)
+    rotated = await RefreshTokenService(db).rotate_refresh_token(token)
+
+    assert rotated.session_id == session_id
+
+    with pytest.raises(AuthenticationError) as error:
+        await RefreshTokenService(db).rotate_refresh_token(token)
+
+    assert "session revoked" in error.value.detail
+    assert session_id in revoked_sessions
+
+    # The token issued by the rotation goes with the session.
+    with pytest.raises(AuthenticationError):
+        await RefreshTokenService(db).rotate_refresh_token(rotated.refresh_token)
+
+    async with session_factory() as session:
+        result = await session.execute(
+            select(RefreshToken.revoked_at).where(RefreshToken.session_id == session_id)
+        )
+        revoked_at = result.scalars().all()
+
+    assert len(revoked_at) == 2
+    assert None not in revoked_at
+
+
+async def test_revoked_session_is_rejected_even_from_the_token_cache():
+    session_id = uuid4()
+    token = create_access_token(
+        data={"sub": str(uuid4()), "roles": [], "sid": str(session_id)}
+    )
+
+    async def app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = JWTMiddleware(app)
+
+    assert (await call(middleware, token))[0]["status"] == 200
+    assert verified_token_cache.get(token) is not None
+
+    revoked_sessions.add([session_id])
+
+    messages = await call(middleware, token)
+
+    assert messages[0]["status"] == 401
+    assert b"Token revoked." in messages[1]["body"]
+
+
+async def test_purge_keeps_the_tokens_still_of_use(db, session_factory, user_id):
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    old = now - timedelta(days=8)
+    service = RefreshTokenService(db)
+
+    sessions = {}
+    for name in ("live", "used", "expired", "revoked", "recently_revoked"):
+        sessions[name], _ = await service.create_session(user_id)
+
+    values = {
+        # Kept until it expires, a reuse must still revoke the session.
+        "used": {"used_at": old},
+        "expired": {"expires_at": old},
+        "revoked": {"revoked_at": old},
+        "recently_revoked": {"revoked_at": now},
+    }
+    async with session_factory() as session:
+        for name, value in values.items():
+            await session.execute(
+                update(RefreshToken)
+                .where(RefreshToken.session_id == sessions[name])
+                .values(**value)
+            )
+        await session.commit()
+
+    assert await RefreshTokenPurge(session_factory, retention_days=7).purge() == 2
+
+    async with session_factory() as session:
+        result = await session.execute(select(RefreshToken.session_id))
+        remaining = set(result.scalars().all())
+
+    assert remaining == {
+        sessions["live"],
+        sessions["used"],
+        sessions["recently_revoked"],
+    }
@@ -0,0 +1,243 @@
+import json
+from types import SimpleNamespace
+from typing import List
+from uuid import UUID
+
+import pytest
+from sqlalchemy import update
+
+from src.database.models.workflow.activity import Activity
+from src.database.models.workflow.enums import AssigneeEnum, InputTypeEnum
+from src.database.models.workflow.request_pattern import RequestPatternSnapshot
+from src.service_gateway.api.v1.schemas.workflow.activity_asignees_schemas import (
+    ActivityAsigneesInput,
+    ActivityAsigneesRead,
+)
+from src.service_gateway.api.v1.schemas.workflow.activity_schemas import (
+    ActivityInput,
+    ActivityRead,
+)
+from src.service_gateway.api.v1.schemas.workflow.form_field_schemas import (
+    FormFieldInput,
+    FormFieldRead,
+)
+from src.service_gateway.api.v1.schemas.workflow.form_pattern_schemas import (
+    FormPatternInput,
+)
+from src.service_gateway.api.v1.schemas.workflow.request_pattern_schemas import (
+    RequestPatternInput,
+    RequestPatternQuery,
+)
+from src.service_gateway.api.v1.services.request_pattern_service import (
+    RequestPatternService,
+)
+from src.utils.http_exceptions import BadRequestError
+
+pytestmark = pytest.mark.anyio
+
+
+def activities_input(user_id: UUID) -> List[ActivityInput]:
+    """A requester step and a review step."""
+    return [
+        ActivityInput(
+            activity_order=0,
+            label="Request",
+            assignee=ActivityAsigneesInput(assignee_type=AssigneeEnum.REQUESTER),
+        ),
+        ActivityInput(
+            activity_order=1,
+            label="Review",
+            assignee=ActivityAsigneesInput(
+                assignee_type=AssigneeEnum.USER, user_id=user_id
+            ),
+        ),
+    ]
+
+
+async def create_request_pattern(db, user_id: UUID) -> UUID:
+    """The steps of `activities_input`, each with a form."""
+    service = RequestPatternService(db)
+    request_pattern = await service.create_request_pattern(
+        RequestPatternInput(
+            label="Leave",
+            description="",
+            groups=[],
+            activities=activities_input(user_id),
+        )
+    )
+
+    for activity in request_pattern.activities:
+        await service.create_form_pattern_for_activity(
+            request_pattern.request_pattern_id,
+            activity.activity_id,
+            FormPatternInput(
+                fields=[
+                    FormFieldInput(
+                        form_field_order=0,
+                        input_type=InputTypeEnum.SECTION,
+                        title=activity.label,
+                    ),
+                    FormFieldInput(
+                        form_field_order=1,
+                        input_type=InputTypeEnum.SHORT_TEXT,
+                        title="Comment",
+                    ),
+                ]
+            ),
+        )
+
+    return request_pattern.request_pattern_id
+
+
+async def test_published_request_pattern_is_served_from_its_snapshot(
+    db, session_factory, statements, user_id
+):
+    request_pattern_id = await create_request_pattern(db, user_id)
+    await RequestPatternService(db).publish_request_pattern(request_pattern_id)
+
+    # Only a snapshot read can still return the labels as published.
+    async with session_factory() as session:
+        await session.execute(update(Activity).values(label="Edited"))
+        await session.commit()
+
+    async with session_factory() as session:
+        with statements:
+            data = await RequestPatternService(
+                session
+            ).get_published_request_pattern_json(
+                request_pattern_id, RequestPatternQuery(include_activities=True)
+            )
+
+    assert len(statements) == 1
+
+    request_pattern = json.loads(data)
+    assert request_pattern["request_pattern_id"] == str(request_pattern_id)
+    assert [activity["label"] for activity in request_pattern["activities"]] == [
+        "Request",
+        "Review",
+    ]
+
+    async with session_factory() as session:
+        activity_id = request_pattern["activities"][1]["activity_id"]
+        activities_fields = await RequestPatternService(
+            session
+        ).get_request_pattern_activity_fields(request_pattern_id, activity_id)
+
+    # The fields of the activities before the review one.
+    assert [activity.label for activity in activities_fields] == ["Request"]
+    assert [field.title for field in activities_fields[0].fields] == [
+        "Request",
+        "Comment",
+    ]
+
+
+async def test_snapshot_of_another_version_is_ignored(db, session_factory, user_id):
+    request_pattern_id = await create_request_pattern(db, user_id)
+    await RequestPatternService(db).publish_request_pattern(request_pattern_id)
+
+    async with session_factory() as session:
+        await session.execute(
+            update(RequestPatternSnapshot).values(
+                version=RequestPatternSnapshot.version - 1
+            )
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        data = await RequestPatternService(session).get_published_request_pattern_json(
+            request_pattern_id, RequestPatternQuery()
+        )
+
+    assert data is None
+
+
+def test_every_publish_violation_is_reported():
+    def activity(activity_id, assignee_type, form_pattern_id=None, **assignee):
+        return ActivityRead(
+            activity_order=activity_id - 1,
+            activity_id=activity_id,
+            label=f"Step {activity_id}",
+            description="",
+            assignee=ActivityAsigneesRead(assignee_type=assignee_type, **assignee),
+            form_pattern_id=form_pattern_id,
+        )
+
+    def field(form_field_id, order, input_type):
+        return FormFieldRead(
+            form_field_id=form_field_id,
+            form_field_order=order,
+            input_type=input_type,
+            title="Field",
+            description=None,
+        )
+
+    activities = [
+        activity(1, AssigneeEnum.USER, form_pattern_id=10),
+        activity(2, AssigneeEnum.USER),
+        activity(3, AssigneeEnum.GROUP, form_pattern_id=10),
+        activity(4, AssigneeEnum.REQUESTER, form_pattern_id=20),
+    ]
+    form_patterns = {
+        10: SimpleNamespace(is_published=False),
+        20: SimpleNamespace(is_published=True),
+    }
+    fields_reads = {
+        10: [
+            field(100, 0, InputTypeEnum.SHORT_TEXT),
+            field(101, 1, InputTypeEnum.SINGLE_CHOICE),
+        ],
+        20: [
+            field(200, 0, InputTypeEnum.SECTION),
+            field(201, 1, InputTypeEnum.SECTION),
+        ],
+    }
+
+    violations = RequestPatternService(db=None)._get_publish_violations(
+        activities, form_patterns, fields_reads
+    )
+
+    assert [
+        (violation.activity_id, violation.form_field_id, violation.msg)
+        for violation in violations
+    ] == [
+        (1, None, "First activity must have a 'requester' assignee"),
+        (1, None, "Assignee type is 'user' and must have user_id"),
+        (1, 100, "Field in order 0 must be a section"),
+        (1, 101, "Single choice field must have at least 2 options"),
+        (2, None, "Assignee type is 'user' and must have user_id"),
+        (2, None, "Activity does not have a form pattern"),
+        (3, None, "Assignee type is 'group' and must have group_id"),
+        (3, None, "Form pattern is already used by activity with id 1"),
+        (4, None, "Form pattern is already published"),
+        (4, 201, "Field in order 1 must not be a section"),
+    ]
+
+
+async def test_publish_reports_the_violations_of_every_activity(
+    db, session_factory, user_id
+):
+    service = RequestPatternService(db)
+    request_pattern = await service.create_request_pattern(
+        RequestPatternInput(
+            label="Leave",
+            description="",
+            groups=[],
+            activities=activities_input(user_id),
+        )
+    )
+    request_pattern_id = request_pattern.request_pattern_id
+
+    with pytest.raises(BadRequestError) as error:
+        await service.publish_request_pattern(request_pattern_id)
+
+    assert error.value.status_code == 400
+    assert [violation["activity_id"] for violation in error.value.detail] == [
+        activity.activity_id for activity in request_pattern.activities
+    ]
+
+    async with session_factory() as session:
+        request_pattern = await RequestPatternService(session).get_request_pattern(
+            request_pattern_id, RequestPatternQuery()
+        )
+
+    assert request_pattern.published_at is None
@@ -0,0 +1,44 @@
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from src.database.search import SEARCH_MIN_TERM_LENGTH
+from src.service_gateway.api.v1.schemas.access_control.group_schemas import (
+    GroupFilters,
+)
+from src.service_gateway.api.v1.schemas.access_control.user_schemas import UserFilters
+from src.service_gateway.api.v1.schemas.workflow.request_pattern_schemas import (
+    RequestPatternFilters,
+)
+
+SEARCH_FILTERS = [
+    (UserFilters, "name"),
+    (GroupFilters, "name"),
+    (RequestPatternFilters, "label"),
+]
+
+
+@pytest.mark.parametrize("filters, field", SEARCH_FILTERS)
+def test_search_term_shorter_than_a_trigram_is_rejected(filters, field):
+    with pytest.raises(ValidationError):
+        filters(**{field: "a" * (SEARCH_MIN_TERM_LENGTH - 1)})
+
+    term = "a" * SEARCH_MIN_TERM_LENGTH
+
+    assert getattr(filters(**{field: term}), field) == term
+    assert getattr(filters(), field) is None
+
+
+def test_short_search_term_is_a_422():
+    app = FastAPI()
+
+    # Same dependency as GET /users.
+    @app.get("/users")
+    async def get_users(filters: UserFilters = Depends()):
+        return {"name": filters.name}
+
+    client = TestClient(app)
+
+    assert client.get("/users", params={"name": "ab"}).status_code == 422
+    assert client.get("/users", params={"name": "abc"}).json() == {"name": "abc"}
@@ -0,0 +1,92 @@
+import logging
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from src.service_gateway.api.v1.functions.secure_code_partitions import (
+    MAINTENANCE_LOCK,
+    SCHEMA,
+    SecureCodePartitions,
+    partition_name,
+)
+
+pytestmark = pytest.mark.anyio
+
+# Far from the partitions `db_engine` created for the current date.
+TODAY = date(2030, 1, 10)
+
+
+def days(*offsets: int) -> dict:
+    """Attached partitions of `TODAY` plus each offset."""
+    return {partition_name(TODAY + timedelta(days=offset)): False for offset in offsets}
+
+
+@pytest.fixture
+def partitions(session_factory) -> SecureCodePartitions:
+    return SecureCodePartitions(
+        session_factory, days_ahead=3, retention_days=1, min_days_ahead=2
+    )
+
+
+async def get_partitions(partitions: SecureCodePartitions) -> dict:
+    async with partitions.session_factory() as db:
+        return await partitions._get_partitions(db)
+
+
+async def test_maintain_creates_the_days_ahead_and_drops_the_expired(partitions):
+    assert await partitions.maintain(today=TODAY)
+
+    # The partitions of the current date expired long before `TODAY`.
+    assert await get_partitions(partitions) == days(0, 1, 2, 3)
+
+    assert await partitions.maintain(today=TODAY + timedelta(days=2))
+
+    assert await get_partitions(partitions) == days(1, 2, 3, 4, 5)
+
+    async with partitions.session_factory() as db:
+        result = await db.execute(
+            text("SELECT to_regclass(:name)"),
+            {"name": f"{SCHEMA}.{partition_name(TODAY)}"},
+        )
+
+    # Detached and dropped, not left behind.
+    assert result.scalar_one() is None
+
+
+async def test_maintain_is_skipped_while_another_worker_holds_the_lock(partitions):
+    async with partitions.session_factory() as db:
+        await db.execute(
+            text("SELECT pg_advisory_lock(hashtext(:lock))"),
+            {"lock": MAINTENANCE_LOCK},
+        )
+
+        assert not await partitions.maintain(today=TODAY)
+
+        await db.execute(
+            text("SELECT pg_advisory_unlock(hashtext(:lock))"),
+            {"lock": MAINTENANCE_LOCK},
+        )
+
+    assert await partitions.maintain(today=TODAY)
+
+
+async def test_missing_partitions_are_reported(partitions, caplog):
+    await partitions.maintain(today=TODAY)
+
+    assert await partitions.covered_until(TODAY) == TODAY + timedelta(days=3)
+    assert await partitions.covered_until(TODAY - timedelta(days=1)) is None
+
+    async with partitions.session_factory() as db:
+        await db.execute(
+            text(f"DROP TABLE {SCHEMA}.{partition_name(TODAY + timedelta(days=2))}")
+        )
+        await db.commit()
+
+    assert await partitions.covered_until(TODAY) == TODAY + timedelta(days=1)
+
+    # `_check_coverage` looks from the current date, which has no partition.
+    with caplog.at_level(logging.ERROR):
+        await partitions._check_coverage()
+
+    assert "No secure code partition" in caplog.text
@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from main import app
+from src.service_gateway.security.signing_keys import SigningKeys
+
+KIDS = ("2026-09", "2026-10")
+
+
+def write_key(keys_dir: Path, kid: str, public: bool = False) -> None:
+    key = ec.generate_private_key(ec.SECP256R1())
+
+    if public:
+        pem = key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    else:
+        pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+
+    (keys_dir / f"{kid}.pem").write_bytes(pem)
+
+
+def sign(signing_keys: SigningKeys, claims: dict) -> str:
+    key, headers = signing_keys.signing_key()
+
+    return jwt.encode(claims, key, algorithm="ES256", headers=headers)
+
+
+def verify(signing_keys: SigningKeys, token: str) -> dict:
+    key = signing_keys.verification_key(jwt.get_unverified_header(token).get("kid"))
+    assert key is not None
+
+    return jwt.decode(token, key, algorithms=["ES256"])
+
+
+@pytest.fixture
+def keys_dir(tmp_path: Path) -> Path:
+    for kid in KIDS:
+        write_key(tmp_path, kid)
+
+    return tmp_path
+
+
+def test_tokens_are_verified_with_the_key_of_their_kid(keys_dir):
+    previous = SigningKeys("ES256", keys_dir=str(keys_dir), active_kid=KIDS[0])
+    current = SigningKeys("ES256", keys_dir=str(keys_dir), active_kid=KIDS[1])
+
+    old_token = sign(previous, {"sub": "ada"})
+    new_token = sign(current, {"sub": "ada"})
+
+    assert jwt.get_unverified_header(old_token)["kid"] == KIDS[0]
+    assert jwt.get_unverified_header(new_token)["kid"] == KIDS[1]
+
+    # Tokens of the previous key stay valid after the rotation.
+    assert verify(current, old_token) == {"sub": "ada"}
+    assert verify(current, new_token) == {"sub": "ada"}
+
+    assert current.verification_key("unknown") is None
+    assert current.verification_key(None) is None
+
+    # A token claiming the other kid fails the signature check.
+    forged = jwt.encode(
+        {"sub": "ada"},
+        current.signing_key()[0],
+        algorithm="ES256",
+        headers={"kid": KIDS[0]},
+    )
+    with pytest.raises(jwt.JWTError):
+        verify(current, forged)
+
+
+def test_jwks_publishes_only_public_keys(keys_dir):
+    write_key(keys_dir, "2026-08", public=True)
+
+    signing_keys = SigningKeys("ES256", keys_dir=str(keys_dir), active_kid=KIDS[1])
+
+    assert [key["kid"] for key in signing_keys.jwks["keys"]] == ["2026-08", *KIDS]
+    assert all("d" not in key for key in signing_keys.jwks["keys"])
+    assert all(key["use"] == "sig" for key in signing_keys.jwks["keys"])
+
+    # Adding a key changes the JWKS, and so its ETag.
+    write_key(keys_dir, "2026-11")
+    updated = SigningKeys("ES256", keys_dir=str(keys_dir), active_kid=KIDS[1])
+
+    assert updated.jwks_etag != signing_keys.jwks_etag
+
+
+def test_active_key_must_be_private(keys_dir):
+    write_key(keys_dir, "2026-11", public=True)
+
+    with pytest.raises(ValueError):
+        SigningKeys("ES256", keys_dir=str(keys_dir), active_kid="2026-11")
+
+    with pytest.raises(ValueError):
+        SigningKeys("ES256", keys_dir=str(keys_dir), active_kid="missing")
+
+
+def test_jwks_is_not_modified_while_the_etag_matches():
+    client = TestClient(app)
+
+    response = client.get("/.well-known/jwks.json")
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+    assert "max-age" in response.headers["Cache-Control"]
+
+    response = client.get("/.well-known/jwks.json", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    response = client.get(
+        "/.well-known/jwks.json", headers={"If-None-Match": '"outdated"'}
+    )
+
+    assert response.status_code == 200
@@ -0,0 +1,63 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.database.models.access_control.user import User
+from src.service_gateway.api.v1.schemas.access_control.user_schemas import UserFilters
+from src.service_gateway.api.v1.services.user_service import UserService
+from src.utils.cursors import decode_datetime_uuid_cursor, encode_cursor
+from src.utils.http_exceptions import BadRequestError
+
+pytestmark = pytest.mark.anyio
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 10, 17, 9, 30, 15, 123456)
+    user_id = uuid4()
+
+    cursor = encode_cursor((created_at, user_id))
+
+    assert "=" not in cursor
+    assert decode_datetime_uuid_cursor(cursor) == (created_at, user_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        encode_cursor(["2026-10-17T09:30:15"]),
+        encode_cursor(["yesterday", str(uuid4())]),
+        encode_cursor(["2026-10-17T09:30:15", "not-a-uuid"]),
+    ],
+)
+async def test_invalid_cursor_is_a_bad_request(cursor):
+    assert decode_datetime_uuid_cursor(cursor) is None
+
+    # Rejected before the database is queried.
+    with pytest.raises(BadRequestError) as error:
+        await UserService(db=None).get_users(UserFilters(cursor=cursor))
+
+    assert error.value.status_code == 400
+
+
+async def test_keyset_pages_cover_every_user_once(db):
+    # Created in one transaction, they share `created_at`: only the id orders them.
+    for index in range(7):
+        db.add(User(email=f"user{index}@example.com", hashed_password="x"))
+    await db.commit()
+
+    service = UserService(db)
+    filters = UserFilters(pagination="keyset", page_size=3, count="none")
+    emails = []
+
+    while True:
+        page = await service.get_users(filters)
+        emails.extend(user.email for user in page.items)
+
+        if page.pagination.next_cursor is None:
+            break
+
+        filters = filters.model_copy(update={"cursor": page.pagination.next_cursor})
+
+    assert sorted(emails) == [f"user{index}@example.com" for index in range(7)]